@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+CCPES v2.0 Benchmark History
+Columnar store of benchmark results with statistical regression detection
+
+Every benchmark_results_<session>.json is flattened into numeric metrics and
+appended to benchmarks/results/history.json. The store is columnar: run
+metadata and samples are parallel arrays, with metric names and run ids
+interned as integer indexes, so thousands of runs stay small and fast to
+load.
+
+Regression detection compares the samples of two runs with a two-sided
+Mann-Whitney U test (no distributional assumptions, no SciPy) and only
+flags a metric when the difference is significant AND the median moved by
+more than a minimum relative threshold.
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+HISTORY_FILE = "history.json"
+SCHEMA_VERSION = 1
+
+# Metrics under this prefix are timings: lower is better
+TIMING_PREFIX = "timing."
+
+
+def median(values: List[float]) -> float:
+    """Median of a non-empty list"""
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[mid]
+    return (ordered[mid - 1] + ordered[mid]) / 2
+
+
+def median_confidence_interval(values: List[float], confidence: float = 0.95) -> Tuple[float, float]:
+    """Distribution-free confidence interval for the median from order statistics"""
+    ordered = sorted(values)
+    n = len(ordered)
+    if n < 6:
+        # Too few samples for a 95% interval narrower than the full range
+        return ordered[0], ordered[-1]
+
+    # Largest k such that P(Binomial(n, 0.5) < k) <= alpha / 2
+    alpha = 1 - confidence
+    cumulative = 0.0
+    k = 0
+    for i in range(n + 1):
+        p = math.comb(n, i) / 2 ** n
+        if cumulative + p > alpha / 2:
+            break
+        cumulative += p
+        k = i + 1
+    k = max(k, 1)
+    return ordered[k - 1], ordered[n - k]
+
+
+def summarize(values: List[float]) -> Dict[str, Any]:
+    """Median, 95% CI and spread of a sample"""
+    low, high = median_confidence_interval(values)
+    return {
+        "samples": len(values),
+        "median": median(values),
+        "ci95": [low, high],
+        "min": min(values),
+        "max": max(values),
+    }
+
+
+def mann_whitney_u(a: List[float], b: List[float]) -> float:
+    """Two-sided p-value of the Mann-Whitney U test (normal approximation, tie corrected)"""
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    combined = sorted([(value, 0) for value in a] + [(value, 1) for value in b])
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j) / 2 + 1
+        for position in range(i, j + 1):
+            ranks[position] = average_rank
+        tied = j - i + 1
+        tie_term += tied ** 3 - tied
+        i = j + 1
+
+    rank_sum_a = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum_a - n1 * (n1 + 1) / 2
+    mean_u = n1 * n2 / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+
+    # Continuity correction
+    z = (abs(u - mean_u) - 0.5) / math.sqrt(variance)
+    return math.erfc(max(z, 0.0) / math.sqrt(2))
+
+
+def flatten_metrics(data: Any, prefix: str = "") -> Iterator[Tuple[str, float]]:
+    """Yield (dotted.path, value) for every numeric leaf in a results document"""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from flatten_metrics(value, f"{prefix}{key}.")
+    elif isinstance(data, bool):
+        return
+    elif isinstance(data, (int, float)) and math.isfinite(data):
+        yield prefix[:-1], float(data)
+
+
+class BenchmarkHistory:
+    """Columnar history of benchmark runs"""
+
+    def __init__(self, results_dir: Path):
+        self.results_dir = Path(results_dir)
+        self.path = self.results_dir / HISTORY_FILE
+        self.data = self._load()
+        self._metric_ids = {name: i for i, name in enumerate(self.data["metrics"])}
+        self._run_ids = {run_id: i for i, run_id in enumerate(self.data["runs"]["id"])}
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            if data.get("schema") == SCHEMA_VERSION:
+                return data
+        except (OSError, ValueError):
+            pass
+        return {
+            "schema": SCHEMA_VERSION,
+            "metrics": [],
+            "runs": {"id": [], "timestamp": [], "source": []},
+            "samples": {"run": [], "metric": [], "value": []},
+        }
+
+    def save(self):
+        """Write the store atomically"""
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.data, f, separators=(",", ":"))
+        tmp_path.replace(self.path)
+
+    @property
+    def run_ids(self) -> List[str]:
+        return list(self.data["runs"]["id"])
+
+    def _metric_id(self, name: str) -> int:
+        if name not in self._metric_ids:
+            self._metric_ids[name] = len(self.data["metrics"])
+            self.data["metrics"].append(name)
+        return self._metric_ids[name]
+
+    def add_run(self, run_id: str, timestamp: str, source: str, samples: List[Tuple[str, float]]) -> bool:
+        """Append one run; returns False if it was already ingested"""
+        if run_id in self._run_ids:
+            return False
+        run_index = len(self.data["runs"]["id"])
+        self._run_ids[run_id] = run_index
+        runs = self.data["runs"]
+        runs["id"].append(run_id)
+        runs["timestamp"].append(timestamp)
+        runs["source"].append(source)
+
+        columns = self.data["samples"]
+        for name, value in samples:
+            columns["run"].append(run_index)
+            columns["metric"].append(self._metric_id(name))
+            columns["value"].append(value)
+        return True
+
+    def ingest_file(self, results_file: Path) -> bool:
+        """Ingest one benchmark_results_<session>.json"""
+        with open(results_file, "r") as f:
+            results = json.load(f)
+
+        samples = []
+        # Repeated timings carry every sample, not just the summary
+        for category, summary in (results.get("timings") or {}).items():
+            for value in summary.get("values", []):
+                samples.append((f"{TIMING_PREFIX}{category}_seconds", float(value)))
+        for name, value in flatten_metrics(results.get("results", {}), "results."):
+            samples.append((name, value))
+        if "duration_seconds" in results:
+            samples.append((f"{TIMING_PREFIX}suite_seconds", float(results["duration_seconds"])))
+
+        run_id = results.get("test_session_id") or results_file.stem
+        return self.add_run(run_id, results.get("timestamp", ""), results_file.name, samples)
+
+    def ingest_directory(self) -> int:
+        """Ingest every results file not yet in the store"""
+        added = 0
+        for results_file in sorted(self.results_dir.glob("benchmark_results_*.json")):
+            try:
+                if self.ingest_file(results_file):
+                    added += 1
+            except (OSError, ValueError) as e:
+                print(f"  ⚠️ Skipping {results_file.name}: {e}")
+        if added:
+            self.save()
+        return added
+
+    def samples(self, run_id: str) -> Dict[str, List[float]]:
+        """All samples of a run, grouped by metric name"""
+        run_index = self._run_ids.get(run_id)
+        grouped = {}  # type: Dict[str, List[float]]
+        if run_index is None:
+            return grouped
+        columns = self.data["samples"]
+        metrics = self.data["metrics"]
+        for run, metric, value in zip(columns["run"], columns["metric"], columns["value"]):
+            if run == run_index:
+                grouped.setdefault(metrics[metric], []).append(value)
+        return grouped
+
+    def compare(self, baseline: str, candidate: str, alpha: float = 0.05,
+                min_change_percent: float = 5.0, prefix: str = TIMING_PREFIX) -> List[Dict[str, Any]]:
+        """Compare two runs metric by metric; lower is better for timing metrics"""
+        base_samples = self.samples(baseline)
+        cand_samples = self.samples(candidate)
+        rows = []
+        for metric in sorted(set(base_samples) & set(cand_samples)):
+            if not metric.startswith(prefix):
+                continue
+            base, cand = base_samples[metric], cand_samples[metric]
+            base_median, cand_median = median(base), median(cand)
+            change = ((cand_median - base_median) / base_median * 100) if base_median else 0.0
+            p_value = mann_whitney_u(base, cand)
+
+            if len(base) < 3 or len(cand) < 3:
+                verdict = "insufficient samples"
+            elif p_value < alpha and abs(change) >= min_change_percent:
+                verdict = "regression" if change > 0 else "improvement"
+            else:
+                verdict = "no significant change"
+
+            rows.append({
+                "metric": metric,
+                "baseline": summarize(base),
+                "candidate": summarize(cand),
+                "change_percent": change,
+                "p_value": p_value,
+                "verdict": verdict,
+            })
+        return rows
@@ -9,9 +9,11 @@ This system runs standardized tests to measure:
 - Task completion accuracy (vs >95% claim)
 - Context usage efficiency (vs <70% claim)
 - Session continuity success (vs >80% claim)
+- Hook throughput and index freshness on recorded edit streams (replay)
 """
 
 import json
+import sys
 import time
 import subprocess
 import os
@@ -20,6 +22,15 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Tuple
 import tempfile
+import io
+from contextlib import redirect_stdout
+
+from benchmark_history import BenchmarkHistory, summarize
+from session_faults import HOOK_NAME, SessionFaultHarness, find_hook
+from hook_replay import DEFAULT_RECORDING, ReplayHarness, load_recording, print_results
+
+# Fault injection iterations per continuity scenario in the suite
+SESSION_ITERATIONS = 100
 
 
 class PerformanceBenchmark:
@@ -234,34 +245,44 @@ class AdminService:
         """Test context usage patterns and 70% threshold adherence"""
         print("🧠 Running Context Usage Benchmark...")
         
-        # Simulate context usage patterns
-        usage_scenarios = [
-            {"task": "Initial project analysis", "context_usage": 15},
-            {"task": "Feature implementation", "context_usage": 45},
-            {"task": "Code review and refinement", "context_usage": 62},
-            {"task": "Testing and validation", "context_usage": 68},
-            {"task": "Documentation update", "context_usage": 71},  # Over threshold
-            {"task": "Cleanup and optimization", "context_usage": 25}  # After cleanup
-        ]
-        
+        # Measure what CLAUDE.md, its @imports and each agent/command actually cost
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "claude-boost"))
+        from claude_boost.context import measure
+        report = measure(self.project_root)
+        window = report["context_window_tokens"]
+        baseline = report["always_loaded_tokens"]
+
+        usage_scenarios = []
+        if report["sources"]:
+            usage_scenarios.append({"task": "Session start (CLAUDE.md + imports)", "tokens": baseline})
+            for item in report["on_demand"]:
+                usage_scenarios.append({
+                    "task": f"Invoke {item['kind']} {Path(item['path']).stem}",
+                    "tokens": baseline + item["tokens"],
+                })
+        else:
+            print("  ⚠️ No CLAUDE.md found; nothing to measure")
+
         measurements = []
         quality_degradations = 0
-        
+
         for scenario in usage_scenarios:
+            usage = scenario["tokens"] / window * 100
             measurement = {
                 "task": scenario["task"],
-                "context_usage_percent": scenario["context_usage"],
+                "tokens": scenario["tokens"],
+                "context_usage_percent": usage,
                 "timestamp": datetime.now().isoformat(),
-                "quality_maintained": scenario["context_usage"] <= 70
+                "quality_maintained": usage <= 70
             }
-            
-            if scenario["context_usage"] > 70:
+
+            if usage > 70:
                 quality_degradations += 1
-            
+
             measurements.append(measurement)
         
-        average_usage = sum(m["context_usage_percent"] for m in measurements) / len(measurements)
-        peak_usage = max(m["context_usage_percent"] for m in measurements)
+        average_usage = sum(m["context_usage_percent"] for m in measurements) / len(measurements) if measurements else 0.0
+        peak_usage = max((m["context_usage_percent"] for m in measurements), default=0.0)
         
         results = {
             "test_session": self.test_session_id,
@@ -270,72 +291,111 @@ class AdminService:
             "peak_context_usage": peak_usage,
             "quality_degradation_events": quality_degradations,
             "measurements": measurements,
+            "always_loaded_tokens": baseline,
+            "always_loaded_sources": [{"path": src["path"], "tokens": src["tokens"]} for src in report["sources"]],
+            "missing_imports": report["missing_imports"],
+            "top_index_sections": report["index_sections"][:5],
             "claim_validation": {
                 "claimed_average": 70.0,
                 "measured_average": average_usage,
-                "validated": average_usage < 70.0
+                # Nothing measured proves nothing
+                "validated": bool(measurements) and average_usage < 70.0
             },
             "timestamp": datetime.now().isoformat()
         }
+        if not report["sources"]:
+            results["error"] = "No CLAUDE.md found; nothing was measured"
         
         self.benchmark_results["context_usage"] = results
+        print(f"  ✅ Always-loaded context: {baseline:,} tokens ({report['always_loaded_percent']:.1f}%)")
         print(f"  ✅ Average context usage: {average_usage:.1f}%")
         return results
 
-    def run_session_continuity_benchmark(self) -> Dict[str, Any]:
-        """Test session state preservation and restoration"""
+    def run_session_continuity_benchmark(self, iterations: int = SESSION_ITERATIONS) -> Dict[str, Any]:
+        """Test session state preservation and restoration under injected faults"""
         print("🔄 Running Session Continuity Benchmark...")
         
-        # Simulate session transitions
-        continuity_tests = [
-            {"scenario": "Normal session end/start", "state_preserved": True, "context_restored": True},
-            {"scenario": "Interrupted session", "state_preserved": True, "context_restored": False},
-            {"scenario": "Clean session transition", "state_preserved": True, "context_restored": True},
-            {"scenario": "System crash recovery", "state_preserved": False, "context_restored": False},
-            {"scenario": "Planned maintenance", "state_preserved": True, "context_restored": True},
-        ]
-        
-        successful_continuations = 0
-        total_tests = len(continuity_tests)
-        
         results = {
             "test_session": self.test_session_id,
-            "total_tests": total_tests,
+            "total_tests": 0,
             "continuity_tests": []
         }
         
-        for test in continuity_tests:
-            # Determine success based on both state preservation and context restoration
-            success = test["state_preserved"] and test["context_restored"]
-            if success:
-                successful_continuations += 1
-            
-            test_result = {
-                "scenario": test["scenario"],
-                "state_preserved": test["state_preserved"],
-                "context_restored": test["context_restored"],
-                "continuation_successful": success,
+        hook = find_hook(self.project_root)
+        if hook is None:
+            print(f"  ⚠️ {HOOK_NAME} not found; nothing to measure")
+            harness_results = {"success_rate_percent": 0.0, "scenarios": [], "error": f"{HOOK_NAME} not found"}
+        else:
+            harness = SessionFaultHarness(hook, iterations)
+            try:
+                harness_results = harness.run()
+            finally:
+                harness.close()
+        
+        for scenario in harness_results["scenarios"]:
+            results["continuity_tests"].append({
+                "scenario": scenario["scenario"],
+                "iterations": scenario["iterations"],
+                "state_preserved_percent": scenario["state_preserved_percent"],
+                "context_restored_percent": scenario["context_restored_percent"],
+                "continuation_success_percent": scenario["success_rate_percent"],
+                "save_latency": scenario["save_latency"],
+                "restore_latency": scenario["restore_latency"],
+                "failures": scenario["failures"],
                 "timestamp": datetime.now().isoformat()
-            }
-            
-            results["continuity_tests"].append(test_result)
-        
-        success_rate = (successful_continuations / total_tests) * 100
+            })
         
+        success_rate = harness_results["success_rate_percent"]
         results.update({
-            "successful_continuations": successful_continuations,
+            "total_tests": harness_results.get("total_iterations", 0),
+            "successful_continuations": harness_results.get("successful_iterations", 0),
             "success_rate_percent": success_rate,
+            "atomic_writes": harness_results.get("atomic_writes", False),
             "claim_validation": {
                 "claimed_success_rate": 80.0,
                 "measured_success_rate": success_rate,
                 "validated": success_rate >= 80.0
             }
         })
+        if "error" in harness_results:
+            results["error"] = harness_results["error"]
         
         self.benchmark_results["session_continuity"] = results
         print(f"  ✅ Session continuity success: {success_rate:.1f}%")
         return results
 
+    def run_replay_benchmark(self, recording: str = None, speed: float = 1.0, repo: str = None,
+                             settle: bool = True) -> Dict[str, Any]:
+        """Replay recorded hook events against the installed hooks on a scratch repo"""
+        print("▶️ Running Hook Replay Benchmark...")
+        
+        recording_path = Path(recording) if recording else self.project_root / DEFAULT_RECORDING
+        repo_path = Path(repo) if repo else self.test_data_dir
+        events = load_recording(recording_path) if recording_path.exists() else []
+        if not events:
+            print(f"  ⚠️ No recorded tool events in {recording_path}; nothing to replay")
+            results = {"recording": str(recording_path), "events": 0,
+                       "error": f"no recorded tool events in {recording_path}"}
+            self.benchmark_results["hook_replay"] = results
+            return results
+        
+        harness = ReplayHarness(events, repo_path, speed, settle=settle)
+        try:
+            replay = harness.run()
+        finally:
+            harness.close()
+        print_results(replay)
+        
+        results = {
+            "test_session": self.test_session_id,
+            "recording": str(recording_path),
+            "target_repo": str(repo_path),
+            "timestamp": datetime.now().isoformat(),
+            **{key: value for key, value in replay.items() if key != "repo"}
+        }
+        self.benchmark_results["hook_replay"] = results
+        return results
+
     def run_task_accuracy_benchmark(self) -> Dict[str, Any]:
         """Test task completion accuracy through validation"""
         print("✅ Running Task Accuracy Benchmark...")
@@ -387,20 +447,47 @@ class AdminService:
         print(f"  ✅ Task completion accuracy: {accuracy_rate:.1f}%")
         return results
 
-    def run_all_benchmarks(self) -> Dict[str, Any]:
+    def run_all_benchmarks(self, repeat: int = 1, warmup: int = 0) -> Dict[str, Any]:
         """Run complete benchmark suite"""
         print("🚀 Starting CCPES v2.0 Performance Benchmark Suite...")
         print(f"📊 Test Session: {self.test_session_id}")
+        if repeat > 1 or warmup:
+            print(f"🔁 Repetitions: {repeat} (+{warmup} warmup)")
         print("-" * 60)
         
         start_time = time.time()
         
-        # Run all benchmark categories
-        productivity = self.run_productivity_benchmark()
-        duplication = self.run_duplication_benchmark()
-        context_usage = self.run_context_usage_benchmark()
-        continuity = self.run_session_continuity_benchmark()
-        task_accuracy = self.run_task_accuracy_benchmark()
+        categories = [
+            ("productivity", self.run_productivity_benchmark),
+            ("duplication", self.run_duplication_benchmark),
+            ("context_usage", self.run_context_usage_benchmark),
+            ("session_continuity", self.run_session_continuity_benchmark),
+            ("task_accuracy", self.run_task_accuracy_benchmark),
+        ]
+        latest = {}
+        samples = {name: [] for name, _ in categories}
+        
+        # Warmup passes are discarded; only the first measured pass prints
+        for iteration in range(warmup + repeat):
+            verbose = iteration == warmup
+            for name, run_category in categories:
+                output = None if verbose else io.StringIO()
+                category_start = time.perf_counter()
+                if output is None:
+                    result = run_category()
+                else:
+                    with redirect_stdout(output):
+                        result = run_category()
+                elapsed = time.perf_counter() - category_start
+                if iteration >= warmup:
+                    samples[name].append(elapsed)
+                    latest[name] = result
+        
+        productivity = latest["productivity"]
+        duplication = latest["duplication"]
+        context_usage = latest["context_usage"]
+        continuity = latest["session_continuity"]
+        task_accuracy = latest["task_accuracy"]
         
         end_time = time.time()
         duration = end_time - start_time
@@ -411,6 +498,12 @@ class AdminService:
             "test_session_id": self.test_session_id,
             "timestamp": datetime.now().isoformat(),
             "duration_seconds": duration,
+            "repetitions": repeat,
+            "warmup": warmup,
+            "timings": {
+                name: dict(summarize(values), values=values)
+                for name, values in samples.items()
+            },
             "results": {
                 "productivity": productivity,
                 "code_duplication": duplication,
@@ -426,6 +519,9 @@ class AdminService:
         with open(results_file, 'w') as f:
             json.dump(final_results, f, indent=2)
         
+        # Record the run in the history store
+        BenchmarkHistory(self.results_dir).ingest_directory()
+        
         # Generate summary report
         report_file = self._generate_benchmark_report(final_results)
         
@@ -561,6 +657,62 @@ Some performance claims require refinement based on benchmark results. This tran
         return str(report_file)
 
 
+def compare_runs(results_dir: Path, args: List[str]) -> int:
+    """Compare two runs from the history store; returns 1 on regression"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="benchmark_runner.py compare")
+    parser.add_argument("--baseline", help="Baseline run id (default: second most recent)")
+    parser.add_argument("--candidate", help="Candidate run id (default: most recent)")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Significance level")
+    parser.add_argument("--threshold", type=float, default=5.0,
+                        help="Minimum median change in percent to flag")
+    options = parser.parse_args(args)
+    
+    history = BenchmarkHistory(results_dir)
+    history.ingest_directory()
+    runs = history.run_ids
+    candidate = options.candidate or (runs[-1] if runs else None)
+    baseline = options.baseline or (runs[-2] if len(runs) > 1 else None)
+    if not candidate or not baseline:
+        print("Need at least two runs in the history to compare")
+        return 1
+    
+    print(f"📊 Comparing {candidate} against baseline {baseline}")
+    rows = history.compare(baseline, candidate, options.alpha, options.threshold)
+    regressions = 0
+    for row in rows:
+        icon = {"regression": "❌", "improvement": "🚀"}.get(row["verdict"], "✅")
+        if row["verdict"] == "regression":
+            regressions += 1
+        base, cand = row["baseline"], row["candidate"]
+        print(f"  {icon} {row['metric']}: {base['median']:.4f}s → {cand['median']:.4f}s "
+              f"({row['change_percent']:+.1f}%, p={row['p_value']:.3f}, "
+              f"n={base['samples']}/{cand['samples']}) {row['verdict']}")
+    
+    if regressions:
+        print(f"\n❌ {regressions} statistically significant regression(s)")
+        return 1
+    print("\n✅ No significant regressions")
+    return 0
+
+
+def run_parser():
+    """Options of a benchmark run; --help prints the full usage below instead"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="benchmark_runner.py", add_help=False)
+    parser.add_argument("category", nargs="?")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--warmup", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=SESSION_ITERATIONS)
+    parser.add_argument("--recording")
+    parser.add_argument("--repo")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--no-settle", action="store_true")
+    return parser
+
+
 def main():
     """Command-line interface for benchmark runner"""
     import sys
@@ -575,13 +727,53 @@ def main():
         print("  context       - Test context usage efficiency")
         print("  continuity    - Test session state preservation")
         print("  accuracy      - Test task completion accuracy")
+        print("  replay        - Replay recorded hook events (not part of all)")
         print("  all          - Run complete benchmark suite (default)")
+        print("")
+        print("Options for all:")
+        print("  --repeat N    Measured repetitions per category (default 1)")
+        print("  --warmup N    Discarded warmup repetitions (default 0)")
+        print("")
+        print("Options for continuity:")
+        print(f"  --iterations N  Fault injection iterations per scenario (default {SESSION_ITERATIONS})")
+        print("")
+        print("Options for replay:")
+        print(f"  --recording PATH  JSONL or directory of hook payloads (default {DEFAULT_RECORDING})")
+        print("  --repo DIR        Repository to replay on, copied first (default test-data)")
+        print("  --speed X         Pace multiplier; 0 replays without waiting (default 1)")
+        print("  --no-settle       Skip waiting for the index and checking it after each step")
+        print("")
+        print("History:")
+        print("  ingest        - Add every results file to results/history.json")
+        print("  history       - List runs in the history store")
+        print("  compare [--baseline RUN] [--candidate RUN] [--alpha A] [--threshold PCT]")
+        print("                - Flag significant timing regressions (exit code 1)")
+        print("  Indexer phase timings join the history through")
+        print("  `claude-boost index --profile --profile-results benchmarks/results`")
         return
     
     benchmark = PerformanceBenchmark()
     
-    if len(sys.argv) > 1:
-        category = sys.argv[1].lower()
+    if len(sys.argv) > 1 and sys.argv[1] == "compare":
+        sys.exit(compare_runs(benchmark.results_dir, sys.argv[2:]))
+    
+    if len(sys.argv) > 1 and sys.argv[1] in ("ingest", "history"):
+        history = BenchmarkHistory(benchmark.results_dir)
+        added = history.ingest_directory()
+        if sys.argv[1] == "ingest":
+            print(f"📈 Ingested {added} new run(s); {len(history.run_ids)} in history")
+        else:
+            for run_id, timestamp in zip(history.run_ids, history.data["runs"]["timestamp"]):
+                print(f"  {run_id}  {timestamp}")
+        return
+    
+    options = run_parser().parse_args(sys.argv[1:])
+    repeat = max(1, options.repeat)
+    warmup = max(0, options.warmup)
+    iterations = max(1, options.iterations)
+    
+    if options.category:
+        category = options.category.lower()
         
         if category == "productivity":
             benchmark.run_productivity_benchmark()
@@ -590,16 +782,19 @@ def main():
         elif category == "context":
             benchmark.run_context_usage_benchmark()
         elif category == "continuity":
-            benchmark.run_session_continuity_benchmark()
+            benchmark.run_session_continuity_benchmark(iterations)
         elif category == "accuracy":
             benchmark.run_task_accuracy_benchmark()
+        elif category == "replay":
+            benchmark.run_replay_benchmark(options.recording, max(0.0, options.speed), options.repo,
+                                           not options.no_settle)
         elif category == "all":
-            benchmark.run_all_benchmarks()
+            benchmark.run_all_benchmarks(repeat, warmup)
         else:
             print(f"Unknown category: {category}")
             print("Run with --help for available options")
     else:
-        benchmark.run_all_benchmarks()
+        benchmark.run_all_benchmarks(repeat, warmup)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+CCPES v2.0 Hook Replay
+Replays recorded hook events against the installed hooks on a scratch repo
+
+Recordings are JSON lines (.claude/analytics/usage.jsonl or any capture of
+hook stdin) or a directory of JSON files such as dispatcher queue jobs.
+A record may be a raw hook payload, a dispatcher job (`stdin` plus
+`queued_at`), or a wrapper with a `payload` and a `timestamp`; records
+without a tool payload are skipped.
+
+The target repo (benchmarks/test-data by default, or a real one) is copied
+to a scratch directory and given the hook runtime if it has none. Each
+event is then replayed as Claude Code would deliver it:
+
+1. the edit in tool_input (Write, Edit, MultiEdit) is applied to the copy;
+   an Edit whose old_string is not in the file appends new_string instead,
+   so recordings from another checkout still change the file
+2. `dispatch.py <event>` is run with the payload, re-pointed at the copy
+3. unless --no-settle, the replay waits until the dispatcher queue, the
+   index update lock and the pending queue are idle, then checks that the
+   index entry of the edited file matches a fresh extraction
+
+Events are spaced as recorded, divided by --speed (0: no waiting), with
+idle gaps capped at --max-gap. Reported: throughput, hook latency (the
+critical path) and settle latency (edit to index up to date) with tail
+percentiles, and the share of steps whose index entry was correct.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from session_faults import latency_summary
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent / "claude-boost"
+sys.path.insert(0, str(PACKAGE_ROOT))
+
+from claude_boost import extractors  # noqa: E402
+from claude_boost.indexer import is_ignored, load_ignore_patterns  # noqa: E402
+from claude_boost.installer import PACKAGE_DIR, RUNTIME_SCRIPTS  # noqa: E402
+from claude_boost.slices import load_files  # noqa: E402
+from claude_boost.symbols import record_hash  # noqa: E402
+
+DEFAULT_RECORDING = Path(".claude") / "analytics" / "usage.jsonl"
+EDIT_TOOLS = {"Write", "Edit", "MultiEdit"}
+COPY_IGNORE = shutil.ignore_patterns(".git", "node_modules", "__pycache__", ".venv", "venv")
+SETTLE_TIMEOUT = 120.0
+
+# Stand-in project indexer for repos without one: the package indexer
+INDEXER_LAUNCHER = """#!/usr/bin/env python3
+import sys
+sys.path.insert(0, {package!r})
+from claude_boost.indexer import main
+main([])
+"""
+
+
+class ReplayEvent:
+    """One recorded hook invocation"""
+
+    def __init__(self, event: str, payload: Dict[str, Any], at: Optional[float]):
+        self.event = event
+        self.payload = payload
+        self.at = at
+
+
+def parse_time(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        # Milliseconds since the epoch are common in JS-written logs
+        return value / 1000.0 if value > 1e12 else float(value)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def normalize(record: Any) -> Optional[ReplayEvent]:
+    """ReplayEvent for a recorded line or file, None if it holds no tool payload"""
+    if not isinstance(record, dict):
+        return None
+    at = None
+    if "stdin" in record:
+        # Dispatcher queue job
+        try:
+            payload = json.loads(record["stdin"] or "{}")
+        except ValueError:
+            return None
+        at = record.get("queued_at")
+    elif isinstance(record.get("payload"), dict):
+        payload = record["payload"]
+    elif isinstance(record.get("input"), dict):
+        payload = record["input"]
+    else:
+        payload = record
+    if not isinstance(payload, dict) or not payload.get("tool_name"):
+        return None
+    for key in ("timestamp", "ts", "time", "queued_at"):
+        if at is None:
+            at = record.get(key, payload.get(key))
+    event = payload.get("hook_event_name") or record.get("event") or "PostToolUse"
+    return ReplayEvent(event, payload, parse_time(at))
+
+
+def load_recording(path: Path) -> List[ReplayEvent]:
+    """Events of a JSONL file or of a directory of JSON files, in recorded order"""
+    records = []  # type: List[Any]
+    if path.is_dir():
+        for item in sorted(path.glob("*.json")):
+            try:
+                records.append(json.loads(item.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                continue
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+    events = [event for event in map(normalize, records) if event is not None]
+    if all(event.at is not None for event in events):
+        events.sort(key=lambda event: event.at)
+    return events
+
+
+def _flock_free(path: Path) -> bool:
+    """True when nobody holds the advisory lock on path"""
+    try:
+        import fcntl
+    except ImportError:
+        return True
+    try:
+        with open(path, "a") as f:
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return False
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            return True
+    except OSError:
+        return True
+
+
+class ReplayHarness:
+    """Replays a recording against one scratch copy of a repo"""
+
+    def __init__(self, events: List[ReplayEvent], repo: Path, speed: float = 1.0,
+                 max_gap: float = 5.0, settle: bool = True, source_root: Optional[str] = None):
+        self.events = events
+        self.speed = speed
+        self.max_gap = max_gap
+        self.settle_each = settle
+        self.source_root = source_root
+        self.scratch = Path(tempfile.mkdtemp(prefix="ccpes-replay-"))
+        self.repo = self.scratch / "repo"
+        shutil.copytree(str(repo), str(self.repo), ignore=COPY_IGNORE)
+        self.hooks = self.repo / ".claude" / "hooks"
+        self.patterns = load_ignore_patterns(self.repo)
+        self.applied = 0
+        self.synthesized = 0
+
+    def close(self):
+        shutil.rmtree(self.scratch, ignore_errors=True)
+
+    # Setup
+
+    def install_runtime(self) -> List[str]:
+        """Give the copy the hook runtime it lacks; returns what was added"""
+        added = []
+        self.hooks.mkdir(parents=True, exist_ok=True)
+        for script in RUNTIME_SCRIPTS:
+            if not (self.hooks / script).exists():
+                shutil.copy2(str(PACKAGE_DIR / script), str(self.hooks / script))
+                added.append(script)
+        indexer = self.hooks / "project-indexer.py"
+        if not indexer.exists():
+            indexer.write_text(INDEXER_LAUNCHER.format(package=str(PACKAGE_ROOT)), encoding="utf-8")
+            added.append("project-indexer.py (package indexer)")
+        return added
+
+    def build_index(self) -> float:
+        started = time.perf_counter()
+        subprocess.run([sys.executable, str(self.hooks / "workspaces.py"), "build", "--root", str(self.repo)],
+                       cwd=str(self.repo), capture_output=True, timeout=600)
+        return time.perf_counter() - started
+
+    # One step
+
+    def relative_path(self, payload: Dict[str, Any], file_path: str) -> str:
+        base = payload.get("cwd") or self.source_root
+        if base and file_path.startswith(base.rstrip("/") + "/"):
+            return file_path[len(base.rstrip("/")) + 1:]
+        return file_path.lstrip("/")
+
+    def apply_edit(self, tool: str, tool_input: Dict[str, Any], target: Path):
+        """Reproduce the edit on the copy"""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if tool == "Write":
+            target.write_text(tool_input.get("content") or "", encoding="utf-8")
+            self.applied += 1
+            return
+        try:
+            text = target.read_text(encoding="utf-8")
+        except OSError:
+            text = ""
+        edits = tool_input.get("edits") if tool == "MultiEdit" else [tool_input]
+        for edit in edits or []:
+            old, new = edit.get("old_string") or "", edit.get("new_string") or ""
+            if old and old in text:
+                text = text.replace(old, new) if edit.get("replace_all") else text.replace(old, new, 1)
+                self.applied += 1
+            else:
+                text += ("" if not text or text.endswith("\n") else "\n") + new + "\n"
+                self.synthesized += 1
+        target.write_text(text, encoding="utf-8")
+
+    def dispatch(self, event: str, payload: Dict[str, Any]) -> Tuple[int, float]:
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, str(self.hooks / "dispatch.py"), event],
+            input=json.dumps(payload).encode("utf-8"), capture_output=True, cwd=str(self.repo),
+            env=dict(os.environ, CLAUDE_PROJECT_DIR=str(self.repo)), timeout=SETTLE_TIMEOUT,
+        )
+        return result.returncode, time.perf_counter() - started
+
+    def idle(self) -> bool:
+        claude_dir = self.repo / ".claude"
+        queue = claude_dir / "queue"
+        if queue.is_dir() and any(queue.glob("*.json")):
+            return False
+        pending = claude_dir / "state" / "index-pending.txt"
+        if pending.exists() and pending.stat().st_size:
+            return False
+        return _flock_free(queue / ".lock") and _flock_free(claude_dir / "state" / "index-update.lock")
+
+    def settle(self, timeout: float = SETTLE_TIMEOUT) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.idle():
+                return True
+            time.sleep(0.005)
+        return False
+
+    def check(self, rel_path: str) -> Optional[bool]:
+        """Does the index entry of a file match a fresh extraction? None: not indexed by design"""
+        ext = os.path.splitext(rel_path)[1].lower()
+        parts = rel_path.split("/")
+        if extractors.extractor_name(ext) is None or any(
+                is_ignored(part, "/".join(parts[:i + 1]), self.patterns) for i, part in enumerate(parts)):
+            return None
+        try:
+            files = load_files(self.repo)
+            text = (self.repo / rel_path).read_text(encoding="utf-8")
+        except (OSError, ValueError):
+            return False
+        record = files.get(rel_path)
+        if not isinstance(record, dict):
+            return False
+        try:
+            fresh = extractors.get_extractor(ext)(text)
+        except Exception:
+            return "error" in record
+        return (record.get("hash") or record_hash(record)) == record_hash(fresh)
+
+    # Replay
+
+    def schedule(self) -> List[float]:
+        """Offset of each event from the start, in replay seconds"""
+        offsets = [0.0]
+        for previous, event in zip(self.events, self.events[1:]):
+            gap = 0.0
+            if self.speed > 0 and previous.at is not None and event.at is not None:
+                gap = min(max(event.at - previous.at, 0.0), self.max_gap) / self.speed
+            offsets.append(offsets[-1] + gap)
+        return offsets
+
+    def run(self, verbose: bool = True) -> Dict[str, Any]:
+        installed = self.install_runtime()
+        initial_index_seconds = self.build_index()
+
+        steps = []
+        touched = []  # type: List[str]
+        hook_latency, settle_latency = [], []
+        max_lag = 0.0
+        offsets = self.schedule()
+        started = time.perf_counter()
+
+        for number, (event, offset) in enumerate(zip(self.events, offsets), 1):
+            delay = started + offset - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                max_lag = max(max_lag, -delay)
+
+            payload = dict(event.payload, cwd=str(self.repo))
+            tool = payload.get("tool_name")
+            tool_input = dict(payload.get("tool_input") or {})
+            rel_path = None
+            if tool in EDIT_TOOLS and tool_input.get("file_path"):
+                rel_path = self.relative_path(event.payload, tool_input["file_path"])
+                target = self.repo / rel_path
+                tool_input["file_path"] = str(target)
+                payload["tool_input"] = tool_input
+                self.apply_edit(tool, tool_input, target)
+                if rel_path not in touched:
+                    touched.append(rel_path)
+
+            step_started = time.perf_counter()
+            code, hook_seconds = self.dispatch(event.event, payload)
+            hook_latency.append(hook_seconds)
+            step = {"step": number, "event": event.event, "tool": tool, "file": rel_path,
+                    "exit_code": code, "hook_seconds": hook_seconds}  # type: Dict[str, Any]
+
+            if self.settle_each:
+                step["settled"] = self.settle()
+                step["settle_seconds"] = time.perf_counter() - step_started
+                settle_latency.append(step["settle_seconds"])
+                if rel_path is not None:
+                    step["index_correct"] = self.check(rel_path)
+            steps.append(step)
+            if verbose and rel_path is not None and step.get("index_correct") is False:
+                print(f"  ⚠️ step {number}: index entry of {rel_path} is stale")
+
+        replay_seconds = time.perf_counter() - started
+        settled = self.settle()
+        total_seconds = time.perf_counter() - started
+
+        checked = [step["index_correct"] for step in steps if step.get("index_correct") is not None]
+        final = {path: self.check(path) for path in touched}
+        final_checked = [ok for ok in final.values() if ok is not None]
+        return {
+            "repo": str(self.repo),
+            "runtime_installed": installed,
+            "initial_index_seconds": initial_index_seconds,
+            "events": len(self.events),
+            "edits_applied": self.applied,
+            "edits_synthesized": self.synthesized,
+            "speed": self.speed,
+            "settle_each_step": self.settle_each,
+            "replay_seconds": replay_seconds,
+            "total_seconds": total_seconds,
+            "throughput_events_per_second": len(self.events) / total_seconds if total_seconds else 0.0,
+            "max_lag_seconds": max_lag,
+            "hook_failures": sum(1 for step in steps if step["exit_code"] not in (0, 2)),
+            "hook_latency": latency_summary(hook_latency),
+            "settle_latency": latency_summary(settle_latency),
+            "steps_checked": len(checked),
+            "step_correct_percent": sum(checked) / len(checked) * 100 if checked else None,
+            "final_settled": settled,
+            "final_files_checked": len(final_checked),
+            "final_correct_percent": sum(final_checked) / len(final_checked) * 100 if final_checked else None,
+            "stale_files": sorted(path for path, ok in final.items() if ok is False),
+            "steps": steps,
+        }
+
+
+def print_results(results: Dict[str, Any]):
+    print(f"  ▶️ {results['events']} events ({results['edits_applied']} edits applied, "
+          f"{results['edits_synthesized']} synthesized) at "
+          f"{str(results['speed']) + 'x' if results['speed'] else 'full'} speed "
+          f"in {results['total_seconds']:.2f}s: {results['throughput_events_per_second']:.1f} events/s")
+    for label, key in (("hook", "hook_latency"), ("settle", "settle_latency")):
+        stats = results[key]
+        if stats["samples"]:
+            print(f"  ⏱️ {label}: p50 {stats['median'] * 1000:.1f}ms p95 {stats['p95'] * 1000:.1f}ms "
+                  f"p99 {stats['p99'] * 1000:.1f}ms")
+    if results["step_correct_percent"] is not None:
+        print(f"  ✅ Index correct after {results['step_correct_percent']:.1f}% of {results['steps_checked']} steps")
+    if results["final_correct_percent"] is not None:
+        print(f"  ✅ Index correct at the end for {results['final_correct_percent']:.1f}% of "
+              f"{results['final_files_checked']} edited files")
+    for path in results["stale_files"]:
+        print(f"      • stale: {path}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run a replay on its own: python hook_replay.py RECORDING [--repo DIR] [--speed X]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay recorded hook events against the installed hooks")
+    parser.add_argument("recording", nargs="?", default=str(DEFAULT_RECORDING),
+                        help=f"JSONL file or directory of JSON payloads (default: {DEFAULT_RECORDING})")
+    parser.add_argument("--repo", default=str(Path(__file__).resolve().parent / "test-data"),
+                        help="Repository to replay on; copied first (default: benchmarks/test-data)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Pace multiplier; 0 replays without waiting")
+    parser.add_argument("--max-gap", type=float, default=5.0, help="Longest recorded pause kept, in seconds")
+    parser.add_argument("--no-settle", action="store_true", help="Do not wait for the index after each step")
+    parser.add_argument("--source-root", help="Directory the recorded file paths are relative to")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args(argv)
+
+    path = Path(args.recording)
+    if not path.exists():
+        print(f"❌ Recording not found: {path}", file=sys.stderr)
+        return 1
+    events = load_recording(path)
+    if not events:
+        print(f"❌ No tool events in {path}", file=sys.stderr)
+        return 1
+
+    harness = ReplayHarness(events, Path(args.repo), args.speed, args.max_gap,
+                            not args.no_settle, args.source_root)
+    try:
+        results = harness.run(verbose=not args.json)
+    finally:
+        harness.close()
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results)
+    return 0 if not results["stale_files"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+CCPES v2.0 Session Continuity Fault Injection
+Drives session-state-manager.py with synthetic hook payloads under faults
+
+Every iteration runs the real hook as Claude Code would (a subprocess fed a
+SessionEnd or SessionStart payload on stdin, cwd set to a scratch project)
+and then inspects .claude/state/last_session.json. Scenarios:
+
+- normal:      SessionEnd then SessionStart, nothing injected
+- sigkill:     SessionEnd is SIGKILLed at a random point while saving
+- disk_full:   SessionEnd runs with RLIMIT_FSIZE below the state size
+- concurrent:  several SessionEnd writers race SessionStart readers
+- truncated:   SessionStart reads a state file cut at a random offset
+
+An iteration counts as state preserved when the state file afterwards is
+valid JSON holding either the session just saved or the last one saved
+intact, and as context restored when the next SessionStart returns an
+additionalContext (for truncated files: exits cleanly with valid output).
+Non-atomic writes show up as lost state under sigkill and disk_full.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import signal
+import tempfile
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmark_history import summarize
+
+HOOK_NAME = "session-state-manager.py"
+STATE_FILE = Path(".claude") / "state" / "last_session.json"
+SCENARIOS = ["normal", "sigkill", "disk_full", "concurrent", "truncated"]
+
+# Failure messages kept per scenario
+MAX_FAILURE_SAMPLES = 5
+
+
+def find_hook(project_root: Path) -> Optional[Path]:
+    """Locate the session state hook: installed copy first, then the package template"""
+    candidates = [
+        project_root / ".claude" / "hooks" / HOOK_NAME,
+        project_root / "claude-boost" / "claude_boost" / "templates" / ".claude" / "hooks" / HOOK_NAME,
+    ]
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    rank = max(1, int(round(fraction * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def latency_summary(values: List[float]) -> Dict[str, Any]:
+    """Median with CI plus tail percentiles, in seconds"""
+    if not values:
+        return {"samples": 0}
+    summary = summarize(values)
+    summary["p95"] = percentile(values, 0.95)
+    summary["p99"] = percentile(values, 0.99)
+    return summary
+
+
+class HookRun:
+    """Outcome of one hook invocation"""
+
+    def __init__(self, code: int, stdout: str, stderr: str, seconds: float):
+        self.code = code
+        self.stdout = stdout
+        self.stderr = stderr
+        self.seconds = seconds
+
+
+class SessionFaultHarness:
+    """Runs the fault injection scenarios against one hook script"""
+
+    def __init__(self, hook: Path, iterations: int = 100, concurrency: int = 4,
+                 seed: Optional[int] = None):
+        self.hook = Path(hook).resolve()
+        self.iterations = iterations
+        self.concurrency = concurrency
+        self.random = random.Random(seed)
+        self.scratch = Path(tempfile.mkdtemp(prefix="ccpes-session-"))
+        # Upper bound for the SIGKILL delay; refined from the normal scenario
+        self.kill_window = 0.05
+
+    def close(self):
+        shutil.rmtree(self.scratch, ignore_errors=True)
+
+    # Hook plumbing
+
+    def new_project(self, name: str) -> Path:
+        project = self.scratch / name
+        (project / ".claude").mkdir(parents=True, exist_ok=True)
+        return project
+
+    def payload(self, project: Path, event: str, session_id: str) -> bytes:
+        data = {
+            "session_id": session_id,
+            "transcript_path": str(project / ".claude" / f"{session_id}.jsonl"),
+            "cwd": str(project),
+            "hook_event_name": event,
+        }
+        if event == "SessionEnd":
+            data["reason"] = "exit"
+        else:
+            data["source"] = "resume"
+        return json.dumps(data).encode("utf-8")
+
+    def spawn(self, project: Path, event: str, session_id: str,
+              preexec_fn: Optional[Callable[[], None]] = None) -> subprocess.Popen:
+        proc = subprocess.Popen(
+            [sys.executable, str(self.hook)],
+            cwd=str(project),
+            env=dict(os.environ, CLAUDE_PROJECT_DIR=str(project)),
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            preexec_fn=preexec_fn,
+        )
+        proc.stdin.write(self.payload(project, event, session_id))
+        proc.stdin.close()
+        # Sent in full; communicate() would flush the closed pipe
+        proc.stdin = None
+        return proc
+
+    def finish(self, proc: subprocess.Popen, started: float) -> HookRun:
+        # Reads both pipes at once: a hook filling stderr cannot stall on it
+        stdout, stderr = proc.communicate()
+        seconds = time.perf_counter() - started
+        return HookRun(proc.returncode, stdout.decode("utf-8", "replace"), stderr.decode("utf-8", "replace"),
+                       seconds)
+
+    def run_hook(self, project: Path, event: str, session_id: str,
+                 preexec_fn: Optional[Callable[[], None]] = None) -> HookRun:
+        started = time.perf_counter()
+        return self.finish(self.spawn(project, event, session_id, preexec_fn), started)
+
+    @staticmethod
+    def read_state(project: Path) -> Optional[Dict[str, Any]]:
+        """Parsed state file, or None when missing or corrupt"""
+        try:
+            with open(project / STATE_FILE, "r") as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else None
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def restored(run: HookRun) -> bool:
+        """SessionStart produced an additionalContext"""
+        if run.code != 0:
+            return False
+        try:
+            output = json.loads(run.stdout.strip().splitlines()[-1])
+        except (ValueError, IndexError):
+            return False
+        specific = output.get("hookSpecificOutput") if isinstance(output, dict) else None
+        return bool(specific and specific.get("additionalContext"))
+
+    @staticmethod
+    def clean_exit(run: HookRun) -> bool:
+        """Exited 0 without a traceback, printing nothing or valid JSON"""
+        if run.code != 0 or "Traceback" in run.stderr:
+            return False
+        text = run.stdout.strip()
+        if not text:
+            return True
+        try:
+            json.loads(text.splitlines()[-1])
+            return True
+        except ValueError:
+            return False
+
+    def save_clean(self, project: Path, session_id: str) -> bool:
+        run = self.run_hook(project, "SessionEnd", session_id)
+        state = self.read_state(project)
+        return run.code == 0 and state is not None and state.get("session_id") == session_id
+
+    # Scenarios
+
+    def scenario_normal(self, record):
+        project = self.new_project("normal")
+        for i in range(self.iterations):
+            session_id = f"normal-{i}"
+            end = self.run_hook(project, "SessionEnd", session_id)
+            state = self.read_state(project)
+            preserved = end.code == 0 and state is not None and state.get("session_id") == session_id
+            start = self.run_hook(project, "SessionStart", f"normal-{i}-next")
+            record(preserved, self.restored(start), save=end.seconds, restore=start.seconds,
+                   failure=None if preserved else f"save exited {end.code}: {end.stderr.strip()[:200]}")
+
+    def scenario_sigkill(self, record):
+        project = self.new_project("sigkill")
+        previous = "sigkill-base"
+        self.save_clean(project, previous)
+        for i in range(self.iterations):
+            session_id = f"sigkill-{i}"
+            started = time.perf_counter()
+            proc = self.spawn(project, "SessionEnd", session_id)
+            time.sleep(self.random.uniform(0, self.kill_window))
+            killed = proc.poll() is None
+            proc.kill()
+            self.finish(proc, started)
+
+            state = self.read_state(project)
+            saved = state.get("session_id") if state else None
+            preserved = saved in (previous, session_id)
+            start = self.run_hook(project, "SessionStart", f"sigkill-{i}-next")
+            record(preserved, self.restored(start), restore=start.seconds, killed=killed,
+                   failure=None if preserved else f"state lost after SIGKILL at iteration {i}")
+            if preserved:
+                previous = saved
+            else:
+                previous = f"sigkill-{i}-repair"
+                self.save_clean(project, previous)
+
+    def scenario_disk_full(self, record):
+        try:
+            import resource
+        except ImportError:
+            return "RLIMIT_FSIZE is not available on this platform"
+
+        project = self.new_project("disk_full")
+        previous = "disk-full-base"
+        self.save_clean(project, previous)
+        state_size = (project / STATE_FILE).stat().st_size
+
+        for i in range(self.iterations):
+            limit = self.random.randrange(0, max(1, state_size))
+
+            def limit_file_size(limit=limit):
+                # Writes past the limit fail with EFBIG instead of killing the process
+                signal.signal(signal.SIGXFSZ, signal.SIG_IGN)
+                resource.setrlimit(resource.RLIMIT_FSIZE, (limit, limit))
+
+            session_id = f"disk-full-{i}"
+            end = self.run_hook(project, "SessionEnd", session_id, preexec_fn=limit_file_size)
+            state = self.read_state(project)
+            saved = state.get("session_id") if state else None
+            # The new state may be small enough to fit under the limit and be saved whole
+            preserved = saved in (previous, session_id)
+            start = self.run_hook(project, "SessionStart", f"disk-full-{i}-next")
+            record(preserved, self.restored(start), save=end.seconds, restore=start.seconds,
+                   failure=None if preserved else f"state lost when writes failed past {limit} bytes")
+            if preserved:
+                previous = saved
+            else:
+                self.save_clean(project, previous)
+
+    def scenario_concurrent(self, record):
+        project = self.new_project("concurrent")
+        self.save_clean(project, "concurrent-base")
+        for i in range(self.iterations):
+            writers = [f"concurrent-{i}-{n}" for n in range(self.concurrency)]
+            procs = [(event, time.perf_counter(), self.spawn(project, event, session_id))
+                     for session_id in writers
+                     for event in ("SessionEnd", "SessionStart")]
+            with ThreadPoolExecutor(max_workers=len(procs)) as pool:
+                finished = [pool.submit(self.finish, proc, started) for _, started, proc in procs]
+                runs = [(event, future.result()) for (event, _, _), future in zip(procs, finished)]
+
+            state = self.read_state(project)
+            preserved = state is not None and state.get("session_id") in writers
+            readers = [run for event, run in runs if event == "SessionStart"]
+            restored = all(self.restored(run) for run in readers)
+            failure = None
+            if not preserved:
+                failure = f"state corrupt after {self.concurrency} concurrent saves"
+            elif not restored:
+                failure = "a concurrent SessionStart read a partial state file"
+            record(preserved, restored,
+                   save=[run.seconds for event, run in runs if event == "SessionEnd"],
+                   restore=[run.seconds for run in readers], failure=failure)
+            if not preserved:
+                self.save_clean(project, f"concurrent-{i}-repair")
+
+    def scenario_truncated(self, record):
+        project = self.new_project("truncated")
+        for i in range(self.iterations):
+            self.save_clean(project, f"truncated-{i}")
+            state_path = project / STATE_FILE
+            size = state_path.stat().st_size
+            with open(state_path, "r+b") as f:
+                f.truncate(self.random.randrange(0, max(1, size)))
+
+            start = self.run_hook(project, "SessionStart", f"truncated-{i}-next")
+            graceful = self.clean_exit(start)
+            end = self.run_hook(project, "SessionEnd", f"truncated-{i}-after")
+            state = self.read_state(project)
+            preserved = state is not None and state.get("session_id") == f"truncated-{i}-after"
+            failure = None
+            if not graceful:
+                failure = f"SessionStart failed on a truncated file: {start.stderr.strip()[:200]}"
+            elif not preserved:
+                failure = "SessionEnd did not recover from a truncated file"
+            record(preserved, graceful, save=end.seconds, restore=start.seconds, failure=failure)
+
+    # Driver
+
+    def run_scenario(self, name: str) -> Dict[str, Any]:
+        counts = {"iterations": 0, "state_preserved": 0, "context_restored": 0, "successful": 0, "killed": 0}
+        save_latency = []  # type: List[float]
+        restore_latency = []  # type: List[float]
+        failures = []  # type: List[str]
+
+        def record(preserved: bool, restored: bool, save=None, restore=None,
+                   failure: Optional[str] = None, killed: bool = False):
+            counts["iterations"] += 1
+            counts["state_preserved"] += int(preserved)
+            counts["context_restored"] += int(restored)
+            counts["successful"] += int(preserved and restored)
+            counts["killed"] += int(killed)
+            for target, value in ((save_latency, save), (restore_latency, restore)):
+                if isinstance(value, list):
+                    target.extend(value)
+                elif value is not None:
+                    target.append(value)
+            if failure and len(failures) < MAX_FAILURE_SAMPLES:
+                failures.append(failure)
+
+        skipped = getattr(self, f"scenario_{name}")(record)
+        iterations = counts["iterations"] or 1
+        result = {
+            "scenario": name,
+            "iterations": counts["iterations"],
+            "state_preserved_percent": counts["state_preserved"] / iterations * 100,
+            "context_restored_percent": counts["context_restored"] / iterations * 100,
+            "success_rate_percent": counts["successful"] / iterations * 100,
+            "successful": counts["successful"],
+            "save_latency": latency_summary(save_latency),
+            "restore_latency": latency_summary(restore_latency),
+            "failures": failures,
+        }  # type: Dict[str, Any]
+        if name == "sigkill":
+            result["killed_mid_run"] = counts["killed"]
+        if skipped:
+            result["skipped"] = skipped
+        if name == "normal" and save_latency:
+            # Kill somewhere inside a typical save from now on
+            self.kill_window = percentile(save_latency, 0.9)
+        return result
+
+    def run(self, scenarios: Optional[List[str]] = None, verbose: bool = True) -> Dict[str, Any]:
+        results = []
+        for name in scenarios or SCENARIOS:
+            result = self.run_scenario(name)
+            results.append(result)
+            if verbose:
+                print_scenario(result)
+
+        measured = [r for r in results if r["iterations"]]
+        total = sum(r["iterations"] for r in measured)
+        successful = sum(r["successful"] for r in measured)
+        return {
+            "hook": str(self.hook),
+            "iterations_per_scenario": self.iterations,
+            "total_iterations": total,
+            "successful_iterations": successful,
+            "success_rate_percent": successful / total * 100 if total else 0.0,
+            "atomic_writes": all(r["state_preserved_percent"] == 100.0
+                                 for r in measured if r["scenario"] in ("sigkill", "disk_full")),
+            "scenarios": results,
+        }
+
+
+def print_scenario(result: Dict[str, Any]):
+    if result.get("skipped"):
+        print(f"  ⏭️ {result['scenario']}: skipped ({result['skipped']})")
+        return
+    icon = "✅" if result["success_rate_percent"] == 100.0 else "⚠️"
+    line = (f"  {icon} {result['scenario']}: {result['success_rate_percent']:.1f}% of "
+            f"{result['iterations']} (state {result['state_preserved_percent']:.1f}%, "
+            f"restore {result['context_restored_percent']:.1f}%)")
+    for label, key in (("save", "save_latency"), ("restore", "restore_latency")):
+        stats = result[key]
+        if stats["samples"]:
+            line += f" {label} p50 {stats['median'] * 1000:.1f}ms p99 {stats['p99'] * 1000:.1f}ms"
+    print(line)
+    for failure in result["failures"]:
+        print(f"      • {failure}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the harness on its own: python session_faults.py [--iterations N]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fault injection for session-state-manager.py")
+    parser.add_argument("--hook", help=f"Path to {HOOK_NAME} (default: installed copy or package template)")
+    parser.add_argument("--iterations", type=int, default=1000, help="Iterations per scenario")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent sessions per iteration")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, help="Run only these scenarios")
+    parser.add_argument("--seed", type=int, help="Seed for kill delays and truncation offsets")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args(argv)
+
+    hook = Path(args.hook) if args.hook else find_hook(Path(".").resolve())
+    if not hook or not hook.is_file():
+        print(f"❌ {HOOK_NAME} not found; pass --hook", file=sys.stderr)
+        return 1
+
+    harness = SessionFaultHarness(hook, args.iterations, args.concurrency, args.seed)
+    try:
+        results = harness.run(args.scenario, verbose=not args.json)
+    finally:
+        harness.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"\n🔄 Session continuity: {results['success_rate_percent']:.1f}% of "
+              f"{results['total_iterations']} iterations; atomic writes: "
+              f"{'yes' if results['atomic_writes'] else 'no'}")
+    return 0 if results["success_rate_percent"] == 100.0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
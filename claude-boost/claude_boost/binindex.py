@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Binary Index
+Memory-mappable companion of PROJECT_INDEX.json (PROJECT_INDEX.bin)
+
+The JSON stays the format Claude reads through @PROJECT_INDEX.json; the
+binary file is for programs. Opening it maps the file and reads a fixed
+header, so a hook or CLI query pays microseconds instead of a full
+json.load, and a lookup only touches the pages it needs:
+
+    header   magic, version, counts, section offsets, data length, crc32
+    strings  u32 offsets (count + 1) followed by UTF-8 data, sorted by bytes
+    files    fixed 32-byte records sorted by path
+    symbols  fixed 24-byte records, contiguous per file
+    names    (name id, first posting, count) sorted by name id
+    postings u32 symbol ids
+
+Because strings are sorted, a string id is found by binary search and the
+file and name tables (sorted by string id) are searched the same way.
+Nothing is decoded until a record is materialized. The crc32 covers
+everything after the header; open_index only checks the length, verify()
+checks the sum.
+"""
+import os
+import sys
+import mmap
+import time
+import zlib
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# Allow `python binindex.py` to import sibling modules
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_boost.compact import KINDS, NO_LINE, CompactIndex, FoundSymbol
+
+BINARY_NAME = "PROJECT_INDEX.bin"
+JSON_NAME = "PROJECT_INDEX.json"
+MAGIC = b"CBIDX\x00\r\n"
+VERSION = 1
+
+# magic, version, flags, strings, files, symbols, names,
+# offsets of string offsets/string data/files/symbols/names/postings, data length, crc32
+HEADER = struct.Struct("<8sHHIIIIQQQQQQQI")
+FILE_RECORD = struct.Struct("<IIQdII")      # path, hash, size, mtime, first symbol, symbol count
+SYMBOL_RECORD = struct.Struct("<BxxxIIiIi")  # kind, name, signature, line, file, parent
+NAME_RECORD = struct.Struct("<III")          # name, first posting, posting count
+U32 = struct.Struct("<I")
+
+
+class BinaryIndexError(Exception):
+    """The binary index is missing, truncated, corrupt or from another version"""
+
+
+def encode(compact: CompactIndex) -> bytes:
+    """Serialize a CompactIndex whose files were added in path order"""
+    # Renumber strings in byte order so lookups can binary search them
+    encoded = [value.encode("utf-8") for value in compact.strings.strings]
+    order = sorted(range(len(encoded)), key=encoded.__getitem__)
+    remap = [0] * len(order)
+    for new_id, old_id in enumerate(order):
+        remap[old_id] = new_id
+
+    string_offsets = bytearray()
+    string_data = bytearray()
+    for old_id in order:
+        string_offsets += U32.pack(len(string_data))
+        string_data += encoded[old_id]
+    string_offsets += U32.pack(len(string_data))
+
+    files = bytearray()
+    for file_id in range(len(compact)):
+        files += FILE_RECORD.pack(remap[compact.file_path[file_id]], remap[compact.file_hash[file_id]],
+                                  compact.file_size[file_id], compact.file_mtime[file_id],
+                                  compact.file_first_symbol[file_id], compact.file_symbol_count[file_id])
+
+    symbols = bytearray()
+    for symbol_id in range(compact.symbol_count):
+        symbols += SYMBOL_RECORD.pack(compact.symbol_kind[symbol_id], remap[compact.symbol_name[symbol_id]],
+                                      remap[compact.symbol_signature[symbol_id]], compact.symbol_line[symbol_id],
+                                      compact.symbol_file[symbol_id], compact.symbol_parent[symbol_id])
+
+    names = bytearray()
+    postings = bytearray()
+    posting_count = 0
+    for new_name, ids in sorted((remap[name_id], ids) for name_id, ids in compact._by_name.items()):
+        names += NAME_RECORD.pack(new_name, posting_count, len(ids))
+        postings += ids.tobytes() if sys.byteorder == "little" else b"".join(U32.pack(i) for i in ids)
+        posting_count += len(ids)
+
+    sections = [string_offsets, string_data, files, symbols, names, postings]
+    offsets = []
+    position = HEADER.size
+    for section in sections:
+        offsets.append(position)
+        position += len(section)
+    body = b"".join(sections)
+    header = HEADER.pack(MAGIC, VERSION, 0, len(order), len(compact), compact.symbol_count,
+                         len(names) // NAME_RECORD.size, *offsets, len(body), zlib.crc32(body))
+    return header + body
+
+
+def write_binary(index: Dict[str, Any], root: Path) -> Path:
+    """Write PROJECT_INDEX.bin atomically next to the JSON"""
+    compact = CompactIndex()
+    files = index.get("files") or {}
+    for path in sorted(files, key=lambda p: p.encode("utf-8")):
+        compact.add_file(path, files[path])
+    path = root / BINARY_NAME
+    tmp_path = path.with_name(f".{BINARY_NAME}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(encode(compact))
+    os.replace(tmp_path, path)
+    return path
+
+
+class BinaryIndex:
+    """Read-only view of PROJECT_INDEX.bin; same query methods as CompactIndex"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise BinaryIndexError(f"{self.path} is empty")
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise BinaryIndexError(f"{self.path} is truncated")
+        (magic, version, _, self.string_count, self.file_count, self.symbol_count, self.name_count,
+         self._string_offsets, self._string_data, self._files, self._symbols, self._names,
+         self._postings, self._data_length, self._crc) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise BinaryIndexError(f"{self.path} is not a version {VERSION} binary index")
+        if len(self._map) != HEADER.size + self._data_length:
+            self.close()
+            raise BinaryIndexError(f"{self.path} is truncated")
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self) -> "BinaryIndex":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def verify(self) -> bool:
+        """Check the crc32 of everything after the header"""
+        return zlib.crc32(memoryview(self._map)[HEADER.size:]) == self._crc
+
+    # Strings
+
+    def _string_bytes(self, string_id: int) -> bytes:
+        start, end = struct.unpack_from("<II", self._map, self._string_offsets + 4 * string_id)
+        return self._map[self._string_data + start:self._string_data + end]
+
+    def string(self, string_id: int) -> str:
+        return self._string_bytes(string_id).decode("utf-8")
+
+    def string_id(self, value: str) -> Optional[int]:
+        """Binary search of the sorted string table"""
+        target = value.encode("utf-8")
+        low, high = 0, self.string_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._string_bytes(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.string_count and self._string_bytes(low) == target:
+            return low
+        return None
+
+    # Tables
+
+    def _file(self, file_id: int) -> tuple:
+        return FILE_RECORD.unpack_from(self._map, self._files + FILE_RECORD.size * file_id)
+
+    def _search(self, base: int, record: struct.Struct, count: int, key: int) -> Optional[int]:
+        """Index of the record whose leading u32 equals key"""
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if U32.unpack_from(self._map, base + record.size * middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < count and U32.unpack_from(self._map, base + record.size * low)[0] == key:
+            return low
+        return None
+
+    # Queries
+
+    def __len__(self) -> int:
+        return self.file_count
+
+    def paths(self) -> Iterator[str]:
+        return (self.string(self._file(file_id)[0]) for file_id in range(self.file_count))
+
+    def file_id(self, path: str) -> Optional[int]:
+        path_id = self.string_id(path)
+        if path_id is None:
+            return None
+        return self._search(self._files, FILE_RECORD, self.file_count, path_id)
+
+    def file_hash_of(self, path: str) -> Optional[str]:
+        file_id = self.file_id(path)
+        return None if file_id is None else self.string(self._file(file_id)[1])
+
+    def symbol(self, symbol_id: int) -> FoundSymbol:
+        """Materialize one symbol"""
+        kind, name, signature, line, file_id, _ = SYMBOL_RECORD.unpack_from(
+            self._map, self._symbols + SYMBOL_RECORD.size * symbol_id)
+        return FoundSymbol(symbol_id, KINDS[kind], self.string(name), self.string(signature),
+                           None if line == NO_LINE else line, self.string(self._file(file_id)[0]))
+
+    def symbols_in(self, path: str) -> List[FoundSymbol]:
+        file_id = self.file_id(path)
+        if file_id is None:
+            return []
+        _, _, _, _, first, count = self._file(file_id)
+        return [self.symbol(i) for i in range(first, first + count)]
+
+    def find(self, name: str, kind: Optional[str] = None) -> List[FoundSymbol]:
+        """Symbols named `name` (methods match by bare or qualified name)"""
+        name_id = self.string_id(name)
+        if name_id is None:
+            return []
+        entry = self._search(self._names, NAME_RECORD, self.name_count, name_id)
+        if entry is None:
+            return []
+        _, first, count = NAME_RECORD.unpack_from(self._map, self._names + NAME_RECORD.size * entry)
+        ids = struct.unpack_from(f"<{count}I", self._map, self._postings + 4 * first)
+        found = [self.symbol(i) for i in ids]
+        if kind is not None:
+            found = [symbol for symbol in found if symbol.kind == kind]
+        return found
+
+
+def open_index(root: Path = Path(".")) -> Optional[BinaryIndex]:
+    """The binary index of a project, or None if it is missing or older than the JSON"""
+    path = Path(root) / BINARY_NAME
+    try:
+        if path.stat().st_mtime < (Path(root) / JSON_NAME).stat().st_mtime:
+            return None
+        return BinaryIndex(path)
+    except (OSError, BinaryIndexError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point for `claude-boost index find` and `claude-boost index verify`"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="claude-boost index", description=f"Query {BINARY_NAME}")
+    parser.add_argument("action", choices=["find", "verify"])
+    parser.add_argument("name", nargs="?", help="Symbol name to find (bare or Class.method)")
+    parser.add_argument("--kind", choices=KINDS, help="Only symbols of this kind")
+    parser.add_argument("--root", default=".", help="Project root (default: current directory)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    index = open_index(Path(args.root))
+    if index is None:
+        print(f"❌ No up-to-date {BINARY_NAME} in {args.root}; run `claude-boost index`", file=sys.stderr)
+        sys.exit(1)
+    opened = time.perf_counter() - started
+
+    with index:
+        if args.action == "verify":
+            if not index.verify():
+                print(f"❌ {index.path}: checksum mismatch", file=sys.stderr)
+                sys.exit(1)
+            print(f"✅ {index.path}: {len(index)} files, {index.symbol_count} symbols, checksum OK")
+            return
+        if not args.name:
+            parser.error("find needs a symbol name")
+        found = index.find(args.name, args.kind)
+        for symbol in found:
+            location = f"{symbol.file}:{symbol.line}" if symbol.line is not None else symbol.file
+            print(f"  {symbol.kind:<9} {symbol.signature}  ({location})")
+        print(f"🔎 {len(found)} matches (opened in {opened * 1e6:.0f}µs, "
+              f"total {(time.perf_counter() - started) * 1e3:.2f}ms)")
+
+
+if __name__ == "__main__":
+    main()
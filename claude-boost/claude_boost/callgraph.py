@@ -0,0 +1,630 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Call Graph
+Call sites between indexed symbols and a centrality score per symbol
+
+    claude-boost graph top -k 20
+    claude-boost graph callers validate_user
+
+Call sites are extracted per function: from the AST for Python, from the
+token stream for Go, Rust and JavaScript/TypeScript. A callee is written
+as it appears (`save`, `self.save`, `models.User`, `Pool::new`) and
+resolved best-effort to an indexed symbol: the calling class for
+`self.`/`this.`, then the calling file, then the files it imports (see
+claude_boost.imports) and its own package directory; dotted calls on an
+unknown object fall back to a method name that is unique in the project.
+Unresolved calls (the standard library, dynamic dispatch) are dropped.
+
+The resolved calls form a weighted edge list, and a PageRank over it
+gives every function, class and method a centrality: 1.0 is the average,
+and widely used APIs score well above it. Budgeted outputs (slices),
+search ranking and context builders can use it to put the most central
+APIs first.
+
+Everything lives in PROJECT_INDEX.graph.json. Call sites are cached per
+file under the same key as the search index, so an update re-reads only
+changed files, and PageRank restarts from the previous scores, which
+after a local edit converges in a few iterations instead of dozens.
+"""
+import os
+import ast
+import sys
+import json
+import time
+import posixpath
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Allow `python callgraph.py` to import sibling modules
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_boost.extractors.lexer import Token, language, matching, tokenize
+from claude_boost.imports import JS_EXTENSIONS, import_graph
+from claude_boost.search import file_key
+from claude_boost.symbols import iter_symbols
+
+GRAPH_NAME = "PROJECT_INDEX.graph.json"
+GRAPH_VERSION = 1
+# Caller of calls made outside any function (imports, decorators, scripts)
+MODULE = "<module>"
+CALLABLE_KINDS = {"function", "class", "method"}
+SELF_NAMES = {"self", "cls", "this", "Self"}
+# Methods of builtin containers, strings, promises and streams: on an
+# object of unknown type these are almost never project code
+COMMON_METHODS = {
+    "get", "set", "add", "append", "extend", "pop", "update", "items", "keys", "values", "join",
+    "split", "strip", "format", "read", "write", "close", "open", "copy", "clear", "remove", "insert",
+    "index", "count", "sort", "replace", "startswith", "endswith", "encode", "decode", "lower", "upper",
+    "then", "catch", "push", "map", "filter", "forEach", "find", "has", "delete", "send", "call",
+    "apply", "bind", "toString", "len", "new", "unwrap", "clone", "iter", "collect", "is_empty",
+}
+# PageRank parameters
+DAMPING = 0.85
+TOLERANCE = 1e-6
+MAX_ITERATIONS = 100
+
+# Identifiers followed by "(" that are not calls
+NOT_CALLS = {
+    "if", "for", "while", "switch", "return", "catch", "function", "fn", "func", "match", "else",
+    "do", "await", "async", "yield", "typeof", "sizeof", "super", "with", "in", "of", "as",
+}
+JAVASCRIPT = language(
+    comment=r"//[^\n]*|/\*.*?\*/",
+    string=r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`(?:\\.|[^`\\])*`',
+    ident=r"[A-Za-z_$][\w$]*",
+)
+
+Calls = Dict[str, Dict[str, int]]
+
+
+def _count(calls: Calls, caller: str, callee: Optional[str]):
+    if callee:
+        counts = calls.setdefault(caller, {})
+        counts[callee] = counts.get(callee, 0) + 1
+
+
+def _dotted(node: ast.AST) -> Optional[str]:
+    """`a.b.c` for a callee expression made of names and attributes"""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+def python_calls(text: str) -> Calls:
+    """Callees per top-level function, method and class body"""
+    tree = ast.parse(text)
+    calls = {}  # type: Calls
+
+    def collect(caller: str, nodes: List[ast.AST]):
+        for node in nodes:
+            for child in ast.walk(node):
+                if isinstance(child, ast.Call):
+                    _count(calls, caller, _dotted(child.func))
+
+    functions = (ast.FunctionDef, ast.AsyncFunctionDef)
+    for node in tree.body:
+        if isinstance(node, functions):
+            collect(node.name, [node])
+        elif isinstance(node, ast.ClassDef):
+            collect(node.name, node.bases + node.decorator_list)
+            for item in node.body:
+                if isinstance(item, functions):
+                    collect(f"{node.name}.{item.name}", [item])
+                else:
+                    collect(node.name, [item])
+        else:
+            collect(MODULE, [node])
+    return calls
+
+
+def _callee(tokens: List[Token], i: int) -> Optional[str]:
+    """Dotted name called by the "(" at i, if the tokens before it form one"""
+    if i == 0 or tokens[i - 1].kind != "ident" or tokens[i - 1].text in NOT_CALLS:
+        return None
+    k = i - 1
+    parts = [tokens[k].text]
+    while True:
+        if k >= 2 and tokens[k - 1].text == "." and tokens[k - 2].kind == "ident":
+            k -= 2
+        elif k >= 3 and tokens[k - 1].text == ":" and tokens[k - 2].text == ":" and tokens[k - 3].kind == "ident":
+            k -= 3
+        else:
+            break
+        parts.append(tokens[k].text)
+    # A declaration, not a call
+    if k > 0 and tokens[k - 1].text in ("func", "fn", "function"):
+        return None
+    return ".".join(reversed(parts))
+
+
+def _body_calls(calls: Calls, caller: str, tokens: List[Token], start: int, end: int):
+    for i in range(start, end):
+        if tokens[i].text == "(":
+            _count(calls, caller, _callee(tokens, i))
+
+
+def go_calls(text: str) -> Calls:
+    """Callees per function and `Type.Method`"""
+    from claude_boost.extractors.go import GO
+
+    tokens, _ = tokenize(text, GO)
+    calls = {}  # type: Calls
+    i = 0
+    while i < len(tokens):
+        if tokens[i].text != "func":
+            i += 1
+            continue
+        j = i + 1
+        receiver = None
+        if j < len(tokens) and tokens[j].text == "(":
+            close = matching(tokens, j, "(", ")")
+            names = [token.text for token in tokens[j + 1:close] if token.kind == "ident"]
+            receiver = names[-1] if names else None
+            j = close + 1
+        if j + 1 >= len(tokens) or tokens[j].kind != "ident" or tokens[j + 1].text != "(":
+            i += 1
+            continue
+        caller = f"{receiver}.{tokens[j].text}" if receiver else tokens[j].text
+        k = matching(tokens, j + 1, "(", ")") + 1
+        while k < len(tokens) and tokens[k].text != "{":
+            k += 1
+        end = matching(tokens, k, "{", "}")
+        _body_calls(calls, caller, tokens, k, end)
+        i = end + 1
+    return calls
+
+
+def rust_calls(text: str) -> Calls:
+    """Callees per free function and `Type.method` of impl and trait blocks"""
+    from claude_boost.extractors.rust import RUST, _skip_generics
+
+    tokens, _ = tokenize(text, RUST)
+    calls = {}  # type: Calls
+    owners = []  # type: List[Tuple[int, str]]
+    i = 0
+    while i < len(tokens):
+        word = tokens[i].text
+        while owners and i > owners[-1][0]:
+            owners.pop()
+        if word in ("impl", "trait") and tokens[i].kind == "ident":
+            brace = i + 1
+            while brace < len(tokens) and tokens[brace].text not in ("{", ";"):
+                brace += 1
+            if brace >= len(tokens) or tokens[brace].text == ";":
+                i = brace + 1
+                continue
+            header = tokens[i + 1:brace]
+            if word == "impl":
+                texts = [token.text for token in header]
+                if "for" in texts:
+                    header = header[texts.index("for") + 1:]
+                else:
+                    header = tokens[_skip_generics(tokens, i + 1):brace]
+            names = [token.text for token in header if token.kind == "ident" and token.text not in ("dyn", "mut")]
+            if names:
+                owners.append((matching(tokens, brace, "{", "}"), names[0]))
+            i = brace + 1
+            continue
+        if word != "fn" or i + 1 >= len(tokens) or tokens[i + 1].kind != "ident":
+            i += 1
+            continue
+        name = tokens[i + 1].text
+        caller = f"{owners[-1][1]}.{name}" if owners else name
+        j = _skip_generics(tokens, i + 2)
+        if j >= len(tokens) or tokens[j].text != "(":
+            i += 1
+            continue
+        k = matching(tokens, j, "(", ")") + 1
+        while k < len(tokens) and tokens[k].text not in ("{", ";"):
+            k += 1
+        if k >= len(tokens) or tokens[k].text == ";":
+            i = k + 1
+            continue
+        end = matching(tokens, k, "{", "}")
+        _body_calls(calls, caller, tokens, k, end)
+        i = end + 1
+    return calls
+
+
+def _open_paren(tokens: List[Token], close: int) -> int:
+    depth = 0
+    for k in range(close, -1, -1):
+        if tokens[k].text == ")":
+            depth += 1
+        elif tokens[k].text == "(":
+            depth -= 1
+            if depth == 0:
+                return k
+    return 0
+
+
+def _arrow(tokens: List[Token], k: int) -> bool:
+    """Whether tokens k-1, k spell `=>` (the lexer splits punctuation)"""
+    return k >= 1 and tokens[k].text == ">" and tokens[k - 1].text == "="
+
+
+def _opener(tokens: List[Token], brace: int) -> Tuple[Optional[str], bool]:
+    """Name of the function or class whose body starts at `brace`, and whether it is a class"""
+    # Back over a class heritage clause or a TypeScript return type
+    # (`f(a): Promise<T> {`) to the parameter list or arrow
+    k = brace - 1
+    while k > max(brace - 24, 0) and tokens[k].text not in (")", "{", "}", ";") and not _arrow(tokens, k):
+        if tokens[k].text == "class" and tokens[k + 1].kind == "ident":
+            return tokens[k + 1].text, True
+        k -= 1
+    if _arrow(tokens, k):
+        k -= 2
+        if k >= 0 and tokens[k].text == ")":
+            k = _open_paren(tokens, k)
+        k -= 1
+        if k >= 0 and tokens[k].text == "async":
+            k -= 1
+        if k >= 1 and tokens[k].text in ("=", ":") and tokens[k - 1].kind == "ident":
+            return tokens[k - 1].text, False
+        return None, False
+    if k < 0 or tokens[k].text != ")":
+        return None, False
+    k = _open_paren(tokens, k) - 1
+    if k < 0:
+        return None, False
+    if tokens[k].kind == "ident" and tokens[k].text not in NOT_CALLS:
+        return tokens[k].text, False
+    if tokens[k].text == "function" and k >= 2 and tokens[k - 1].text in ("=", ":") and tokens[k - 2].kind == "ident":
+        return tokens[k - 2].text, False
+    return None, False
+
+
+def javascript_calls(text: str) -> Calls:
+    """Callees per named function; a class's methods count as the class"""
+    tokens, _ = tokenize(text, JAVASCRIPT)
+    calls = {}  # type: Calls
+    # One entry per open brace: (owner, owner is a class, directly in the class body)
+    scopes = []  # type: List[Tuple[str, bool, bool]]
+    for i, token in enumerate(tokens):
+        owner, in_class, class_body = scopes[-1] if scopes else (MODULE, False, False)
+        if token.text == "{":
+            if in_class:
+                scopes.append((owner, True, False))
+                continue
+            name, is_class = _opener(tokens, i)
+            scopes.append((name, is_class, is_class) if name else (owner, False, False))
+        elif token.text == "}":
+            if scopes:
+                scopes.pop()
+        elif token.text == "(" and not class_body:
+            callee = _callee(tokens, i)
+            if not callee:
+                continue
+            close = matching(tokens, i, "(", ")")
+            # `save(x) {` in an object literal defines save
+            if "." not in callee and close + 1 < len(tokens) and tokens[close + 1].text == "{":
+                continue
+            _count(calls, owner, callee)
+    return calls
+
+
+def call_sites(path: str, text: str) -> Calls:
+    """Call sites of one source file, by caller"""
+    ext = posixpath.splitext(path)[1].lower()
+    if ext == ".py":
+        return python_calls(text)
+    if ext == ".go":
+        return go_calls(text)
+    if ext == ".rs":
+        return rust_calls(text)
+    if ext in JS_EXTENSIONS:
+        return javascript_calls(text)
+    return {}
+
+
+def _family(path: str) -> str:
+    """Language of a path, with the JavaScript/TypeScript extensions as one"""
+    ext = posixpath.splitext(path)[1].lower()
+    return ".js" if ext in JS_EXTENSIONS else ext
+
+
+class SymbolTable:
+    """Callable symbols of an index, by file and by bare name"""
+
+    def __init__(self, files: Dict[str, Any]):
+        self.by_file = {}  # type: Dict[str, Set[str]]
+        self.by_name = {}  # type: Dict[str, List[str]]
+        for path, record in files.items():
+            names = set()  # type: Set[str]
+            for symbol in iter_symbols(record):
+                if symbol.kind in CALLABLE_KINDS:
+                    names.add(symbol.name)
+                    self.by_name.setdefault(symbol.name.rpartition(".")[2], []).append(f"{path}::{symbol.name}")
+            self.by_file[path] = names
+
+    def ids(self) -> List[str]:
+        return [f"{path}::{name}" for path, names in self.by_file.items() for name in sorted(names)]
+
+    def caller(self, path: str, caller: str) -> str:
+        """Symbol id of a caller; unknown callers (nested or unindexed) count as the module"""
+        names = self.by_file.get(path, ())
+        if caller in names:
+            return f"{path}::{caller}"
+        # A JavaScript method attributed to a class that is indexed as a function
+        if caller.rpartition(".")[2] in names:
+            return f"{path}::{caller.rpartition('.')[2]}"
+        return f"{path}::{MODULE}"
+
+    def resolve(self, path: str, caller: str, callee: str, scopes: List[Set[str]]) -> Optional[str]:
+        """Symbol id a call refers to, or None when it is external or ambiguous"""
+        parts = callee.split(".")
+        attr = parts[-1]
+        head = parts[-2] if len(parts) > 1 else None
+        if head in SELF_NAMES:
+            owner = caller.rpartition(".")[0] or caller
+            if f"{owner}.{attr}" in self.by_file.get(path, ()):
+                return f"{path}::{owner}.{attr}"
+        candidates = self.by_name.get(attr)
+        if not candidates:
+            return None
+        if head is None:
+            # A bare name is a function or class, never a method
+            candidates = [c for c in candidates if "." not in c.partition("::")[2]]
+        elif head not in SELF_NAMES:
+            qualified = [c for c in candidates if c.endswith(f"::{head}.{attr}")]
+            if not qualified and attr in COMMON_METHODS:
+                return None
+            candidates = qualified or candidates
+        for scope in scopes:
+            scoped = [c for c in candidates if c.partition("::")[0] in scope]
+            if len(scoped) == 1:
+                return scoped[0]
+            if scoped:
+                # Ambiguous in the nearest scope that has the name: leave it unresolved
+                return None
+        # A method on an object of unknown type: only a method name unique
+        # among files of the caller's language
+        family = _family(path)
+        methods = [c for c in candidates if "." in c.partition("::")[2] and _family(c.partition("::")[0]) == family]
+        if head is not None and len(methods) == 1:
+            return methods[0]
+        return None
+
+
+def resolve_edges(files: Dict[str, Any], sites: Dict[str, Calls]) -> Tuple[Dict[Tuple[str, str], int], int, int]:
+    """Weighted (caller, callee) edges, plus the number of call sites seen and resolved"""
+    table = SymbolTable(files)
+    imports = import_graph(files)
+    directories = {}  # type: Dict[str, Set[str]]
+    for path in files:
+        directories.setdefault(posixpath.dirname(path), set()).add(path)
+
+    edges = {}  # type: Dict[Tuple[str, str], int]
+    seen = resolved = 0
+    for path, calls in sites.items():
+        scopes = [{path}, imports.get(path, set()), directories.get(posixpath.dirname(path), set())]
+        for caller, callees in calls.items():
+            source = table.caller(path, caller)
+            for callee, count in callees.items():
+                seen += count
+                target = table.resolve(path, caller, callee, scopes)
+                if target is None or target == source:
+                    continue
+                resolved += count
+                edges[(source, target)] = edges.get((source, target), 0) + count
+    return edges, seen, resolved
+
+
+def pagerank(nodes: List[str], edges: Dict[Tuple[str, str], int],
+             previous: Optional[Dict[str, float]] = None, floor: float = 0.0) -> Tuple[Dict[str, float], int]:
+    """Scores scaled so the average node is 1.0, and the iterations it took
+
+    `previous` (scores from the last run, scaled the same way) is the
+    starting point, so a small change to the graph needs few iterations.
+    """
+    n = len(nodes)
+    if not n:
+        return {}, 0
+    position = {node: i for i, node in enumerate(nodes)}
+    out_weight = [0.0] * n
+    incoming = [[] for _ in range(n)]  # type: List[List[Tuple[int, int]]]
+    for (source, target), weight in edges.items():
+        incoming[position[target]].append((position[source], weight))
+        out_weight[position[source]] += weight
+    dangling = [i for i in range(n) if not out_weight[i]]
+
+    if previous:
+        rank = [previous.get(node, floor) or 1.0 for node in nodes]
+        total = sum(rank)
+        rank = [r / total for r in rank]
+    else:
+        rank = [1.0 / n] * n
+
+    iterations = 0
+    for iterations in range(1, MAX_ITERATIONS + 1):
+        share = [rank[i] / out_weight[i] if out_weight[i] else 0.0 for i in range(n)]
+        base = (1 - DAMPING) / n + DAMPING * sum(rank[i] for i in dangling) / n
+        new = [base + DAMPING * sum(share[s] * w for s, w in sources) for sources in incoming]
+        delta = sum(abs(a - b) for a, b in zip(new, rank))
+        rank = new
+        if delta < TOLERANCE:
+            break
+    return {node: rank[i] * n for i, node in enumerate(nodes)}, iterations
+
+
+def load_graph(root: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(root / GRAPH_NAME, "r") as f:
+            graph = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(graph, dict) or graph.get("version") != GRAPH_VERSION:
+        return None
+    return graph
+
+
+def update_call_graph(index: Dict[str, Any], root: Path) -> Dict[str, Any]:
+    """Bring PROJECT_INDEX.graph.json in line with an index, re-reading changed files only"""
+    started = time.perf_counter()
+    files = {path: record for path, record in (index.get("files") or {}).items()
+             if isinstance(record, dict) and not record.get("error")}
+    previous = load_graph(root) or {}
+    cached = previous.get("files") or {}
+
+    entries = {}  # type: Dict[str, Dict[str, Any]]
+    extracted = 0
+    for path, record in files.items():
+        key = file_key(record)
+        entry = cached.get(path)
+        if entry and entry.get("key") == key:
+            entries[path] = entry
+            continue
+        try:
+            with open(root / path, "r", encoding="utf-8") as f:
+                calls = call_sites(path, f.read())
+        except (OSError, UnicodeDecodeError, SyntaxError, ValueError, RecursionError):
+            calls = {}
+        entries[path] = {"key": key, "calls": calls}
+        extracted += 1
+
+    removed = len(set(cached) - set(files))
+    summary = previous.get("summary") or {}
+    if not extracted and not removed and previous.get("centrality") is not None:
+        # Nothing changed: the previous scores stand
+        summary = dict(summary, extracted=0, iterations=0, seconds=round(time.perf_counter() - started, 3))
+        return dict(previous, summary=summary)
+
+    edges, seen, resolved = resolve_edges(files, {path: entry["calls"] for path, entry in entries.items()})
+    table_ids = SymbolTable(files).ids()
+    modules = sorted({source for source, _ in edges if source.endswith(f"::{MODULE}")})
+    floor = (previous.get("summary") or {}).get("floor", 0.0)
+    scores, iterations = pagerank(table_ids + modules, edges, previous.get("centrality"), floor)
+
+    # Symbols nobody calls all share the lowest score; only the rest is stored
+    callable_scores = {node: score for node, score in scores.items() if not node.endswith(f"::{MODULE}")}
+    floor = min(callable_scores.values(), default=0.0)
+    centrality = {node: round(score, 4) for node, score in
+                  sorted(callable_scores.items(), key=lambda item: item[1], reverse=True)
+                  if score > floor * (1 + 1e-6)}
+
+    graph = {
+        "version": GRAPH_VERSION,
+        "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "files": entries,
+        "edges": [[source, target, weight] for (source, target), weight in sorted(edges.items())],
+        "centrality": centrality,
+        "summary": {
+            "symbols": len(table_ids),
+            "edges": len(edges),
+            "call_sites": seen,
+            "resolved_percent": round(100.0 * resolved / seen, 1) if seen else 0.0,
+            "floor": round(floor, 4),
+            "extracted": extracted,
+            "iterations": iterations,
+            "seconds": round(time.perf_counter() - started, 3),
+        },
+    }  # type: Dict[str, Any]
+    path = root / GRAPH_NAME
+    tmp_path = path.with_name(f".{GRAPH_NAME}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(graph, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    return graph
+
+
+def symbol_centrality(graph: Optional[Dict[str, Any]]) -> Dict[Tuple[str, str], float]:
+    """(path, symbol name) → centrality, for symbols above the floor"""
+    if not graph:
+        return {}
+    scores = {}  # type: Dict[Tuple[str, str], float]
+    for node, score in (graph.get("centrality") or {}).items():
+        path, _, name = node.partition("::")
+        scores[(path, name)] = score
+    return scores
+
+
+def file_centrality(graph: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    """path → centrality of its most central symbol"""
+    scores = {}  # type: Dict[str, float]
+    for (path, _), score in symbol_centrality(graph).items():
+        scores[path] = max(scores.get(path, 0.0), score)
+    return scores
+
+
+def top_symbols(graph: Optional[Dict[str, Any]], limit: int = 20) -> List[Dict[str, Any]]:
+    """The most central symbols, most central first"""
+    if not graph:
+        return []
+    ranked = sorted((graph.get("centrality") or {}).items(), key=lambda item: item[1], reverse=True)
+    return [{"file": node.partition("::")[0], "name": node.partition("::")[2], "centrality": score}
+            for node, score in ranked[:limit]]
+
+
+def neighbours(graph: Dict[str, Any], name: str, callers: bool) -> List[Tuple[str, str, int]]:
+    """(symbol, other end, calls) for edges into (callers) or out of a symbol named `name`"""
+    found = []
+    for source, target, weight in graph.get("edges") or []:
+        node, other = (target, source) if callers else (source, target)
+        symbol = node.partition("::")[2]
+        if symbol == name or symbol.rpartition(".")[2] == name:
+            found.append((node, other, weight))
+    return sorted(found, key=lambda item: item[2], reverse=True)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point for `claude-boost graph`"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="claude-boost graph",
+                                     description="Call graph and symbol centrality of the project")
+    parser.add_argument("action", nargs="?", default="top", choices=["top", "callers", "callees", "build"])
+    parser.add_argument("name", nargs="?", help="Symbol for callers/callees (`func` or `Class.method`)")
+    parser.add_argument("-k", "--limit", type=int, default=20, help="Number of rows (default: 20)")
+    parser.add_argument("--root", default=".", help="Project root (default: current directory)")
+    parser.add_argument("--json", action="store_true", help="Print rows as JSON")
+    args = parser.parse_args(argv)
+
+    root = Path(args.root)
+    if args.action == "build":
+        try:
+            with open(root / "PROJECT_INDEX.json", "r") as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ Cannot read PROJECT_INDEX.json: {e}; run `claude-boost index` first", file=sys.stderr)
+            sys.exit(1)
+        summary = update_call_graph(index, root)["summary"]
+        print(f"🕸️  {GRAPH_NAME}: {summary['symbols']} symbols, {summary['edges']} edges, "
+              f"{summary['resolved_percent']}% of {summary['call_sites']} call sites resolved, "
+              f"{summary['iterations']} iterations in {summary['seconds']:.2f}s")
+        return
+
+    graph = load_graph(root)
+    if graph is None:
+        print(f"❌ {GRAPH_NAME} not found; run `claude-boost index` first", file=sys.stderr)
+        sys.exit(1)
+    if args.action == "top":
+        rows = top_symbols(graph, args.limit)
+        if args.json:
+            print(json.dumps(rows, indent=2))
+            return
+        for row in rows:
+            print(f"  {row['centrality']:>8.2f}  {row['name']}  ({row['file']})")
+        return
+
+    if not args.name:
+        parser.error(f"{args.action} needs a symbol name")
+    rows = neighbours(graph, args.name, callers=args.action == "callers")[:args.limit]
+    if args.json:
+        print(json.dumps([{"symbol": node, args.action[:-1]: other, "calls": weight}
+                          for node, other, weight in rows], indent=2))
+        return
+    arrow = "←" if args.action == "callers" else "→"
+    for node, other, weight in rows:
+        print(f"  {node} {arrow} {other}  ×{weight}")
+    if not rows:
+        print(f"  No {args.action} of {args.name} in the graph")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,52 @@
 // This allows npx claude-boost to work seamlessly
 
 const { spawn } = require('child_process');
+const fs = require('fs');
+const os = require('os');
 const path = require('path');
 
+// Remembers which Python command worked so later runs skip the probing
+const PYTHON_CACHE = path.join(os.homedir(), '.claude-boost', 'python.json');
+
+function readCachedPython() {
+    try {
+        return JSON.parse(fs.readFileSync(PYTHON_CACHE, 'utf8')).command || null;
+    } catch (err) {
+        return null;
+    }
+}
+
+function writeCachedPython(command) {
+    try {
+        fs.mkdirSync(path.dirname(PYTHON_CACHE), { recursive: true });
+        fs.writeFileSync(PYTHON_CACHE, JSON.stringify({ command: command }));
+    } catch (err) {
+        // Caching is best effort
+    }
+}
+
+function forgetCachedPython(command) {
+    // A cached command that no longer starts must not be tried first forever
+    if (readCachedPython() !== command) {
+        return;
+    }
+    try {
+        fs.unlinkSync(PYTHON_CACHE);
+    } catch (err) {
+        // Best effort, like writing it
+    }
+}
+
 function runPythonCLI() {
     // Cross-platform Python detection
     const isWindows = process.platform === 'win32';
-    const pythonCommands = isWindows ? ['py', 'python', 'python3'] : ['python3', 'python'];
+    let pythonCommands = isWindows ? ['py', 'python', 'python3'] : ['python3', 'python'];
+    
+    // Try the command that worked last time first
+    const cached = readCachedPython();
+    if (cached) {
+        pythonCommands = [cached, ...pythonCommands.filter((cmd) => cmd !== cached)];
+    }
     
     // Get the path to the Python CLI script
     const pythonScript = path.join(__dirname, 'cli.py');
@@ -31,7 +71,9 @@ function tryPythonCommand(commands, args, index) {
     }
     
     const pythonCmd = commands[index];
-    console.log(`🔍 Trying ${pythonCmd}...`);
+    if (index > 0) {
+        console.log(`🔍 Trying ${pythonCmd}...`);
+    }
     
     // Spawn the Python process
     const pythonProcess = spawn(pythonCmd, args, {
@@ -39,9 +81,15 @@ function tryPythonCommand(commands, args, index) {
         shell: false  // Don't use shell for better cross-platform compatibility
     });
     
+    // A command that fails to spawn emits 'error' and then 'close' with a
+    // negative code; only the 'error' handler acts on it
+    let spawnFailed = false;
+
     pythonProcess.on('error', (err) => {
+        spawnFailed = true;
         if (err.code === 'ENOENT') {
             // Try next command
+            forgetCachedPython(pythonCmd);
             tryPythonCommand(commands, args, index + 1);
         } else {
             console.error('❌ Error running Claude Code Boost:', err.message);
@@ -50,14 +98,19 @@ function tryPythonCommand(commands, args, index) {
     });
     
     pythonProcess.on('close', (code) => {
-        if (code === 0) {
-            process.exit(0);
-        } else if (code === 127 || code === 9009) {
+        if (spawnFailed || (typeof code === 'number' && code < 0)) {
+            return;
+        }
+        if (code === 127 || code === 9009) {
             // Command not found - try next
+            forgetCachedPython(pythonCmd);
             tryPythonCommand(commands, args, index + 1);
-        } else {
-            process.exit(code);
+            return;
+        }
+        if (index > 0 || readCachedPython() !== pythonCmd) {
+            writeCachedPython(pythonCmd);
         }
+        process.exit(code);
     });
 }
 
@@ -6,50 +6,153 @@ Interactive installer for the Claude Code enhancement system
 import os
 import sys
 import json
+import time
 import shutil
-import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Allow `python cli.py` (used by the npm wrapper) to import sibling modules
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+STATE_DIR = Path.home() / ".claude-boost"
+DETECTION_CACHE = STATE_DIR / "detection.json"
+DETECTION_TTL_SECONDS = 24 * 60 * 60
+PROBE_TIMEOUT_SECONDS = 3
+
 def print_header():
     """Print the welcome header"""
     print("\n🧪 Claude Code Boost v0.9.0-beta - AI Development Enhancement Framework")
     print("=" * 70)
 
-def check_claude_code():
-    """Check if Claude Code is available with cross-platform support"""
-    claude_commands = ['claude', 'claude.cmd', 'npx @anthropic-ai/claude-code']
+def _claude_candidates() -> List[Dict]:
+    """Resolve the Claude Code probes that can run on this machine"""
+    candidates = []
+    seen = set()
+    for name in ['claude', 'claude.cmd']:
+        path = shutil.which(name)
+        if path and path not in seen:
+            seen.add(path)
+            candidates.append({"cmd": [path, '--version'], "marker": "Claude Code"})
+    
+    npx = shutil.which('npx')
+    if npx:
+        # --no-install keeps npx from downloading the package just to probe it
+        candidates.append({
+            "cmd": [npx, '--no-install', '@anthropic-ai/claude-code', '--version'],
+            "marker": "Claude Code"
+        })
     
-    for cmd in claude_commands:
+    npm = shutil.which('npm')
+    if npm:
+        candidates.append({
+            "cmd": [npm, 'list', '-g', '--depth=0'],
+            "marker": "@anthropic-ai/claude-code",
+            "via": "npm global packages"
+        })
+    return candidates
+
+def _detection_fingerprint(candidates: List[Dict]) -> List[List]:
+    """Identify the probed binaries so an upgrade invalidates the cache"""
+    fingerprint = []
+    for candidate in candidates:
+        path = candidate["cmd"][0]
         try:
-            if cmd.startswith('npx'):
-                # Use shell=True for npx commands
-                result = subprocess.run(cmd.split() + ['--version'], 
-                                      capture_output=True, text=True, shell=True, timeout=10)
-            else:
-                result = subprocess.run([cmd, '--version'], 
-                                      capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0 and 'Claude Code' in result.stdout:
-                version = result.stdout.strip()
-                print(f"✅ Claude Code installation detected: {version}")
-                return True
-                
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            continue
-        except Exception as e:
-            # Log but continue trying other commands
-            continue
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+        fingerprint.append([path, mtime])
+    return fingerprint
+
+def _load_detection_cache(fingerprint: List[List]) -> Optional[Dict]:
+    """Return the cached detection result if it is fresh and nothing changed"""
+    try:
+        with open(DETECTION_CACHE, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
     
-    # If all detection methods fail, check npm global packages
+    if cached.get("fingerprint") != fingerprint:
+        return None
+    if time.time() - cached.get("checked_at", 0) > DETECTION_TTL_SECONDS:
+        return None
+    return cached
+
+def _save_detection_cache(fingerprint: List[List], version: str):
+    """Remember a successful detection"""
     try:
-        result = subprocess.run(['npm', 'list', '-g', '--depth=0'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0 and '@anthropic-ai/claude-code' in result.stdout:
-            print("✅ Claude Code installation detected via npm global packages")
-            return True
-    except Exception:
+        STATE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = DETECTION_CACHE.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump({"fingerprint": fingerprint, "version": version, "checked_at": time.time()}, f)
+        os.replace(tmp_path, DETECTION_CACHE)
+    except OSError:
         pass
+
+def _probe_claude_code(candidates: List[Dict]) -> Optional[str]:
+    """Run all probes concurrently and return the first positive result"""
+    import queue
+    import subprocess
+    import threading
+    
+    deadline = time.monotonic() + PROBE_TIMEOUT_SECONDS
+    results = queue.Queue()
+    
+    def drain(candidate: Dict, proc):
+        # Read while the probe runs: one that fills the pipe would stall until killed
+        try:
+            output, _ = proc.communicate(timeout=max(0.0, deadline - time.monotonic()))
+        except (subprocess.TimeoutExpired, OSError, ValueError):
+            output = None
+        results.put((candidate, proc.returncode, output))
+    
+    running = []
+    for candidate in candidates:
+        try:
+            proc = subprocess.Popen(candidate["cmd"], stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL,
+                                    text=True)
+        except OSError:
+            continue
+        running.append(proc)
+        threading.Thread(target=drain, args=(candidate, proc), daemon=True).start()
+    
+    found = None
+    try:
+        for _ in running:
+            try:
+                candidate, returncode, output = results.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if returncode == 0 and output and candidate["marker"] in output:
+                if "via" in candidate:
+                    found = f"via {candidate['via']}"
+                else:
+                    found = output.strip()
+                break
+    finally:
+        # Whatever is still running lost the race or timed out
+        for proc in running:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+    return found
+
+def check_claude_code():
+    """Check if Claude Code is available with cross-platform support"""
+    candidates = _claude_candidates()
+    fingerprint = _detection_fingerprint(candidates)
+    
+    cached = _load_detection_cache(fingerprint)
+    if cached:
+        print(f"✅ Claude Code installation detected: {cached['version']} (cached)")
+        return True
+    
+    version = _probe_claude_code(candidates)
+    if version:
+        print(f"✅ Claude Code installation detected: {version}")
+        _save_detection_cache(fingerprint, version)
+        return True
     
     print("❌ Claude Code not found. Please install Claude Code first:")
     print("   Windows: npm install -g @anthropic-ai/claude-code")
@@ -57,43 +160,49 @@ def check_claude_code():
     print("   Visit: https://claude.ai/code")
     return False
 
-def detect_project_type():
-    """Detect project type based on files present"""
-    project_types = []
+def detect_project_type(root: Path = Path(".")):
+    """Detect project type based on the manifests of every workspace"""
+    from claude_boost.workspaces import discover
     
-    if os.path.exists("package.json"):
-        project_types.append("JavaScript/Node.js")
-    if os.path.exists("requirements.txt") or os.path.exists("pyproject.toml"):
-        project_types.append("Python")
-    if os.path.exists("Cargo.toml"):
-        project_types.append("Rust")
-    if os.path.exists("go.mod"):
-        project_types.append("Go")
+    profile = discover(root)
+    languages = set()
+    for workspace in profile["workspaces"]:
+        languages.update(workspace["languages"])
     
+    order = ["JavaScript/Node.js", "Python", "Rust", "Go"]
+    project_types = [language for language in order if language in languages]
     return project_types if project_types else ["Generic"]
 
-def get_user_preferences():
+# Feature selection
+FEATURES = {
+    "project_indexer": {
+        "name": "Project Indexer - Prevent code duplication",
+        "default": True
+    },
+    "smart_agents": {
+        "name": "Smart Agents - Code review, validation, debugging",
+        "default": True
+    },
+    "session_manager": {
+        "name": "Session Manager - Never lose context",
+        "default": True
+    }
+}
+
+def get_user_preferences(config: Optional[Dict] = None):
     """Get user preferences for installation"""
     print("\n📋 Configuration Options:")
     
-    # Feature selection
-    features = {
-        "project_indexer": {
-            "name": "Project Indexer - Prevent code duplication",
-            "default": True
-        },
-        "smart_agents": {
-            "name": "Smart Agents - Code review, validation, debugging",
-            "default": True
-        },
-        "session_manager": {
-            "name": "Session Manager - Never lose context",
-            "default": True
-        }
-    }
-    
     selected_features = {}
-    for key, feature in features.items():
+    if config is not None:
+        # Non-interactive mode: features come from the config file
+        configured = config.get("features", {})
+        for key, feature in FEATURES.items():
+            selected_features[key] = bool(configured.get(key, feature["default"]))
+            print(f"  [CONFIG] {feature['name']}: {'Yes' if selected_features[key] else 'No'}")
+        return selected_features
+    
+    for key, feature in FEATURES.items():
         default = "Y" if feature["default"] else "N"
         try:
             response = input(f"  [{default}] {feature['name']} (y/N): ").strip().lower()
@@ -105,73 +214,56 @@ def get_user_preferences():
     
     return selected_features
 
-def copy_template_files(features: Dict[str, bool]):
+def copy_template_files(features: Dict[str, bool], root: Path = Path(".")):
     """Copy template files based on selected features"""
-    print("\n📦 Installing...")
+    from claude_boost.installer import Installer, TEMPLATE_DIR
     
-    # Get the template directory path
-    template_dir = Path(__file__).parent / "templates" / ".claude"
+    print("\n📦 Installing...")
     
-    if not template_dir.exists():
-        print(f"❌ Template directory not found: {template_dir}")
+    if not TEMPLATE_DIR.exists():
+        print(f"❌ Template directory not found: {TEMPLATE_DIR}")
         return False
     
-    # Create .claude directory
-    claude_dir = Path(".claude")
-    claude_dir.mkdir(exist_ok=True)
+    # Only files whose content differs from the template are rewritten
+    report = Installer(root, features).install()
     print("  ✅ Creating .claude directory")
-    
-    # Copy CLAUDE.md
-    shutil.copy2(template_dir / "CLAUDE.md", claude_dir / "CLAUDE.md")
     print("  ✅ Setting up CLAUDE.md template")
     
     if features.get("smart_agents", True):
-        # Copy agents
-        agents_dir = claude_dir / "agents"
-        agents_dir.mkdir(exist_ok=True)
-        
-        for agent_file in (template_dir / "agents").glob("*.md"):
-            shutil.copy2(agent_file, agents_dir / agent_file.name)
         print("  ✅ Configuring 4 specialized agents")
-        
-        # Copy commands
-        commands_dir = claude_dir / "commands" 
-        commands_dir.mkdir(exist_ok=True)
-        
-        for command_file in (template_dir / "commands").glob("*.md"):
-            shutil.copy2(command_file, commands_dir / command_file.name)
         print("  ✅ Adding essential commands")
     
     if features.get("project_indexer", True):
-        # Copy hooks
-        hooks_dir = claude_dir / "hooks"
-        hooks_dir.mkdir(exist_ok=True)
-        
-        for hook_file in (template_dir / "hooks").glob("*.py"):
-            shutil.copy2(hook_file, hooks_dir / hook_file.name)
-            # Make hooks executable
-            os.chmod(hooks_dir / hook_file.name, 0o755)
         print("  ✅ Setting up PROJECT_INDEX.json generator")
     
     if features.get("session_manager", True):
         print("  ✅ Initializing session management")
     
+    if report["unchanged"]:
+        print(f"  ⏭️ {len(report['unchanged'])} files already up to date")
+    
     return True
 
-def generate_initial_index():
-    """Generate initial PROJECT_INDEX.json"""
-    hooks_dir = Path(".claude/hooks")
-    indexer_script = hooks_dir / "project-indexer.py"
+def generate_initial_index(root: Path = Path(".")):
+    """Generate initial PROJECT_INDEX.json, one per workspace in monorepos"""
+    from claude_boost import workspaces
+    
+    indexer_script = root / ".claude" / "hooks" / "project-indexer.py"
     
     if indexer_script.exists():
         try:
-            result = subprocess.run([sys.executable, str(indexer_script)], 
-                                 capture_output=True, text=True)
-            if result.returncode == 0:
-                print("  ✅ Generated initial PROJECT_INDEX.json")
+            result = workspaces.build(root)
+            failed = [report for report in result["workspaces"] if not report["ok"]]
+            if not failed:
+                count = len(result["workspaces"])
+                if count > 1:
+                    print(f"  ✅ Generated PROJECT_INDEX.json for {count} workspaces")
+                else:
+                    print("  ✅ Generated initial PROJECT_INDEX.json")
                 return True
             else:
-                print(f"  ⚠️ Warning: Could not generate PROJECT_INDEX.json: {result.stderr}")
+                for report in failed:
+                    print(f"  ⚠️ Warning: Could not generate {report['path']}/PROJECT_INDEX.json: {report.get('error', '')}")
                 return False
         except Exception as e:
             print(f"  ⚠️ Warning: Could not generate PROJECT_INDEX.json: {e}")
@@ -188,37 +280,47 @@ def show_next_steps():
     print("\nDocumentation: https://github.com/Ferymad/claude-boost-framework#readme")
     print("Beta Support: https://github.com/Ferymad/claude-boost-framework/issues")
 
-def create_gitignore_entry():
-    """Add PROJECT_INDEX.json to .gitignore if it exists"""
-    gitignore_path = Path(".gitignore")
-    entry = "PROJECT_INDEX.json"
+def create_gitignore_entry(root: Path = Path(".")):
+    """Add PROJECT_INDEX.json and its companions to .gitignore if it exists"""
+    gitignore_path = root / ".gitignore"
+    entries = ["PROJECT_INDEX.json", "PROJECT_INDEX.bin", "PROJECT_INDEX.search.db", "PROJECT_INDEX.graph.json"]
     
     if gitignore_path.exists():
         with open(gitignore_path, 'r') as f:
             content = f.read()
         
-        if entry not in content:
+        missing = [entry for entry in entries if entry not in content]
+        if missing:
             with open(gitignore_path, 'a') as f:
-                f.write(f"\n# Claude Code Boost\n{entry}\n")
-            print("  ✅ Added PROJECT_INDEX.json to .gitignore")
+                f.write("\n# Claude Code Boost\n" + "".join(f"{entry}\n" for entry in missing))
+            print(f"  ✅ Added {', '.join(missing)} to .gitignore")
     else:
         with open(gitignore_path, 'w') as f:
-            f.write(f"# Claude Code Boost\n{entry}\n")
+            f.write("# Claude Code Boost\n" + "".join(f"{entry}\n" for entry in entries))
         print("  ✅ Created .gitignore with PROJECT_INDEX.json")
 
-def main():
-    """Main CLI entry point"""
-    if len(sys.argv) > 1 and sys.argv[1] in ['--help', '-h']:
-        print("Claude Code Boost - Supercharge your AI development workflow")
-        print("\nUsage:")
-        print("  claude-boost init    Initialize Claude Code Boost in current project")
-        print("  claude-boost --help  Show this help message")
-        return
+def run_init(args: List[str]):
+    """Initialize Claude Code Boost in the current project"""
+    import argparse
     
-    if len(sys.argv) < 2 or sys.argv[1] != 'init':
-        print("Usage: claude-boost init")
-        print("Run 'claude-boost --help' for more information")
-        return
+    parser = argparse.ArgumentParser(prog="claude-boost init")
+    parser.add_argument("--config", help="boost.toml with feature choices (non-interactive)")
+    parser.add_argument("--repos", help="File listing repositories, or a glob")
+    parser.add_argument("--jobs", type=int, help="Parallel workers for --repos")
+    options = parser.parse_args(args)
+    
+    if options.repos:
+        from claude_boost import fleet
+        sys.exit(fleet.main(options.config, options.repos, options.jobs))
+    
+    config = None
+    if options.config:
+        from claude_boost import fleet
+        try:
+            config = fleet.load_config(options.config)
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"❌ Could not load config {options.config}: {e}")
+            sys.exit(1)
     
     print_header()
     
@@ -232,7 +334,7 @@ def main():
     print(f"  Project type detected: {', '.join(project_types)}")
     
     # Get user preferences
-    features = get_user_preferences()
+    features = get_user_preferences(config)
     
     # Install files
     if not copy_template_files(features):
@@ -240,14 +342,140 @@ def main():
         sys.exit(1)
     
     # Generate initial project index
-    if features.get("project_indexer", True):
+    init_options = (config or {}).get("init", {})
+    if features.get("project_indexer", True) and init_options.get("generate_index", True):
         generate_initial_index()
     
     # Update .gitignore
-    create_gitignore_entry()
+    if init_options.get("update_gitignore", True):
+        create_gitignore_entry()
     
     # Show success message
     show_next_steps()
 
+def run_upgrade(args: List[str]):
+    """Update installed templates"""
+    from claude_boost import installer
+    installer.upgrade_main(args)
+
+def run_context_size(args: List[str]):
+    """Measure the always-loaded context"""
+    from claude_boost import context
+    context.main(args)
+
+def run_index(args: List[str]):
+    """Generate PROJECT_INDEX.json"""
+    from claude_boost.indexer import main as index_main
+    index_main(args)
+
+def run_search(args: List[str]):
+    """Search the project's symbols"""
+    from claude_boost.search import main as search_main
+    search_main(args)
+
+def run_validate(args: List[str]):
+    """Run a validation command unless its inputs are unchanged"""
+    from claude_boost.validation import main as validate_main
+    validate_main(args)
+
+def run_memory(args: List[str]):
+    """Compact session records into long-term memory, or read it"""
+    from claude_boost.memory import main as memory_main
+    memory_main(args)
+
+def run_duplicates(args: List[str]):
+    """List indexed definitions that files' definitions may duplicate"""
+    from claude_boost.duplicates import main as duplicates_main
+    if not args:
+        args = ["--help"]
+    duplicates_main(args)
+
+def run_graph(args: List[str]):
+    """Show the call graph and the most central symbols"""
+    from claude_boost.callgraph import main as graph_main
+    graph_main(args)
+
+def run_slice(args: List[str]):
+    """Write a per-task slice of the project index"""
+    from claude_boost.slices import main as slice_main
+    slice_main(args)
+
+def run_deps(args: List[str]):
+    """Index installed dependencies into the shared cache"""
+    from claude_boost.deps import main as deps_main
+    deps_main(args)
+
+def run_workspaces(args: List[str]):
+    """Detect workspaces and build per-workspace indexes"""
+    from claude_boost.workspaces import main as workspaces_main
+    workspaces_main(args)
+
+def run_hostd(args: List[str]):
+    """Run the persistent hook host"""
+    from claude_boost import hostd
+    hostd.main(args)
+
+def run_dispatch(args: List[str]):
+    """Run all hooks for an event concurrently"""
+    from claude_boost import dispatch
+    dispatch.main(args)
+
+# Subcommand handlers import their modules on demand to keep startup fast
+COMMANDS = {
+    "init": run_init,
+    "upgrade": run_upgrade,
+    "context-size": run_context_size,
+    "index": run_index,
+    "search": run_search,
+    "slice": run_slice,
+    "graph": run_graph,
+    "validate": run_validate,
+    "memory": run_memory,
+    "duplicates": run_duplicates,
+    "deps": run_deps,
+    "workspaces": run_workspaces,
+    "hostd": run_hostd,
+    "dispatch": run_dispatch,
+}
+
+def print_help():
+    """Print CLI usage"""
+    print("Claude Code Boost - Supercharge your AI development workflow")
+    print("\nUsage:")
+    print("  claude-boost init    Initialize Claude Code Boost in current project")
+    print("  claude-boost init --config boost.toml --repos list.txt --jobs N")
+    print("                       Initialize many repositories at once")
+    print("  claude-boost upgrade Update installed templates (--dry-run to preview)")
+    print("  claude-boost context-size  Measure tokens loaded by CLAUDE.md and its @imports")
+    print("  claude-boost index   Generate PROJECT_INDEX.json with per-language timings")
+    print("  claude-boost index diff <old> <new>  Symbols added, removed or changed between snapshots")
+    print("  claude-boost index stats [index]     Memory of the parsed JSON vs the compact index")
+    print("  claude-boost index find <name>       Look up a symbol in PROJECT_INDEX.bin")
+    print("  claude-boost search <query>  Ranked search over names, arguments and docstrings")
+    print("  claude-boost slice --diff|--test ID|--trace FILE  Index slice for one task (--budget, --name)")
+    print("  claude-boost graph [top|callers NAME|callees NAME]  Call graph and most central symbols")
+    print("  claude-boost validate [--diff|--slice NAME|--files ...] -- CMD  Cached verdict until inputs change")
+    print("  claude-boost memory [compact|show|add|forget]  Deduplicated long-term memory of past sessions")
+    print("  claude-boost duplicates PATH...       Existing definitions new code may duplicate")
+    print("  claude-boost deps [build|show NAME]  Public APIs of installed packages, cached per version")
+    print("  claude-boost workspaces [list|build]  Detect monorepo workspaces and index each one")
+    print("  claude-boost hostd   Run the persistent hook host (start|stop|status)")
+    print("  claude-boost dispatch <event>  Run all hooks for an event concurrently")
+    print("  claude-boost --help  Show this help message")
+
+def main():
+    """Main CLI entry point"""
+    if len(sys.argv) > 1 and sys.argv[1] in ['--help', '-h']:
+        print_help()
+        return
+    
+    command = COMMANDS.get(sys.argv[1]) if len(sys.argv) > 1 else None
+    if command is None:
+        print("Usage: claude-boost init")
+        print("Run 'claude-boost --help' for more information")
+        return
+    
+    command(sys.argv[2:])
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
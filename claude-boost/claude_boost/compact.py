@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Compact Index
+Columnar, string-interned in-memory form of PROJECT_INDEX.json
+
+json.load turns the index into nested dicts and lists in which the same
+strings (`self`, `from typing import Dict, List`, file paths) are stored
+thousands of times. CompactIndex keeps every distinct string once in a
+string table and stores files and symbols as parallel typed arrays of
+integer ids:
+
+    files:   path, hash, size, mtime, first symbol, symbol count
+    symbols: kind, name, signature, line, file, parent (class of a method)
+
+Symbol ids are positions in the symbol arrays; a name lookup is one dict
+probe to an array of symbol ids. Records are only materialized as
+FoundSymbol tuples when a caller asks for them. Use this form for queries and in any
+long-running process instead of keeping the parsed JSON around.
+"""
+import sys
+import json
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+# Allow `python compact.py` to import sibling modules
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_boost.symbols import iter_symbols, record_hash
+
+KINDS = ["function", "class", "method", "constant", "export", "interface", "type",
+         "module", "table", "view", "index", "trigger", "import"]
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+NO_LINE = -1
+
+
+class FoundSymbol(NamedTuple):
+    id: int
+    kind: str
+    name: str
+    signature: str
+    line: Optional[int]
+    file: str
+
+
+class StringTable:
+    """Interned strings addressed by integer id"""
+
+    __slots__ = ("strings", "ids")
+
+    def __init__(self):
+        self.strings = []  # type: List[str]
+        self.ids = {}  # type: Dict[str, int]
+
+    def add(self, value: str) -> int:
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            value = sys.intern(value)
+            self.strings.append(value)
+            self.ids[value] = string_id
+        return string_id
+
+    def get(self, value: str) -> Optional[int]:
+        return self.ids.get(value)
+
+    def __getitem__(self, string_id: int) -> str:
+        return self.strings[string_id]
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+class CompactIndex:
+    """Columnar index of files and symbols"""
+
+    def __init__(self):
+        self.strings = StringTable()
+        # File columns
+        self.file_path = array("I")
+        self.file_hash = array("I")
+        self.file_size = array("Q")
+        self.file_mtime = array("d")
+        self.file_first_symbol = array("I")
+        self.file_symbol_count = array("I")
+        # Symbol columns
+        self.symbol_kind = array("B")
+        self.symbol_name = array("I")
+        self.symbol_signature = array("I")
+        self.symbol_line = array("i")
+        self.symbol_file = array("I")
+        self.symbol_parent = array("i")
+        # Lookups: string id → file id, name string id → symbol ids
+        self._file_ids = {}  # type: Dict[int, int]
+        self._by_name = {}  # type: Dict[int, array]
+
+    @classmethod
+    def from_index(cls, index: Dict[str, Any]) -> "CompactIndex":
+        compact = cls()
+        for path, record in (index.get("files") or {}).items():
+            compact.add_file(path, record)
+        return compact
+
+    @classmethod
+    def load(cls, path: Path) -> "CompactIndex":
+        with open(path, "r") as f:
+            return cls.from_index(json.load(f))
+
+    def add_file(self, path: str, record: Dict[str, Any]) -> int:
+        """Append one file record; returns its file id"""
+        strings = self.strings
+        file_id = len(self.file_path)
+        path_id = strings.add(path)
+        self._file_ids[path_id] = file_id
+        self.file_path.append(path_id)
+        self.file_hash.append(strings.add(record.get("hash") or record_hash(record)))
+        self.file_size.append(int(record.get("size") or 0))
+        self.file_mtime.append(float(record.get("modified") or 0.0))
+        self.file_first_symbol.append(len(self.symbol_kind))
+
+        count = 0
+        current_class = -1
+        for symbol in iter_symbols(record):
+            symbol_id = len(self.symbol_kind)
+            name_id = strings.add(symbol.name)
+            self.symbol_kind.append(KIND_CODES[symbol.kind])
+            self.symbol_name.append(name_id)
+            self.symbol_signature.append(strings.add(symbol.signature))
+            self.symbol_line.append(symbol.line if symbol.line is not None else NO_LINE)
+            self.symbol_file.append(file_id)
+            if symbol.kind == "class":
+                current_class = symbol_id
+            self.symbol_parent.append(current_class if symbol.kind == "method" else -1)
+
+            self._index_name(name_id, symbol_id)
+            if symbol.kind == "method":
+                # Methods are also found by their bare name
+                self._index_name(strings.add(symbol.name.rsplit(".", 1)[-1]), symbol_id)
+            count += 1
+        self.file_symbol_count.append(count)
+        return file_id
+
+    def _index_name(self, name_id: int, symbol_id: int):
+        ids = self._by_name.get(name_id)
+        if ids is None:
+            ids = self._by_name[name_id] = array("I")
+        ids.append(symbol_id)
+
+    # Queries
+
+    def __len__(self) -> int:
+        return len(self.file_path)
+
+    @property
+    def symbol_count(self) -> int:
+        return len(self.symbol_kind)
+
+    def paths(self) -> Iterator[str]:
+        strings = self.strings
+        return (strings[path_id] for path_id in self.file_path)
+
+    def file_id(self, path: str) -> Optional[int]:
+        path_id = self.strings.get(path)
+        return None if path_id is None else self._file_ids.get(path_id)
+
+    def file_hash_of(self, path: str) -> Optional[str]:
+        file_id = self.file_id(path)
+        return None if file_id is None else self.strings[self.file_hash[file_id]]
+
+    def symbol(self, symbol_id: int) -> FoundSymbol:
+        """Materialize one symbol"""
+        strings = self.strings
+        line = self.symbol_line[symbol_id]
+        return FoundSymbol(
+            symbol_id,
+            KINDS[self.symbol_kind[symbol_id]],
+            strings[self.symbol_name[symbol_id]],
+            strings[self.symbol_signature[symbol_id]],
+            None if line == NO_LINE else line,
+            strings[self.file_path[self.symbol_file[symbol_id]]],
+        )
+
+    def symbols_in(self, path: str) -> List[FoundSymbol]:
+        file_id = self.file_id(path)
+        if file_id is None:
+            return []
+        first = self.file_first_symbol[file_id]
+        return [self.symbol(i) for i in range(first, first + self.file_symbol_count[file_id])]
+
+    def find(self, name: str, kind: Optional[str] = None) -> List[FoundSymbol]:
+        """Symbols named `name` (methods match by bare or qualified name)"""
+        name_id = self.strings.get(name)
+        if name_id is None:
+            return []
+        ids = self._by_name.get(name_id, ())
+        if kind is not None:
+            code = KIND_CODES[kind]
+            return [self.symbol(i) for i in ids if self.symbol_kind[i] == code]
+        return [self.symbol(i) for i in ids]
+
+    def memory_bytes(self) -> int:
+        """Approximate resident size of the tables, strings and lookups"""
+        size = sum(sys.getsizeof(value) for value in self.strings.strings)
+        size += sys.getsizeof(self.strings.strings) + sys.getsizeof(self.strings.ids)
+        for column in (self.file_path, self.file_hash, self.file_size, self.file_mtime,
+                       self.file_first_symbol, self.file_symbol_count, self.symbol_kind,
+                       self.symbol_name, self.symbol_signature, self.symbol_line,
+                       self.symbol_file, self.symbol_parent):
+            size += sys.getsizeof(column)
+        size += sys.getsizeof(self._file_ids) + sys.getsizeof(self._by_name)
+        size += sum(sys.getsizeof(ids) for ids in self._by_name.values())
+        return size
+
+
+def main(argv: Optional[List[str]] = None):
+    """Compare the memory of the parsed JSON and the compact form of an index"""
+    import gc
+    import tracemalloc
+
+    argv = sys.argv[1:] if argv is None else argv
+    path = Path(argv[0] if argv else "PROJECT_INDEX.json")
+    raw = path.read_text(encoding="utf-8")
+
+    gc.collect()
+    tracemalloc.start()
+    parsed = json.loads(raw)
+    json_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Strings are shared with the parsed JSON, so the compact side is sized directly
+    compact = CompactIndex.from_index(parsed)
+    compact_bytes = compact.memory_bytes()
+
+    print(f"📦 {path}: {len(compact)} files, {compact.symbol_count} symbols, {len(compact.strings)} strings")
+    print(f"  Parsed JSON:   {json_bytes / 1024:>10,.0f} KiB")
+    print(f"  Compact index: {compact_bytes / 1024:>10,.0f} KiB ({json_bytes / max(compact_bytes, 1):.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
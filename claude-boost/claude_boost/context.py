@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Context Profiler
+Measures how many tokens CLAUDE.md and everything it imports costs
+
+Resolves `@path` imports in CLAUDE.md recursively (including
+@PROJECT_INDEX.json), counts tokens per source with a local approximate
+tokenizer, and breaks PROJECT_INDEX.json down by section so the largest
+contributors to the always-loaded context are visible. Agent and command
+templates are reported separately: they are loaded on demand, on top of
+the always-loaded context.
+
+Token counts are cached in ~/.cache/claude-boost/tokens.json keyed on the
+SHA-256 of the file contents.
+"""
+import os
+import re
+import sys
+import json
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+CONTEXT_WINDOW_TOKENS = 200000
+MAX_IMPORT_DEPTH = 5
+TOKEN_CACHE = Path.home() / ".cache" / "claude-boost" / "tokens.json"
+
+# `@path` at the start of a line or after whitespace; paths need a dot or a slash
+IMPORT_PATTERN = re.compile(r"(?:^|(?<=\s))@((?:~/|\.{0,2}/)?[\w.\-/]*[\w\-][\w.\-/]*)")
+FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+INLINE_CODE_PATTERN = re.compile(r"`[^`]*`")
+
+# Pieces the approximate tokenizer distinguishes
+TOKEN_PATTERN = re.compile(r"[A-Za-z]+|\d+|\s+|[^\sA-Za-z\d]")
+
+
+def count_tokens(text: str) -> int:
+    """Approximate BPE token count
+
+    Words cost one token per four letters, numbers one per three digits,
+    each punctuation character one, and each whitespace run one unless it
+    is a single space (which BPE vocabularies merge into the next word).
+    """
+    tokens = 0
+    for piece in TOKEN_PATTERN.findall(text):
+        first = piece[0]
+        if first.isalpha():
+            tokens += (len(piece) + 3) // 4
+        elif first.isdigit():
+            tokens += (len(piece) + 2) // 3
+        elif first.isspace():
+            if piece != " ":
+                tokens += 1
+        else:
+            tokens += 1
+    return tokens
+
+
+class TokenCache:
+    """Token counts keyed on content hash"""
+
+    def __init__(self, path: Path = TOKEN_CACHE):
+        self.path = path
+        self.dirty = False
+        try:
+            with open(path, "r") as f:
+                self.counts = json.load(f)
+        except (OSError, ValueError):
+            self.counts = {}
+
+    def count_file(self, path: Path) -> Dict[str, Any]:
+        """Token count and size of a file, from the cache when unchanged"""
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        tokens = self.counts.get(digest)
+        if tokens is None:
+            tokens = count_tokens(data.decode("utf-8", "replace"))
+            self.counts[digest] = tokens
+            self.dirty = True
+        return {"tokens": tokens, "bytes": len(data), "sha256": digest}
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(self.counts, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError:
+            pass
+
+
+def find_imports(text: str) -> List[str]:
+    """Extract @imports, ignoring code blocks and inline code"""
+    imports = []
+    in_fence = False
+    for line in text.splitlines():
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        line = INLINE_CODE_PATTERN.sub("", line)
+        for match in IMPORT_PATTERN.findall(line):
+            candidate = match.rstrip(".")
+            if "." in candidate or "/" in candidate:
+                imports.append(candidate)
+    return imports
+
+
+def resolve_import(reference: str, base_dir: Path) -> Path:
+    """Resolve an @import relative to the importing file"""
+    if reference.startswith("~/"):
+        return Path.home() / reference[2:]
+    return (base_dir / reference).resolve()
+
+
+def memory_files(root: Path) -> List[Path]:
+    """CLAUDE.md files Claude Code loads for a project"""
+    candidates = [root / "CLAUDE.md", root / ".claude" / "CLAUDE.md", root / "CLAUDE.local.md"]
+    return [path for path in candidates if path.is_file()]
+
+
+def on_demand_files(root: Path) -> List[Path]:
+    """Agent and command templates, loaded when invoked"""
+    files = []
+    for category in ("agents", "commands"):
+        files.extend(sorted((root / ".claude" / category).glob("*.md")))
+    return files
+
+
+def index_sections(index_path: Path) -> List[Dict[str, Any]]:
+    """Token cost of each PROJECT_INDEX.json section, largest first"""
+    try:
+        with open(index_path, "r") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return []
+
+    sections = {}  # type: Dict[str, int]
+    for key, value in index.items():
+        if key != "files":
+            sections[key] = count_tokens(json.dumps(value, indent=2, default=str))
+
+    # Files are broken down by field and by top-level directory
+    for file_path, info in (index.get("files") or {}).items():
+        top = file_path.split("/", 1)[0] if "/" in file_path else "."
+        file_tokens = 0
+        if isinstance(info, dict):
+            for field, value in info.items():
+                tokens = count_tokens(json.dumps(value, indent=2, default=str))
+                sections[f"files.*.{field}"] = sections.get(f"files.*.{field}", 0) + tokens
+                file_tokens += tokens
+        sections[f"files[{top}/]"] = sections.get(f"files[{top}/]", 0) + file_tokens
+
+    rows = [{"section": name, "tokens": tokens} for name, tokens in sections.items()]
+    rows.sort(key=lambda row: row["tokens"], reverse=True)
+    return rows
+
+
+def measure(root: Path = Path("."), cache: Optional[TokenCache] = None) -> Dict[str, Any]:
+    """Measure the always-loaded and on-demand context of a project"""
+    root = root.resolve()
+    cache = cache or TokenCache()
+    sources = []  # type: List[Dict[str, Any]]
+    seen = set()
+    missing = []  # type: List[str]
+
+    def visit(path: Path, depth: int, imported_by: Optional[str]):
+        path = path.resolve()
+        if path in seen:
+            return
+        seen.add(path)
+        if not path.is_file():
+            missing.append(str(path))
+            return
+
+        counted = cache.count_file(path)
+        sources.append({
+            "path": _display(path, root),
+            "depth": depth,
+            "imported_by": imported_by,
+            "tokens": counted["tokens"],
+            "bytes": counted["bytes"],
+        })
+        if depth >= MAX_IMPORT_DEPTH or path.suffix == ".json":
+            return
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return
+        for reference in find_imports(text):
+            visit(resolve_import(reference, path.parent), depth + 1, _display(path, root))
+
+    for memory_file in memory_files(root):
+        visit(memory_file, 0, None)
+
+    on_demand = []
+    for path in on_demand_files(root):
+        counted = cache.count_file(path)
+        on_demand.append({
+            "path": _display(path, root),
+            "kind": path.parent.name[:-1],
+            "tokens": counted["tokens"],
+            "bytes": counted["bytes"],
+        })
+    cache.save()
+
+    always_loaded = sum(source["tokens"] for source in sources)
+    index_path = root / "PROJECT_INDEX.json"
+    imports_index = any(source["path"] == "PROJECT_INDEX.json" for source in sources)
+    return {
+        "root": str(root),
+        "context_window_tokens": CONTEXT_WINDOW_TOKENS,
+        "always_loaded_tokens": always_loaded,
+        "always_loaded_percent": always_loaded / CONTEXT_WINDOW_TOKENS * 100,
+        "sources": sorted(sources, key=lambda source: source["tokens"], reverse=True),
+        "missing_imports": missing,
+        "on_demand": on_demand,
+        "index_sections": index_sections(index_path) if imports_index else [],
+    }
+
+
+def _display(path: Path, root: Path) -> str:
+    try:
+        return str(path.relative_to(root))
+    except ValueError:
+        return str(path)
+
+
+def print_report(report: Dict[str, Any], top: int = 10):
+    """Human-readable context report"""
+    window = report["context_window_tokens"]
+    print(f"🧠 Always-loaded context: {report['always_loaded_tokens']:,} tokens "
+          f"({report['always_loaded_percent']:.1f}% of {window:,})")
+    for source in report["sources"]:
+        indent = "  " * source["depth"]
+        print(f"  {source['tokens']:>8,}  {indent}{source['path']}")
+    for path in report["missing_imports"]:
+        print(f"  ⚠️ Missing import: {path}")
+
+    if report["index_sections"]:
+        print("\n📊 PROJECT_INDEX.json by section:")
+        for row in report["index_sections"][:top]:
+            print(f"  {row['tokens']:>8,}  {row['section']}")
+
+    if report["on_demand"]:
+        print("\n🤖 Loaded on demand (on top of the above):")
+        for item in sorted(report["on_demand"], key=lambda item: item["tokens"], reverse=True):
+            print(f"  {item['tokens']:>8,}  {item['path']} ({item['kind']})")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point for `claude-boost context-size`"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="claude-boost context-size",
+        description="Measure the tokens CLAUDE.md and its imports add to every session",
+    )
+    parser.add_argument("--root", default=".", help="Project root (default: current directory)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--top", type=int, default=10, help="Index sections to show")
+    args = parser.parse_args(argv)
+
+    report = measure(Path(args.root))
+    if not report["sources"]:
+        print("❌ No CLAUDE.md found; run `claude-boost init` first", file=sys.stderr)
+        sys.exit(1)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args.top)
+
+
+if __name__ == "__main__":
+    main()
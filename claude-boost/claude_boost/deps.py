@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Dependency Index
+Public APIs of installed packages, extracted once per package@version
+
+The project indexer skips site-packages and node_modules, so on its own
+the index says nothing about the libraries a project calls. This module
+extracts the public symbols of installed packages:
+
+- Python: the modules listed in a distribution's top_level.txt or RECORD
+- npm: the entry points named in package.json (types, module, main)
+
+Each package@version is written once to a shared cache,
+~/.cache/claude-boost/deps/<ecosystem>/<name>@<version>.json. Every
+project that depends on that version reuses the entry. Project indexes
+only list references to cache entries in a `dependencies` section.
+
+By default only the packages a project declares are indexed: package.json
+dependencies and devDependencies, requirements*.txt, and pyproject.toml
+dependencies. `--all` indexes everything installed. Undeclared packages
+are skipped before their files are listed, and a package's module tree
+is only walked when its cache entry is missing.
+"""
+import os
+import re
+import sys
+import json
+import time
+import glob
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+# Allow `python deps.py` to import sibling modules
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_boost import extractors
+from claude_boost.workspaces import _toml_list
+
+CACHE_DIR = Path.home() / ".cache" / "claude-boost" / "deps"
+CACHE_VERSION = 1
+MAX_MODULES = 300
+MAX_MODULE_BYTES = 512 * 1024
+# Package subtrees that are not API
+SKIP_PARTS = {"tests", "test", "testing", "_vendor", "vendor", "examples", "benchmarks", "__pycache__"}
+VENV_NAMES = [".venv", "venv", "env", ".env"]
+JS_ENTRY_FIELDS = ["types", "typings", "module", "main"]
+
+
+def normalize_name(name: str) -> str:
+    """PEP 503 normalized distribution name"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+class Package:
+    """One installed package version and the files holding its API"""
+
+    def __init__(self, ecosystem: str, name: str, version: str, base: Path,
+                 find_modules: Callable[[], Dict[str, Path]]):
+        self.ecosystem = ecosystem
+        self.name = name
+        self.version = version
+        self.base = base
+        self._find_modules = find_modules
+        self._modules = None  # type: Optional[Dict[str, Path]]
+
+    @property
+    def modules(self) -> Dict[str, Path]:
+        """Module name → file, listed on first use (only needed on a cache miss)"""
+        if self._modules is None:
+            self._modules = self._find_modules()
+        return self._modules
+
+    @property
+    def key(self) -> str:
+        # Scoped npm names contain a slash
+        return f"{self.ecosystem}/{self.name.replace('/', '__')}@{self.version}.json"
+
+
+# Discovery
+
+def site_packages(root: Path, include_current: bool = False) -> List[Path]:
+    """site-packages of the project's virtualenvs (and optionally of this interpreter)"""
+    found = []
+    for name in VENV_NAMES:
+        venv = root / name
+        found += [Path(p) for p in glob.glob(str(venv / "lib" / "python*" / "site-packages"))]
+        if (venv / "Lib" / "site-packages").is_dir():
+            found.append(venv / "Lib" / "site-packages")
+    if include_current:
+        import site
+        found += [Path(p) for p in site.getsitepackages() if Path(p).is_dir()]
+    return list(dict.fromkeys(found))
+
+
+def _metadata(dist_info: Path) -> Dict[str, str]:
+    fields = {}
+    try:
+        with open(dist_info / "METADATA", "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip():
+                    break
+                key, _, value = line.partition(":")
+                if key in ("Name", "Version"):
+                    fields[key] = value.strip()
+    except OSError:
+        pass
+    return fields
+
+
+def _python_modules(site: Path, dist_info: Path) -> Dict[str, Path]:
+    """Dotted module name → file for the public modules of a distribution"""
+    tops = []  # type: List[str]
+    try:
+        tops = [line.strip() for line in (dist_info / "top_level.txt").read_text().splitlines() if line.strip()]
+    except OSError:
+        try:
+            for line in (dist_info / "RECORD").read_text(encoding="utf-8", errors="replace").splitlines():
+                path = line.split(",", 1)[0]
+                if path.endswith(".py") and not path.startswith(".."):
+                    top = path.split("/", 1)[0]
+                    tops.append(top[:-3] if top.endswith(".py") else top)
+        except OSError:
+            pass
+
+    modules = {}  # type: Dict[str, Path]
+    for top in dict.fromkeys(tops):
+        if top.startswith("_"):
+            continue
+        single = site / f"{top}.py"
+        if single.is_file():
+            modules[top] = single
+            continue
+        package = site / top
+        if not package.is_dir():
+            continue
+        for dirpath, dirnames, filenames in os.walk(package):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith("_") and d not in SKIP_PARTS)
+            rel = Path(dirpath).relative_to(site).parts
+            for name in sorted(filenames):
+                if not name.endswith(".py") or (name.startswith("_") and name != "__init__.py"):
+                    continue
+                parts = list(rel) if name == "__init__.py" else list(rel) + [name[:-3]]
+                modules[".".join(parts)] = Path(dirpath) / name
+                if len(modules) >= MAX_MODULES:
+                    return modules
+    return modules
+
+
+def python_packages(root: Path, include_current: bool = False,
+                    names: Optional[Set[str]] = None) -> Iterator[Package]:
+    """Installed distributions, only those in `names` when given"""
+    for site in site_packages(root, include_current):
+        for dist_info in sorted(site.glob("*.dist-info")):
+            fields = _metadata(dist_info)
+            if "Name" not in fields or "Version" not in fields:
+                continue
+            name = normalize_name(fields["Name"])
+            if names is None or name in names:
+                yield Package("pypi", name, fields["Version"], site, partial(_python_modules, site, dist_info))
+
+
+def _js_entries(directory: Path, manifest: Dict[str, Any]) -> Dict[str, Path]:
+    entries = {}  # type: Dict[str, Path]
+    exports = manifest.get("exports")
+    candidates = [manifest.get(field) for field in JS_ENTRY_FIELDS]
+    if isinstance(exports, str):
+        candidates.append(exports)
+    elif isinstance(exports, dict):
+        root_export = exports.get(".", exports)
+        if isinstance(root_export, str):
+            candidates.append(root_export)
+        elif isinstance(root_export, dict):
+            candidates += [value for value in root_export.values() if isinstance(value, str)]
+    candidates.append("index.js")
+    for candidate in candidates:
+        if not isinstance(candidate, str):
+            continue
+        path = (directory / candidate).resolve()
+        for option in (path, path.with_suffix(".js"), path / "index.js", path / "index.d.ts"):
+            if option.is_file() and option.suffix in (".js", ".mjs", ".cjs", ".ts") and option not in entries.values():
+                entries[candidate] = option
+                break
+    return entries
+
+
+def node_packages(root: Path, names: Optional[Set[str]] = None) -> Iterator[Package]:
+    """Packages in node_modules, only those in `names` when given"""
+    modules_dir = root / "node_modules"
+    if not modules_dir.is_dir():
+        return
+    directories = []
+    for child in sorted(modules_dir.iterdir()):
+        if child.name.startswith("@") and child.is_dir():
+            directories += sorted(p for p in child.iterdir() if p.is_dir())
+        elif child.is_dir() and not child.name.startswith("."):
+            directories.append(child)
+    for directory in directories:
+        try:
+            manifest = json.loads((directory / "package.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if not isinstance(manifest, dict) or not manifest.get("name") or not manifest.get("version"):
+            continue
+        if names is None or manifest["name"] in names:
+            yield Package("npm", manifest["name"], manifest["version"], directory,
+                          partial(_js_entries, directory, manifest))
+
+
+def declared_dependencies(root: Path) -> Dict[str, Set[str]]:
+    """Names of the dependencies a project declares, per ecosystem"""
+    declared = {"pypi": set(), "npm": set()}  # type: Dict[str, Set[str]]
+    try:
+        manifest = json.loads((root / "package.json").read_text(encoding="utf-8"))
+        for field in ("dependencies", "devDependencies", "peerDependencies", "optionalDependencies"):
+            declared["npm"].update((manifest.get(field) or {}).keys())
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    requirements = []  # type: List[str]
+    for path in sorted(root.glob("requirements*.txt")):
+        try:
+            requirements += path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            continue
+    try:
+        pyproject = (root / "pyproject.toml").read_text(encoding="utf-8")
+        requirements += _toml_list(pyproject, "project", "dependencies")
+        poetry = re.search(r"^\[tool\.poetry\.dependencies\]\s*$(.*?)(?=^\[|\Z)", pyproject, re.M | re.S)
+        if poetry:
+            requirements += re.findall(r"^([A-Za-z0-9][\w.-]*)\s*=", poetry.group(1), re.M)
+    except OSError:
+        pass
+    for line in requirements:
+        match = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)", line)
+        if match and match.group(1) != "python":
+            declared["pypi"].add(normalize_name(match.group(1)))
+    return declared
+
+
+# Extraction
+
+def _public(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Symbols a module exposes: __all__ when declared, else names without a leading underscore"""
+    exported = set(record.get("exports") or [])
+
+    def visible(name: str) -> bool:
+        return name in exported if exported else not name.startswith("_")
+
+    api = {}  # type: Dict[str, Any]
+    functions = [f for f in record.get("functions") or []
+                 if visible(f["name"] if isinstance(f, dict) else str(f))]
+    classes = []
+    for item in record.get("classes") or []:
+        if not isinstance(item, dict):
+            if visible(str(item)):
+                classes.append(item)
+            continue
+        if visible(item["name"]):
+            item = dict(item, methods=[m for m in item.get("methods") or []
+                                       if not m["name"].startswith("_") or m["name"] == "__init__"])
+            classes.append(item)
+    for key, value in (("functions", functions), ("classes", classes)):
+        if value:
+            api[key] = value
+    for field in ("constants", "interfaces", "types"):
+        names = [name for name in record.get(field) or [] if visible(str(name))]
+        if names:
+            api[field] = names
+    if exported and record.get("exports"):
+        api["exports"] = record["exports"]
+    return api
+
+
+def extract_package(package: Package) -> Dict[str, Any]:
+    """Public API of one package, module by module"""
+    started = time.perf_counter()
+    modules = {}  # type: Dict[str, Any]
+    errors = 0
+    for module, path in package.modules.items():
+        extract = extractors.get_extractor(".js" if path.suffix in (".mjs", ".cjs") else path.suffix)
+        if extract is None:
+            continue
+        try:
+            if path.stat().st_size > MAX_MODULE_BYTES:
+                continue
+            api = _public(extract(path.read_text(encoding="utf-8", errors="replace")))
+        except Exception:
+            errors += 1
+            continue
+        if api:
+            modules[module] = api
+    return {
+        "cache_version": CACHE_VERSION,
+        "ecosystem": package.ecosystem,
+        "name": package.name,
+        "version": package.version,
+        "extracted_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "modules": modules,
+        "summary": {
+            "modules": len(modules),
+            "symbols": sum(len(api.get("functions", [])) + len(api.get("classes", [])) for api in modules.values()),
+            "errors": errors,
+            "seconds": round(time.perf_counter() - started, 3),
+        },
+    }
+
+
+def load_entry(key: str, cache_dir: Path = CACHE_DIR) -> Optional[Dict[str, Any]]:
+    try:
+        with open(cache_dir / key, "r") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return entry if entry.get("cache_version") == CACHE_VERSION else None
+
+
+def cached_entry(package: Package, cache_dir: Path = CACHE_DIR) -> tuple:
+    """(entry, extracted now?) for a package, extracting it on a cache miss"""
+    entry = load_entry(package.key, cache_dir)
+    if entry is not None:
+        return entry, False
+    entry = extract_package(package)
+    path = cache_dir / package.key
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique temp name: several projects may fill the same entry at once
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(entry, f)
+    os.replace(tmp_path, path)
+    return entry, True
+
+
+def index_dependencies(root: Path, include_all: bool = False, include_current: bool = False,
+                       cache_dir: Path = CACHE_DIR) -> Dict[str, Any]:
+    """Cache every (declared) installed package and return references for the project index"""
+    started = time.perf_counter()
+    declared = declared_dependencies(root)
+    wanted = {ecosystem: None if include_all else names
+              for ecosystem, names in declared.items()}  # type: Dict[str, Optional[Set[str]]]
+    references = []
+    extracted = 0
+    packages = list(python_packages(root, include_current, wanted["pypi"])) + list(node_packages(root, wanted["npm"]))
+    for package in packages:
+        entry, fresh = cached_entry(package, cache_dir)
+        extracted += fresh
+        references.append({
+            "ecosystem": package.ecosystem,
+            "name": package.name,
+            "version": package.version,
+            "cache": package.key,
+            "modules": entry["summary"]["modules"],
+            "symbols": entry["summary"]["symbols"],
+        })
+    return {
+        "packages": references,
+        "extracted": extracted,
+        "cached": len(references) - extracted,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point for `claude-boost deps`"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="claude-boost deps",
+                                     description="Index the public APIs of installed dependencies")
+    parser.add_argument("action", nargs="?", default="build", choices=["build", "show"])
+    parser.add_argument("package", nargs="?", help="Package name for `show`")
+    parser.add_argument("--root", default=".", help="Project root (default: current directory)")
+    parser.add_argument("--all", action="store_true", help="Index every installed package, not just declared ones")
+    parser.add_argument("--system", action="store_true", help="Also scan this interpreter's site-packages")
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args(argv)
+    root = Path(args.root)
+
+    result = index_dependencies(root, args.all, args.system)
+    if args.action == "show":
+        matches = [ref for ref in result["packages"] if ref["name"] in (args.package, normalize_name(args.package or ""))]
+        if not matches:
+            print(f"❌ {args.package} is not an indexed dependency", file=sys.stderr)
+            sys.exit(1)
+        entry = load_entry(matches[0]["cache"])
+        if args.json:
+            print(json.dumps(entry, indent=2))
+            return
+        print(f"📦 {entry['name']}@{entry['version']} ({entry['summary']['modules']} modules)")
+        for module, api in sorted(entry["modules"].items()):
+            names = [f["name"] if isinstance(f, dict) else f for f in api.get("functions", [])]
+            names += [c["name"] if isinstance(c, dict) else c for c in api.get("classes", [])]
+            if names:
+                print(f"  {module}: {', '.join(names[:12])}{' …' if len(names) > 12 else ''}")
+        return
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    print(f"📚 {len(result['packages'])} dependencies: {result['extracted']} extracted, "
+          f"{result['cached']} from {CACHE_DIR} ({result['seconds']:.2f}s)")
+    for ref in result["packages"]:
+        print(f"  {ref['ecosystem']:<5} {ref['name']}@{ref['version']}: {ref['modules']} modules, {ref['symbols']} symbols")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Hook Dispatcher
+Runs every hook registered for one event concurrently
+
+Installed next to the hooks in .claude/hooks and configured once per event:
+
+    python "$CLAUDE_PROJECT_DIR/.claude/hooks/dispatch.py" PostToolUse
+
+Hooks come in three kinds:
+- blocking: awaited; exit code 2 vetoes the tool call (pre-commit-validator)
+- foreground: awaited for their output (session-state-manager on SessionStart,
+  the duplicate guard on Write/Edit)
+- background: queued to .claude/queue and run by a detached drainer
+  (workspace re-indexing, token-tracker), so they never sit on the critical path
+
+Hooks are started through hostc.py when it is installed, so a running
+hook host (hostd.py) serves them from preloaded scripts; without one the
+client runs the hook in-process.
+
+A background hook marked "coalesce" runs once for all of its queued jobs,
+with their payloads concatenated on stdin, so a burst of edits costs one
+re-index rather than one per edit.
+
+The defaults below can be overridden per event in .claude/dispatch.json.
+This file must only depend on the standard library.
+"""
+import os
+import re
+import sys
+import json
+import time
+import asyncio
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_HOOKS = {
+    "PreToolUse": [
+        {"script": "pre-commit-validator.py", "matcher": "Bash", "mode": "blocking", "timeout": 30},
+        # Warns about likely duplicate definitions; bounds itself to 50ms
+        {"script": "duplicates.py", "matcher": "Edit|MultiEdit|Write", "mode": "foreground", "timeout": 2},
+    ],
+    "PostToolUse": [
+        # Re-indexes only the workspace owning the edited file
+        {"script": "workspaces.py", "args": ["update"], "matcher": "Edit|MultiEdit|Write",
+         "mode": "background", "coalesce": True, "timeout": 120},
+        {"script": "token-tracker.py", "mode": "background", "timeout": 10},
+    ],
+    "SessionStart": [
+        {"script": "session-state-manager.py", "mode": "foreground", "timeout": 10},
+    ],
+    "SessionEnd": [
+        {"script": "session-state-manager.py", "mode": "foreground", "timeout": 10},
+    ],
+}
+
+VETO_EXIT_CODE = 2
+HOST_CLIENT = "hostc.py"
+
+
+def hooks_dir() -> Path:
+    """Directory holding the hook scripts"""
+    project_dir = os.environ.get("CLAUDE_PROJECT_DIR")
+    if project_dir:
+        return Path(project_dir) / ".claude" / "hooks"
+    here = Path(__file__).resolve().parent
+    if here.name == "hooks":
+        return here
+    return Path.cwd() / ".claude" / "hooks"
+
+
+def queue_dir() -> Path:
+    """Directory holding queued background hook jobs"""
+    return hooks_dir().parent / "queue"
+
+
+def load_hooks(event: str) -> List[Dict[str, Any]]:
+    """Return the hooks configured for an event"""
+    config_file = hooks_dir().parent / "dispatch.json"
+    if config_file.exists():
+        try:
+            with open(config_file, "r") as f:
+                config = json.load(f)
+            if event in config:
+                return config[event]
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring invalid {config_file}: {e}", file=sys.stderr)
+    return DEFAULT_HOOKS.get(event, [])
+
+
+def matches(hook: Dict[str, Any], payload: Dict[str, Any]) -> bool:
+    """Check a hook's tool matcher against the event payload"""
+    matcher = hook.get("matcher")
+    if not matcher or matcher == "*":
+        return True
+    return re.fullmatch(matcher, payload.get("tool_name") or "") is not None
+
+
+def hook_command(hook: Dict[str, Any]) -> List[str]:
+    """Build the command line for a hook, through the hook host client when installed"""
+    script = [str(hooks_dir() / hook["script"])] + list(hook.get("args", []))
+    client = hooks_dir() / HOST_CLIENT
+    if client.exists():
+        # hostc.py hands the event to a running hostd and runs it in-process otherwise
+        return [sys.executable, str(client)] + script
+    return [sys.executable] + script
+
+
+async def run_hook(hook: Dict[str, Any], stdin: bytes) -> Tuple[int, bytes, bytes]:
+    """Run one hook as a subprocess, killing it when it exceeds its timeout"""
+    timeout = hook.get("timeout", 60)
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *hook_command(hook),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError as e:
+        return 1, b"", f"{hook['script']}: {e}\n".encode()
+
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(stdin), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return 1, b"", f"{hook['script']}: timed out after {timeout}s\n".encode()
+    return proc.returncode, stdout, stderr
+
+
+async def run_foreground(hooks: List[Dict[str, Any]], stdin: bytes) -> List[Tuple[int, bytes, bytes]]:
+    """Run all foreground hooks concurrently"""
+    return await asyncio.gather(*(run_hook(hook, stdin) for hook in hooks))
+
+
+def merge_stdout(outputs: List[bytes]) -> str:
+    """Combine hook outputs so Claude Code still receives a single JSON object"""
+    texts = [out.decode("utf-8", "replace").strip() for out in outputs]
+    texts = [text for text in texts if text]
+    if len(texts) <= 1:
+        return texts[0] if texts else ""
+
+    try:
+        objects = [json.loads(text) for text in texts]
+    except ValueError:
+        return "\n".join(texts)
+    if not all(isinstance(obj, dict) for obj in objects):
+        return "\n".join(texts)
+
+    merged = {}  # type: Dict[str, Any]
+    contexts = []
+    for obj in objects:
+        specific = obj.get("hookSpecificOutput")
+        if isinstance(specific, dict) and specific.get("additionalContext"):
+            contexts.append(specific["additionalContext"])
+        for key, value in obj.items():
+            if key == "hookSpecificOutput" and isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key].update(value)
+            else:
+                # Including null or a scalar where a hook would print an object: the last value wins
+                merged[key] = value
+    if contexts:
+        if not isinstance(merged.get("hookSpecificOutput"), dict):
+            merged["hookSpecificOutput"] = {}
+        merged["hookSpecificOutput"]["additionalContext"] = "\n".join(contexts)
+    return json.dumps(merged)
+
+
+def enqueue(hook: Dict[str, Any], stdin: bytes):
+    """Write a background job to the queue atomically"""
+    directory = queue_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    job = {
+        "script": hook["script"],
+        "args": hook.get("args", []),
+        "timeout": hook.get("timeout", 60),
+        "coalesce": bool(hook.get("coalesce")),
+        "stdin": stdin.decode("utf-8", "replace"),
+        "queued_at": time.time(),
+    }
+    name = f"{time.time_ns()}-{os.getpid()}-{hook['script']}.json"
+    tmp_path = directory / f".{name}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(job, f)
+    os.replace(tmp_path, directory / name)
+
+
+def spawn_drainer():
+    """Start a detached drainer; it exits at once if another one is running"""
+    kwargs = {}  # type: Dict[str, Any]
+    if os.name == "nt":
+        kwargs["creationflags"] = getattr(subprocess, "DETACHED_PROCESS", 0)
+    else:
+        kwargs["start_new_session"] = True
+    subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--drain"],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        env=dict(os.environ, CLAUDE_PROJECT_DIR=str(hooks_dir().parent.parent)),
+        **kwargs
+    )
+
+
+def try_lock(lock_file):
+    """Take the drainer lock without waiting; True when acquired"""
+    try:
+        import fcntl
+    except ImportError:
+        # No advisory locks on this platform: every drainer runs
+        return True
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def unlock(lock_file):
+    """Release the drainer lock"""
+    try:
+        import fcntl
+    except ImportError:
+        return
+    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def log_error(message: str):
+    """Background hooks have no terminal, so failures go to the error log"""
+    log_dir = hooks_dir().parent / "analytics"
+    try:
+        log_dir.mkdir(parents=True, exist_ok=True)
+        with open(log_dir / "errors.log", "a") as f:
+            f.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')} {message}\n")
+    except OSError:
+        pass
+
+
+def drain_queue() -> int:
+    """Run queued background jobs one at a time until the queue is empty"""
+    directory = queue_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    processed = 0
+
+    with open(directory / ".lock", "a") as lock_file:
+        while True:
+            if not try_lock(lock_file):
+                return processed
+            try:
+                while True:
+                    jobs = sorted(directory.glob("*.json"))
+                    if not jobs:
+                        break
+                    for job_path in jobs:
+                        processed += run_job(job_path)
+            finally:
+                unlock(lock_file)
+            # A job may have been queued between the last scan and unlocking,
+            # by a dispatcher whose drainer saw the lock held and gave up
+            if not any(directory.glob("*.json")):
+                return processed
+
+
+def read_job(job_path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(job_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def run_job(job_path: Path) -> int:
+    """Claim and run one queued job; returns 1 if it was run"""
+    job = read_job(job_path)
+    try:
+        os.unlink(job_path)
+    except OSError:
+        return 0
+    if job is None:
+        return 0
+
+    if job.get("coalesce"):
+        # Fold the other queued jobs of the same hook into this run; only
+        # the drainer holding the lock removes jobs, so nothing races us
+        for other_path in sorted(job_path.parent.glob(f"*-{job['script']}.json")):
+            other = read_job(other_path)
+            if other and other["script"] == job["script"] and other.get("args") == job.get("args"):
+                job["stdin"] += "\n" + other["stdin"]
+                try:
+                    os.unlink(other_path)
+                except OSError:
+                    pass
+
+    try:
+        result = subprocess.run(
+            hook_command(job), input=job["stdin"].encode("utf-8"),
+            capture_output=True, timeout=job.get("timeout", 60),
+            cwd=str(hooks_dir().parent.parent),
+        )
+        if result.returncode != 0:
+            log_error(f"{job['script']} exited {result.returncode}: "
+                      f"{result.stderr.decode('utf-8', 'replace').strip()}")
+    except subprocess.TimeoutExpired:
+        log_error(f"{job['script']} timed out after {job.get('timeout', 60)}s")
+    except OSError as e:
+        log_error(f"{job['script']} could not start: {e}")
+    return 1
+
+
+def dispatch(event: str, stdin: bytes) -> int:
+    """Fan one hook event out to its hooks and return the combined exit code"""
+    try:
+        payload = json.loads(stdin.decode("utf-8") or "{}")
+    except ValueError:
+        payload = {}
+
+    selected = [hook for hook in load_hooks(event)
+                if matches(hook, payload) and (hooks_dir() / hook["script"]).exists()]
+    background = [hook for hook in selected if hook.get("mode") == "background"]
+    foreground = [hook for hook in selected if hook.get("mode") != "background"]
+
+    for hook in background:
+        enqueue(hook, stdin)
+    if background:
+        spawn_drainer()
+
+    if not foreground:
+        return 0
+
+    results = asyncio.run(run_foreground(foreground, stdin))
+
+    exit_code = 0
+    for hook, (code, _, stderr) in zip(foreground, results):
+        if stderr:
+            sys.stderr.write(stderr.decode("utf-8", "replace"))
+        if code == VETO_EXIT_CODE and hook.get("mode") == "blocking":
+            exit_code = VETO_EXIT_CODE
+        elif code != 0 and exit_code == 0:
+            exit_code = 1
+
+    output = merge_stdout([stdout for _, stdout, _ in results])
+    if output:
+        print(output)
+    return exit_code
+
+
+def main(argv: Optional[List[str]] = None):
+    """Dispatcher entry point: dispatch.py <event> | --drain"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: dispatch.py <HookEvent> | --drain", file=sys.stderr)
+        sys.exit(1)
+
+    if argv[0] == "--drain":
+        drain_queue()
+        return
+
+    stdin = b"" if sys.stdin is None or sys.stdin.isatty() else sys.stdin.buffer.read()
+    sys.exit(dispatch(argv[0], stdin))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Duplicate Guard
+Warns before a Write or Edit adds a definition the project already has
+
+Configured as a PreToolUse hook on Write|Edit|MultiEdit (see dispatch.py),
+it reads the hook payload from stdin and parses only the definitions the
+tool call adds: those of the new text that the replaced text did not
+already define. Each one is looked up in PROJECT_INDEX.search.db, whose
+docs table carries two precomputed keys per symbol:
+
+- key: the identifier words joined by "_", so load_config, loadConfig
+  and LoadConfig are one name
+- shape: the sorted distinct words of the name after folding synonyms
+  (fetch/load/read → get, remove/delete → delete, ...) and plurals, so
+  fetchUsers and get_user share a shape; single-word names have none
+
+Both are indexed columns, so a lookup costs well under a millisecond
+however large the project is. The whole check runs against a hard
+BUDGET_MS deadline counted from the start of the script, imports
+included (under the hook host they are already loaded): name matches
+are looked up for every new definition first, shape matches only while
+at least SHAPE_RESERVE_MS remains, and a SQLite progress handler aborts
+any query that would overrun. A tight budget therefore degrades the
+check to name-only matching rather than delaying the tool call, as does
+a search database built before the key and shape columns existed.
+
+Possible duplicates come back as hook output (additionalContext for
+Claude, systemMessage for the user); the tool call is never blocked.
+Without a search database (`claude-boost index` builds one) the guard
+stays silent.
+
+    claude-boost duplicates src/new_module.py   # check a file by hand
+
+Installed next to the hooks in .claude/hooks; must only depend on the
+standard library.
+"""
+import time
+
+# The budget counts from here, imports included
+_STARTED = time.perf_counter()
+
+import os
+import re
+import sys
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+SEARCH_NAME = "PROJECT_INDEX.search.db"
+# Search schema versions that carry the key and shape columns
+SHAPE_SCHEMA_VERSIONS = {"3"}
+BUDGET_MS = 50.0
+# Shape lookups start only with this much of the budget left
+SHAPE_RESERVE_MS = 5.0
+MAX_DEFINITIONS = 30
+MAX_MATCHES = 3
+WRITE_TOOLS = {"Write", "Edit", "MultiEdit"}
+
+WORD = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+# Verbs that name the same operation
+SYNONYMS = {
+    "fetch": "get", "load": "get", "read": "get", "retrieve": "get", "lookup": "get", "find": "get",
+    "create": "make", "build": "make", "new": "make", "generate": "make",
+    "remove": "delete", "del": "delete", "drop": "delete", "destroy": "delete",
+    "validate": "check", "verify": "check", "ensure": "check", "is": "check",
+    "save": "write", "store": "write", "persist": "write", "dump": "write",
+    "decode": "parse", "deserialize": "parse", "encode": "format", "serialize": "format", "render": "format",
+    "calc": "compute", "calculate": "compute",
+    "cfg": "config", "conf": "config", "settings": "config", "configuration": "config",
+    "init": "setup", "initialize": "setup",
+}
+NAME_STOPWORDS = {"a", "an", "the", "of", "to", "for", "and", "or", "by", "from", "with", "in", "on", "at"}
+# Names every module may define without duplicating anything
+COMMON_NAMES = {"main", "run", "setup", "teardown", "get", "set", "update", "close", "start", "stop", "default"}
+# Tests are named after what they test, not duplicates of it (test_x, TestX, TestX.test_y)
+TEST_NAME = re.compile(r"(?:test_|Test[A-Z])")
+
+
+class Definition(NamedTuple):
+    kind: str
+    name: str
+    signature: str
+    line: int
+
+
+def words(name: str) -> List[str]:
+    """Lowercased identifier words of a name (`loadConfig` → load, config)"""
+    return [match.lower() for match in WORD.findall(name.rpartition(".")[2])]
+
+
+def name_key(name: str) -> str:
+    return "_".join(words(name))
+
+
+def _fold(word: str) -> str:
+    word = SYNONYMS.get(word, word)
+    if len(word) > 4 and word.endswith("ies"):
+        word = word[:-3] + "y"
+    elif len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+    return SYNONYMS.get(word, word)
+
+
+def shape(name: str) -> Optional[str]:
+    """Synonym-folded, order-free word set of a name; None for one-word names"""
+    folded = sorted({_fold(word) for word in words(name) if word not in NAME_STOPWORDS})
+    return "|".join(folded) if len(folded) > 1 else None
+
+
+def arity(signature: str) -> Optional[int]:
+    """Parameter count of a signature, not counting self, cls or catch-alls"""
+    opened = signature.find("(")
+    if opened < 0:
+        return None
+    inner = signature[opened + 1:signature.rfind(")")]
+    params = [part.strip() for part in inner.split(",") if part.strip()]
+    return len([part for part in params if part.split(":")[0].strip("&* ") not in ("self", "cls", "mut self", "")
+                and not part.startswith("*") and not part.startswith("...")])
+
+
+# New definitions
+
+PATTERNS = {
+    "python": [
+        ("class", re.compile(r"^(?P<indent>[ \t]*)class\s+(?P<name>\w+)\s*(?P<args>\([^)]*\))?", re.M)),
+        ("function", re.compile(r"^(?P<indent>[ \t]*)(?:async\s+)?def\s+(?P<name>\w+)\s*\((?P<args>[^)]*)", re.M)),
+    ],
+    "javascript": [
+        ("class", re.compile(r"^(?P<indent>[ \t]*)(?:export\s+(?:default\s+)?)?class\s+(?P<name>\w+)", re.M)),
+        ("function", re.compile(r"^(?P<indent>[ \t]*)(?:export\s+(?:default\s+)?)?(?:async\s+)?function\s*\*?\s*"
+                                r"(?P<name>\w+)\s*\((?P<args>[^)]*)", re.M)),
+        ("function", re.compile(r"^(?P<indent>[ \t]*)(?:export\s+)?(?:const|let|var)\s+(?P<name>\w+)\s*=\s*"
+                                r"(?:async\s+)?(?:function\b[^(]*)?\((?P<args>[^)]*)\)\s*(?:=>|\{)", re.M)),
+    ],
+    "go": [
+        ("class", re.compile(r"^(?P<indent>)type\s+(?P<name>\w+)\s+(?:struct|interface)\b", re.M)),
+        ("function", re.compile(r"^(?P<indent>)func\s+(?:\((?P<receiver>[^)]*)\)\s*)?(?P<name>\w+)\s*"
+                                r"\((?P<args>[^)]*)", re.M)),
+    ],
+    "rust": [
+        # Owns the methods that follow; not a definition itself
+        ("impl", re.compile(r"^(?P<indent>[ \t]*)impl\b(?:\s*<[^>]*>)?\s+(?:[\w:]+(?:<[^>]*>)?\s+for\s+)?"
+                            r"(?P<name>\w+)", re.M)),
+        ("class", re.compile(r"^(?P<indent>[ \t]*)(?:pub(?:\([^)]*\))?\s+)?(?:struct|enum|trait)\s+(?P<name>\w+)", re.M)),
+        ("function", re.compile(r"^(?P<indent>[ \t]*)(?:pub(?:\([^)]*\))?\s+)?(?:async\s+)?(?:unsafe\s+)?fn\s+"
+                                r"(?P<name>\w+)\s*(?:<[^>]*>)?\s*\((?P<args>[^)]*)", re.M)),
+    ],
+}
+LANGUAGES = {
+    ".py": "python", ".pyi": "python",
+    ".js": "javascript", ".jsx": "javascript", ".mjs": "javascript", ".cjs": "javascript",
+    ".ts": "javascript", ".tsx": "javascript",
+    ".go": "go", ".rs": "rust",
+}
+
+
+def definitions(text: str, language: str) -> Iterator[Definition]:
+    """Top-level functions, classes and methods a piece of source defines, by pattern"""
+    found = []  # type: List[Tuple[int, str, re.Match]]
+    for kind, pattern in PATTERNS.get(language, ()):
+        found.extend((match.start(), kind, match) for match in pattern.finditer(text))
+    classes = []  # type: List[Tuple[int, str]]
+    for position, kind, match in sorted(found, key=lambda item: item[0]):
+        indent = len(match.group("indent").expandtabs(4))
+        line = text.count("\n", 0, position) + 1
+        name = match.group("name")
+        if kind in ("class", "impl"):
+            classes = [(depth, owner) for depth, owner in classes if depth < indent] + [(indent, name)]
+            if kind == "impl":
+                continue
+            yield Definition("class", name, name + (match.groupdict().get("args") or ""), line)
+            continue
+        receiver = match.groupdict().get("receiver")
+        classes = [(depth, owner) for depth, owner in classes if depth < indent]
+        owner = classes[-1][1] if classes and indent > 0 else None
+        if receiver:
+            owner = receiver.split()[-1].lstrip("*")
+        if owner:
+            yield Definition("method", f"{owner}.{name}", f"{owner}.{name}({match.group('args').strip()})", line)
+        elif indent == 0 or language != "python":
+            yield Definition("function", name, f"{name}({match.group('args').strip()})", line)
+
+
+def new_definitions(tool_name: str, tool_input: Dict[str, Any]) -> List[Definition]:
+    """Definitions a Write/Edit/MultiEdit call adds"""
+    language = LANGUAGES.get(Path(tool_input.get("file_path") or "").suffix.lower())
+    if language is None:
+        return []
+    if tool_name == "Write":
+        pairs = [("", tool_input.get("content") or "")]
+    elif tool_name == "MultiEdit":
+        pairs = [(edit.get("old_string") or "", edit.get("new_string") or "")
+                 for edit in tool_input.get("edits") or [] if isinstance(edit, dict)]
+    else:
+        pairs = [(tool_input.get("old_string") or "", tool_input.get("new_string") or "")]
+
+    added = []  # type: List[Definition]
+    for old, new in pairs:
+        existing = {definition.name for definition in definitions(old, language)}
+        added += [definition for definition in definitions(new, language)
+                  if definition.name not in existing and not definition.name.rpartition(".")[2].startswith("_")
+                  and name_key(definition.name) not in COMMON_NAMES and not TEST_NAME.match(definition.name)]
+    return added[:MAX_DEFINITIONS]
+
+
+# Lookup
+
+def search_databases(file_path: Path, root: Path) -> List[Path]:
+    """The search databases of the file's workspace and of the project root"""
+    found = []
+    directory = file_path.parent
+    while True:
+        if (directory / SEARCH_NAME).is_file():
+            found.append(directory / SEARCH_NAME)
+            break
+        if directory == root or directory.parent == directory:
+            break
+        directory = directory.parent
+    if (root / SEARCH_NAME).is_file() and root / SEARCH_NAME not in found:
+        found.append(root / SEARCH_NAME)
+    return found
+
+
+class Guard:
+    """Looks up possible duplicates until a deadline"""
+
+    def __init__(self, deadline: float):
+        self.deadline = deadline
+        self.degraded = False
+
+    def remaining_ms(self) -> float:
+        return (self.deadline - time.perf_counter()) * 1e3
+
+    def open(self, path: Path) -> Tuple[sqlite3.Connection, bool]:
+        """A read-only connection whose queries abort at the deadline, and whether it has shapes"""
+        db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        db.set_progress_handler(lambda: time.perf_counter() > self.deadline, 1000)
+        row = db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return db, bool(row) and row[0] in SHAPE_SCHEMA_VERSIONS
+
+    def check(self, databases: List[Path], added: List[Definition], base: Path,
+              exclude: Optional[str]) -> List[Tuple[Definition, List[Dict[str, Any]]]]:
+        """Possible duplicates of each new definition, name matches before shape matches"""
+        matches = {definition: [] for definition in added}  # type: Dict[Definition, List[Dict[str, Any]]]
+        try:
+            for path in databases:
+                if self.remaining_ms() <= 0:
+                    self.degraded = True
+                    break
+                db, has_shapes = self.open(path)
+                prefix = os.path.relpath(path.parent, base).replace(os.sep, "/")
+                try:
+                    tiers = [("name", "key"), ("shape", "shape")] if has_shapes else [("name", "name")]
+                    for tier, column in tiers:
+                        if tier == "shape" and self.remaining_ms() < SHAPE_RESERVE_MS:
+                            self.degraded = True
+                            break
+                        self._lookup(db, tier, column, matches, "" if prefix == "." else prefix + "/", exclude)
+                finally:
+                    db.close()
+        except sqlite3.OperationalError:
+            # Interrupted at the deadline, or an unreadable database: keep what was found
+            self.degraded = True
+        return [(definition, found) for definition, found in matches.items() if found]
+
+    def _lookup(self, db: sqlite3.Connection, tier: str, column: str,
+                matches: Dict[Definition, List[Dict[str, Any]]], prefix: str, exclude: Optional[str]):
+        for definition, found in matches.items():
+            if len(found) >= MAX_MATCHES:
+                continue
+            if self.remaining_ms() <= 0:
+                # Queries that finish quickly never reach the progress handler
+                self.degraded = True
+                return
+            if column == "name":
+                # Databases from before the key column: exact names only
+                rows = db.execute("SELECT path, kind, name, signature, line FROM docs WHERE name = ?",
+                                  (definition.name,))
+            elif column == "key":
+                rows = db.execute("SELECT path, kind, name, signature, line FROM docs WHERE key = ?",
+                                  (name_key(definition.name),))
+            else:
+                value = shape(definition.name)
+                if value is None:
+                    continue
+                rows = db.execute("SELECT path, kind, name, signature, line FROM docs WHERE shape = ?", (value,))
+            for path, kind, name, signature, line in rows:
+                path = prefix + path
+                if path == exclude or not _comparable(definition.kind, kind):
+                    continue
+                if any(item["path"] == path and item["name"] == name for item in found):
+                    continue
+                found.append({"path": path, "kind": kind, "name": name, "signature": signature, "line": line,
+                              "match": tier, "same_arity": definition.kind != "class" and arity(signature) == arity(definition.signature)})
+                if len(found) >= MAX_MATCHES:
+                    break
+
+
+def _comparable(new_kind: str, old_kind: str) -> bool:
+    if new_kind == "class":
+        return old_kind in ("class", "interface", "type")
+    return old_kind in ("function", "method")
+
+
+def format_warning(results: List[Tuple[Definition, List[Dict[str, Any]]]], file_path: str, degraded: bool) -> str:
+    lines = [f"Possible duplicates in {file_path}; reuse or extend the existing code if it does the same job:"]
+    for definition, found in results:
+        for item in found:
+            location = f"{item['path']}:{item['line']}" if item.get("line") else item["path"]
+            reason = "same name" if item["match"] == "name" else "same words"
+            if item["same_arity"]:
+                reason += ", same arity"
+            lines.append(f"- {definition.signature} ~ {item['signature']} at {location} ({reason})")
+    if degraded:
+        lines.append("(name matches only; the check ran out of time)")
+    return "\n".join(lines)
+
+
+def hook_output(message: str) -> Dict[str, Any]:
+    return {
+        "systemMessage": "⚠️ " + message.splitlines()[0],
+        "hookSpecificOutput": {"hookEventName": "PreToolUse", "additionalContext": message},
+    }
+
+
+def guard(payload: Dict[str, Any], budget_ms: float = BUDGET_MS,
+          started: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """Hook output warning about duplicates a tool call would add, or None"""
+    deadline = (_STARTED if started is None else started) + budget_ms / 1e3
+    if payload.get("tool_name") not in WRITE_TOOLS:
+        return None
+    tool_input = payload.get("tool_input") or {}
+    added = new_definitions(payload["tool_name"], tool_input)
+    if not added:
+        return None
+    root = Path(os.environ.get("CLAUDE_PROJECT_DIR") or payload.get("cwd") or ".").resolve()
+    file_path = Path(tool_input["file_path"])
+    file_path = (file_path if file_path.is_absolute() else root / file_path).resolve()
+    try:
+        relative = file_path.relative_to(root).as_posix()
+    except ValueError:
+        relative = None
+    checker = Guard(deadline)
+    results = checker.check(search_databases(file_path, root), added, root, relative)
+    if not results:
+        return None
+    return hook_output(format_warning(results, relative or str(file_path), checker.degraded))
+
+
+def main(argv: Optional[List[str]] = None):
+    """Hook entry point (payload on stdin), or `claude-boost duplicates PATH...`"""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv:
+        try:
+            payload = json.loads(sys.stdin.buffer.read().decode("utf-8") or "{}")
+            output = guard(payload)
+        except Exception as e:
+            # A guard must never get in the way of the edit it guards
+            print(f"duplicates.py: {e}", file=sys.stderr)
+            return
+        if output:
+            print(json.dumps(output))
+        return
+
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="claude-boost duplicates",
+                                     description="List indexed definitions that files' definitions may duplicate")
+    parser.add_argument("paths", nargs="+", help="Source files to check")
+    parser.add_argument("--budget", type=float, default=BUDGET_MS, help=f"Milliseconds per file (default: {BUDGET_MS:g})")
+    parser.add_argument("--root", default=".", help="Project root (default: current directory)")
+    args = parser.parse_args(argv)
+
+    os.environ["CLAUDE_PROJECT_DIR"] = str(Path(args.root).resolve())
+    for path in args.paths:
+        started = time.perf_counter()
+        try:
+            content = Path(path).read_text(encoding="utf-8", errors="replace")
+        except OSError as e:
+            print(f"❌ {path}: {e}", file=sys.stderr)
+            continue
+        output = guard({"tool_name": "Write", "tool_input": {"file_path": str(Path(path).resolve()), "content": content}},
+                       args.budget, started)
+        elapsed = (time.perf_counter() - started) * 1e3
+        if output:
+            print(output["hookSpecificOutput"]["additionalContext"])
+        print(f"🔎 {path}: checked in {elapsed:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
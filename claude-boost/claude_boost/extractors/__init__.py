@@ -0,0 +1,66 @@
+"""
+Claude Code Boost Extractor Registry
+Maps file extensions to symbol extractors, imported on first use
+
+Extractors are referenced by "module:function" strings, so indexing an
+all-Python repository never imports the JavaScript, Go, Rust or SQL
+machinery. Every extractor takes the file's text and returns a dict in the
+PROJECT_INDEX.json per-file schema (imports, functions, classes, ...).
+Extractors listed in BYTES_EXTRACTORS take the raw bytes instead (the
+Python one hands them to ast.parse, which honours coding declarations),
+so the indexer can skip decoding for them.
+
+Third-party extractors can be added with `register(".ext", "pkg.mod:func")`.
+"""
+import importlib
+from typing import Any, Callable, Dict, Optional
+
+Extractor = Callable[[str], Dict[str, Any]]
+
+REGISTRY = {
+    ".py": "claude_boost.extractors.python:extract",
+    ".js": "claude_boost.extractors.javascript:extract",
+    ".jsx": "claude_boost.extractors.javascript:extract",
+    ".ts": "claude_boost.extractors.javascript:extract",
+    ".tsx": "claude_boost.extractors.javascript:extract",
+    ".go": "claude_boost.extractors.go:extract",
+    ".rs": "claude_boost.extractors.rust:extract",
+    ".sql": "claude_boost.extractors.sql:extract",
+}  # type: Dict[str, str]
+
+# Extractors that accept bytes (or any buffer) as well as text
+BYTES_EXTRACTORS = {"claude_boost.extractors.python:extract"}
+
+_loaded = {}  # type: Dict[str, Extractor]
+
+
+def register(extension: str, target: str):
+    """Register (or replace) the extractor for an extension"""
+    REGISTRY[extension.lower()] = target
+    _loaded.pop(target, None)
+
+
+def extractor_name(extension: str) -> Optional[str]:
+    """Short name of the extractor handling an extension, used for accounting"""
+    target = REGISTRY.get(extension.lower())
+    if target is None:
+        return None
+    return target.split(":", 1)[0].rsplit(".", 1)[-1]
+
+
+def accepts_bytes(extension: str) -> bool:
+    """Whether the extension's extractor can be given undecoded bytes"""
+    return REGISTRY.get(extension.lower()) in BYTES_EXTRACTORS
+
+
+def get_extractor(extension: str) -> Optional[Extractor]:
+    """Extractor for an extension, importing its module the first time it is needed"""
+    target = REGISTRY.get(extension.lower())
+    if target is None:
+        return None
+    extractor = _loaded.get(target)
+    if extractor is None:
+        module_name, _, attribute = target.partition(":")
+        extractor = getattr(importlib.import_module(module_name), attribute or "extract")
+        _loaded[target] = extractor
+    return extractor
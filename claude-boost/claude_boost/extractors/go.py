@@ -0,0 +1,145 @@
+"""Go extractor: package-level declarations from a token stream"""
+from typing import Any, Dict, List
+
+from claude_boost.extractors.lexer import Token, join, language, matching, split_top_level, tokenize
+
+GO = language(
+    comment=r"//[^\n]*|/\*.*?\*/",
+    string=r'"(?:\\.|[^"\\\n])*"|`[^`]*`|\'(?:\\.|[^\'\\\n])+\'',
+)
+
+
+def _params(tokens: List[Token]) -> List[str]:
+    """Parameter names; `a, b int` yields a and b, unnamed `(int, error)` nothing"""
+    groups = split_top_level(tokens)
+    if all(len(group) == 1 for group in groups):
+        return []
+    return [group[0].text for group in groups if group[0].kind == "ident"]
+
+
+def extract(text: str) -> Dict[str, Any]:
+    """Imports, functions, types with their methods, and exported names"""
+    tokens, truncated = tokenize(text, GO)
+    info = {
+        "package": None,
+        "imports": [],
+        "functions": [],
+        "classes": [],
+        "exports": [],
+    }  # type: Dict[str, Any]
+    types = {}  # type: Dict[str, Dict[str, Any]]
+    methods = []  # type: List[tuple]
+
+    i = 0
+    depth = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token.text == "{":
+            depth += 1
+        elif token.text == "}":
+            depth -= 1
+        elif depth == 0 and token.kind == "ident":
+            if token.text == "package" and i + 1 < len(tokens):
+                info["package"] = tokens[i + 1].text
+            elif token.text == "import":
+                end = matching(tokens, i + 1, "(", ")") if tokens[i + 1].text == "(" else i + 2
+                info["imports"].extend(t.text.strip('"`') for t in tokens[i + 1:end + 1] if t.kind == "string")
+                i = end
+            elif token.text == "func":
+                i = _function(tokens, i, info, methods)
+                continue
+            elif token.text == "type":
+                i = _types(tokens, i, types)
+                continue
+        i += 1
+
+    for receiver, method in methods:
+        if receiver in types:
+            types[receiver]["methods"].append(method)
+        else:
+            types[receiver] = {"name": receiver, "kind": "type", "methods": [method], "line": method["line"], "bases": []}
+    info["classes"] = sorted(types.values(), key=lambda t: t["line"])
+    info["exports"] = [f["name"] for f in info["functions"] if f["name"][0].isupper()]
+    info["exports"] += [c["name"] for c in info["classes"] if c["name"][0].isupper()]
+    if truncated:
+        info["truncated"] = True
+    return info
+
+
+def _function(tokens: List[Token], i: int, info: Dict[str, Any], methods: List[tuple]) -> int:
+    """Parse `func [(recv)] Name(params) results {` starting at `func`; returns the next index"""
+    line = tokens[i].line
+    i += 1
+    receiver = None
+    if i < len(tokens) and tokens[i].text == "(":
+        end = matching(tokens, i, "(", ")")
+        idents = [t.text for t in tokens[i + 1:end] if t.kind == "ident"]
+        receiver = idents[-1] if idents else None
+        i = end + 1
+    if i >= len(tokens) or tokens[i].kind != "ident":
+        return i
+    name = tokens[i].text
+    i += 1
+    if i < len(tokens) and tokens[i].text == "[":
+        i = matching(tokens, i, "[", "]") + 1
+    if i >= len(tokens) or tokens[i].text != "(":
+        return i
+    end = matching(tokens, i, "(", ")")
+    args = _params(tokens[i + 1:end])
+
+    # Results run up to the body (or the end of the line for declarations)
+    j = end + 1
+    while j < len(tokens) and tokens[j].text != "{" and tokens[j].line == tokens[end].line:
+        if tokens[j].text == "(":
+            j = matching(tokens, j, "(", ")")
+        j += 1
+    returns = join(tokens[end + 1:j]) or None
+
+    if receiver:
+        methods.append((receiver, {"name": name, "args": args, "line": line}))
+    else:
+        info["functions"].append({"name": name, "args": args, "returns": returns, "line": line, "async": False})
+    return j
+
+
+def _types(tokens: List[Token], i: int, types: Dict[str, Dict[str, Any]]) -> int:
+    """Parse `type Name kind` or a `type ( ... )` group; returns the next index"""
+    i += 1
+    if i < len(tokens) and tokens[i].text == "(":
+        end = matching(tokens, i, "(", ")")
+        j = i + 1
+        while j < end:
+            if tokens[j].kind == "ident" and (j == i + 1 or tokens[j].line != tokens[j - 1].line):
+                j = _type_spec(tokens, j, types)
+            else:
+                j += 1
+        return end + 1
+    return _type_spec(tokens, i, types)
+
+
+def _type_spec(tokens: List[Token], i: int, types: Dict[str, Dict[str, Any]]) -> int:
+    if i >= len(tokens) or tokens[i].kind != "ident":
+        return i
+    name, line = tokens[i].text, tokens[i].line
+    j = i + 1
+    if j < len(tokens) and tokens[j].text == "[":
+        j = matching(tokens, j, "[", "]") + 1
+    kind = tokens[j].text if j < len(tokens) and tokens[j].text in ("struct", "interface") else "type"
+    entry = {"name": name, "kind": kind, "methods": [], "line": line, "bases": []}
+    if kind in ("struct", "interface") and j + 1 < len(tokens) and tokens[j + 1].text == "{":
+        end = matching(tokens, j + 1, "{", "}")
+        if kind == "interface":
+            entry["methods"] = [
+                {"name": tokens[k].text, "args": _params(tokens[k + 2:matching(tokens, k + 1, "(", ")")]),
+                 "line": tokens[k].line}
+                for k in range(j + 2, end) if tokens[k].kind == "ident" and tokens[k + 1].text == "("
+                and tokens[k - 1].line != tokens[k].line
+            ]
+        else:
+            # Embedded structs are the closest Go has to base classes
+            entry["bases"] = [tokens[k].text for k in range(j + 2, end)
+                              if tokens[k].kind == "ident" and tokens[k - 1].line != tokens[k].line
+                              and tokens[k + 1].line != tokens[k].line]
+        j = end
+    types[name] = entry
+    return j + 1
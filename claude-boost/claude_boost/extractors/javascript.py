@@ -0,0 +1,29 @@
+"""JavaScript/TypeScript extractor: imports, exports, functions, classes and types"""
+import re
+from typing import Any, Dict
+
+IMPORT_PATTERN = re.compile(r"""import\s+(?:[\w*{}\s,]+?\s+from\s+)?['"]([^'"]+)['"]|require\(\s*['"]([^'"]+)['"]\s*\)""")
+FUNCTION_PATTERN = re.compile(
+    r"(?:async\s+)?function\s*\*?\s*(\w+)"
+    r"|(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?(?:function\b|\([^()]*\)\s*(?::\s*[^=]+)?=>|\w+\s*=>)"
+    r"|^\s*(\w+)\s*:\s*(?:async\s+)?function\b",
+    re.M,
+)
+CLASS_PATTERN = re.compile(r"\bclass\s+(\w+)")
+INTERFACE_PATTERN = re.compile(r"\binterface\s+(\w+)")
+TYPE_PATTERN = re.compile(r"^\s*(?:export\s+)?type\s+(\w+)\s*(?:<[^>]*>)?\s*=", re.M)
+EXPORT_PATTERN = re.compile(
+    r"\bexport\s+(?:default\s+)?(?:async\s+)?(?:class|function\*?|const|let|var|interface|type|enum)?\s*(\w+)"
+)
+
+
+def extract(text: str) -> Dict[str, Any]:
+    """Regex scan of a JS/TS module"""
+    return {
+        "imports": [a or b for a, b in IMPORT_PATTERN.findall(text)],
+        "exports": [name for name in EXPORT_PATTERN.findall(text) if name != "default"],
+        "functions": [a or b or c for a, b, c in FUNCTION_PATTERN.findall(text)],
+        "classes": CLASS_PATTERN.findall(text),
+        "interfaces": INTERFACE_PATTERN.findall(text),
+        "types": TYPE_PATTERN.findall(text),
+    }
@@ -0,0 +1,94 @@
+"""
+Single-pass tokenizer shared by the Go, Rust and SQL extractors
+
+Each language supplies one master regex of alternatives; the tokenizer
+walks the text once, drops whitespace and comments, and records the line
+of every token. Input is capped at MAX_LEXED_BYTES so the cost per file is
+bounded no matter how large a generated file is.
+"""
+import re
+from typing import List, NamedTuple, Pattern, Tuple
+
+MAX_LEXED_BYTES = 512 * 1024
+
+
+class Token(NamedTuple):
+    kind: str
+    text: str
+    line: int
+
+
+def language(comment: str, string: str, ident: str = r"[A-Za-z_]\w*") -> Pattern:
+    """Build a master token pattern from a language's comment and string syntax"""
+    return re.compile(
+        rf"(?P<nl>\n)|(?P<ws>[ \t\r\f\v]+)|(?P<comment>{comment})|(?P<string>{string})"
+        rf"|(?P<ident>{ident})|(?P<number>\d[\w.]*)|(?P<punct>.)",
+        re.S,
+    )
+
+
+def tokenize(text: str, pattern: Pattern) -> Tuple[List[Token], bool]:
+    """Tokens of a source text and whether it was truncated to the size cap"""
+    truncated = len(text) > MAX_LEXED_BYTES
+    if truncated:
+        text = text[:MAX_LEXED_BYTES]
+
+    tokens = []  # type: List[Token]
+    line = 1
+    for match in pattern.finditer(text):
+        kind = match.lastgroup
+        if kind == "nl":
+            line += 1
+        elif kind == "ws":
+            continue
+        elif kind == "comment":
+            line += match.group().count("\n")
+        else:
+            value = match.group()
+            tokens.append(Token(kind, value, line))
+            if kind == "string":
+                line += value.count("\n")
+    return tokens, truncated
+
+
+def matching(tokens: List[Token], start: int, open_char: str, close_char: str) -> int:
+    """Index of the token closing the bracket opened at `start` (or len(tokens))"""
+    depth = 0
+    for i in range(start, len(tokens)):
+        text = tokens[i].text
+        if text == open_char:
+            depth += 1
+        elif text == close_char:
+            depth -= 1
+            if depth == 0:
+                return i
+    return len(tokens)
+
+
+def split_top_level(tokens: List[Token]) -> List[List[Token]]:
+    """Split a bracket's contents on commas that are not nested"""
+    groups = [[]]  # type: List[List[Token]]
+    depth = 0
+    previous = ""
+    for token in tokens:
+        if token.kind == "punct":
+            if token.text in "([{<":
+                depth += 1
+            elif token.text in ")]}" or (token.text == ">" and previous != "-"):
+                depth -= 1
+        if token.text == "," and depth == 0:
+            groups.append([])
+        else:
+            groups[-1].append(token)
+        previous = token.text
+    return [group for group in groups if group]
+
+
+def join(tokens: List[Token]) -> str:
+    """Readable text for a token run (e.g. a type or return signature)"""
+    out = ""
+    for token in tokens:
+        if out and token.kind in ("ident", "number", "string") and (out[-1].isalnum() or out[-1] == ","):
+            out += " "
+        out += token.text
+    return out
@@ -0,0 +1,88 @@
+"""Python extractor: module-level symbols from the AST"""
+import ast
+from typing import Any, Dict, List, Union
+
+
+def _args(node) -> List[str]:
+    args = node.args
+    names = [arg.arg for arg in getattr(args, "posonlyargs", []) + args.args]
+    if args.vararg:
+        names.append(f"*{args.vararg.arg}")
+    names.extend(arg.arg for arg in args.kwonlyargs)
+    if args.kwarg:
+        names.append(f"**{args.kwarg.arg}")
+    return names
+
+
+def _unparse(node) -> Any:
+    if node is None:
+        return None
+    try:
+        return ast.unparse(node)
+    except AttributeError:
+        # Python < 3.9
+        return getattr(node, "id", None) or type(node).__name__
+
+
+def _doc(node) -> Any:
+    """First line of a docstring"""
+    docstring = ast.get_docstring(node)
+    if not docstring:
+        return None
+    return docstring.strip().splitlines()[0].strip() or None
+
+
+def extract(text: Union[str, bytes]) -> Dict[str, Any]:
+    """Imports, top-level functions, classes with methods, and constants
+
+    `text` may also be the file's bytes (or an mmap of them): ast.parse
+    decodes them itself, honouring a coding declaration.
+    """
+    tree = ast.parse(text)
+    info = {
+        "imports": [],
+        "functions": [],
+        "classes": [],
+        "constants": [],
+        "exports": [],
+    }  # type: Dict[str, Any]
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                info["imports"].append(f"import {alias.name}")
+        elif isinstance(node, ast.ImportFrom):
+            names = ", ".join(alias.name for alias in node.names)
+            info["imports"].append(f"from {'.' * node.level}{node.module or ''} import {names}")
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            info["functions"].append({
+                "name": node.name,
+                "args": _args(node),
+                "returns": _unparse(node.returns),
+                "line": node.lineno,
+                "async": isinstance(node, ast.AsyncFunctionDef),
+                "doc": _doc(node),
+            })
+        elif isinstance(node, ast.ClassDef):
+            info["classes"].append({
+                "name": node.name,
+                "methods": [
+                    {"name": item.name, "args": _args(item), "line": item.lineno, "doc": _doc(item)}
+                    for item in node.body if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                ],
+                "line": node.lineno,
+                "bases": [_unparse(base) for base in node.bases],
+                "doc": _doc(node),
+            })
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id.isupper():
+                    info["constants"].append(target.id)
+                elif isinstance(target, ast.Name) and target.id == "__all__":
+                    try:
+                        info["exports"] = [str(name) for name in ast.literal_eval(node.value)]
+                    except ValueError:
+                        pass
+    return info
@@ -0,0 +1,188 @@
+"""Rust extractor: items, impl blocks and `use` declarations from a token stream"""
+from typing import Any, Dict, List, Optional
+
+from claude_boost.extractors.lexer import Token, join, language, matching, split_top_level, tokenize
+
+RUST = language(
+    comment=r"//[^\n]*|/\*.*?\*/",
+    # Raw strings, byte/normal strings, and char literals (not lifetimes like 'a)
+    string=r'b?r(#*)".*?"\1|b?"(?:\\.|[^"\\])*"|b?\'(?:\\.|[^\'\\\n])\'',
+)
+
+TYPE_KEYWORDS = ("struct", "enum", "trait", "union")
+
+
+def _skip_generics(tokens: List[Token], i: int) -> int:
+    """Index after a `<...>` generic list starting at i (or i itself)"""
+    if i >= len(tokens) or tokens[i].text != "<":
+        return i
+    depth = 0
+    while i < len(tokens):
+        text = tokens[i].text
+        if text == "<":
+            depth += 1
+        elif text == ">" and tokens[i - 1].text != "-":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def _params(tokens: List[Token]) -> List[str]:
+    names = []
+    for group in split_top_level(tokens):
+        if any(token.text == "self" for token in group[:3]):
+            names.append("self")
+            continue
+        idents = [token for token in group if token.kind == "ident" and token.text != "mut"]
+        if idents:
+            names.append(idents[0].text)
+    return names
+
+
+def extract(text: str) -> Dict[str, Any]:
+    """Imports, free functions, types with their impl/trait methods, and pub items"""
+    tokens, truncated = tokenize(text, RUST)
+    info = {
+        "imports": [],
+        "functions": [],
+        "classes": [],
+        "modules": [],
+        "exports": [],
+    }  # type: Dict[str, Any]
+    types = {}  # type: Dict[str, Dict[str, Any]]
+
+    # Item scopes: (brace depth of their body, owning type or None for `mod`)
+    scopes = []  # type: List[tuple]
+    depth = 0
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        text = token.text
+        if text == "{":
+            depth += 1
+        elif text == "}":
+            depth -= 1
+            while scopes and scopes[-1][0] > depth:
+                scopes.pop()
+        elif token.kind == "ident" and (depth == 0 or (scopes and scopes[-1][0] == depth)):
+            owner = scopes[-1][1] if scopes and scopes[-1][0] == depth else None
+            if text == "use":
+                end = i
+                while end < len(tokens) and tokens[end].text != ";":
+                    end += 1
+                info["imports"].append(join(tokens[i + 1:end]))
+                i = end
+            elif text == "mod" and i + 1 < len(tokens) and tokens[i + 1].kind == "ident":
+                info["modules"].append(tokens[i + 1].text)
+                if i + 2 < len(tokens) and tokens[i + 2].text == "{":
+                    scopes.append((depth + 1, None))
+            elif text == "fn":
+                i = _function(tokens, i, info, types, owner, _is_public(tokens, i))
+                continue
+            elif text in TYPE_KEYWORDS and i + 1 < len(tokens) and tokens[i + 1].kind == "ident":
+                name = tokens[i + 1].text
+                entry = types.setdefault(name, {"name": name, "methods": [], "line": token.line, "bases": []})
+                entry["kind"] = text
+                entry["line"] = token.line
+                if _is_public(tokens, i):
+                    info["exports"].append(name)
+                if text == "trait":
+                    j = _skip_generics(tokens, i + 2)
+                    if j < len(tokens) and tokens[j].text == ":":
+                        k = j + 1
+                        while k < len(tokens) and tokens[k].text not in ("{", "where"):
+                            if tokens[k].kind == "ident":
+                                entry["bases"].append(tokens[k].text)
+                            k += 1
+                    while j < len(tokens) and tokens[j].text != "{":
+                        j += 1
+                    scopes.append((depth + 1, name))
+                    i = j
+                    continue
+            elif text == "impl":
+                i = _impl(tokens, i, types, scopes, depth)
+                continue
+        i += 1
+
+    info["classes"] = sorted(types.values(), key=lambda t: t["line"])
+    if truncated:
+        info["truncated"] = True
+    return info
+
+
+def _is_public(tokens: List[Token], i: int) -> bool:
+    """`pub`, `pub(crate)`, `pub async unsafe ...` before the item keyword at i"""
+    j = i - 1
+    while j >= 0 and (tokens[j].text in ("async", "unsafe", "const", "extern", "default")
+                      or tokens[j].kind == "string"):
+        j -= 1
+    if j >= 0 and tokens[j].text == ")":
+        while j >= 0 and tokens[j].text != "(":
+            j -= 1
+        j -= 1
+    return j >= 0 and tokens[j].text == "pub"
+
+
+def _function(tokens: List[Token], i: int, info: Dict[str, Any], types: Dict[str, Dict[str, Any]],
+              owner: Optional[str], public: bool) -> int:
+    line = tokens[i].line
+    is_async = any(tokens[k].text == "async" for k in range(max(0, i - 3), i))
+    i += 1
+    if i >= len(tokens) or tokens[i].kind != "ident":
+        return i
+    name = tokens[i].text
+    i = _skip_generics(tokens, i + 1)
+    if i >= len(tokens) or tokens[i].text != "(":
+        return i
+    end = matching(tokens, i, "(", ")")
+    args = _params(tokens[i + 1:end])
+
+    j = end + 1
+    returns = None
+    if j + 1 < len(tokens) and tokens[j].text == "-" and tokens[j + 1].text == ">":
+        k = j + 2
+        while k < len(tokens) and tokens[k].text not in ("{", ";", "where"):
+            k += 1
+        returns = join(tokens[j + 2:k])
+        j = k
+
+    if owner:
+        types[owner]["methods"].append({"name": name, "args": args, "line": line})
+    else:
+        info["functions"].append({"name": name, "args": args, "returns": returns, "line": line, "async": is_async})
+        if public:
+            info["exports"].append(name)
+    return j
+
+
+def _impl(tokens: List[Token], i: int, types: Dict[str, Dict[str, Any]], scopes: List[tuple], depth: int) -> int:
+    """`impl<T> Trait for Type {` or `impl Type {`: methods go to Type"""
+    line = tokens[i].line
+    j = _skip_generics(tokens, i + 1)
+    header = []  # type: List[Token]
+    while j < len(tokens) and tokens[j].text not in ("{", ";"):
+        header.append(tokens[j])
+        j += 1
+    if j >= len(tokens) or tokens[j].text != "{":
+        return j
+
+    trait = None
+    target = header
+    for k, token in enumerate(header):
+        if token.text == "for":
+            trait, target = header[:k], header[k + 1:]
+            break
+    if target and target[0].text == "where":
+        target = []
+    names = [token.text for token in target if token.kind == "ident" and token.text not in ("where", "dyn", "mut")]
+    if not names:
+        return j
+    name = names[0]
+    entry = types.setdefault(name, {"name": name, "kind": "type", "methods": [], "line": line, "bases": []})
+    trait_names = [token.text for token in trait or [] if token.kind == "ident"]
+    if trait_names and trait_names[0] not in entry["bases"]:
+        entry["bases"].append(trait_names[0])
+    scopes.append((depth + 1, name))
+    return j
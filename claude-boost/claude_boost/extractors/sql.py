@@ -0,0 +1,128 @@
+"""SQL extractor: schema objects created or altered by a script"""
+from typing import Any, Dict, List
+
+from claude_boost.extractors.lexer import Token, join, language, matching, split_top_level, tokenize
+
+SQL = language(
+    comment=r"--[^\n]*|#[^\n]*|/\*.*?\*/",
+    string=r"'(?:''|[^'])*'|\$\$.*?\$\$",
+    # Quoted identifiers count as identifiers
+    ident=r'[A-Za-z_][\w$]*|"(?:""|[^"])+"|`[^`]+`|\[[^\]\n]+\]',
+)
+
+# Words that start a table constraint rather than a column definition
+CONSTRAINTS = {"PRIMARY", "FOREIGN", "CONSTRAINT", "UNIQUE", "CHECK", "KEY", "INDEX", "EXCLUDE", "FULLTEXT"}
+MODIFIERS = {"OR", "REPLACE", "TEMP", "TEMPORARY", "UNIQUE", "MATERIALIZED", "GLOBAL", "LOCAL", "UNLOGGED",
+             "VIRTUAL", "RECURSIVE", "DEFINER", "ALGORITHM", "CLUSTERED", "NONCLUSTERED"}
+
+
+def _name(token: Token) -> str:
+    text = token.text
+    if text[0] in "\"`[":
+        return text[1:-1]
+    return text
+
+
+def _qualified(tokens: List[Token], i: int) -> tuple:
+    """`schema.name` starting at i: (name, next index)"""
+    parts = [_name(tokens[i])]
+    i += 1
+    while i + 1 < len(tokens) and tokens[i].text == "." and tokens[i + 1].kind == "ident":
+        parts.append(_name(tokens[i + 1]))
+        i += 2
+    return ".".join(parts), i
+
+
+def extract(text: str) -> Dict[str, Any]:
+    """Tables with columns, views, indexes, functions/procedures, triggers and altered tables"""
+    tokens, truncated = tokenize(text, SQL)
+    info = {
+        "imports": [],
+        "functions": [],
+        "classes": [],
+        "exports": [],
+        "tables": [],
+        "views": [],
+        "indexes": [],
+        "triggers": [],
+        "altered_tables": [],
+    }  # type: Dict[str, Any]
+
+    # Statements are split on `;` and handled by their leading keywords
+    start = 0
+    for end in [k for k, token in enumerate(tokens) if token.text == ";"] + [len(tokens)]:
+        if end > start:
+            _statement(tokens[start:end], info)
+        start = end + 1
+
+    if truncated:
+        info["truncated"] = True
+    return info
+
+
+def _statement(tokens: List[Token], info: Dict[str, Any]):
+    words = [token.text.upper() if token.kind == "ident" else token.text for token in tokens]
+    if words[0] == "ALTER" and len(words) > 2 and words[1] == "TABLE":
+        i = 2
+        while i < len(words) and words[i] in ("IF", "EXISTS", "ONLY"):
+            i += 1
+        if i < len(tokens):
+            name, _ = _qualified(tokens, i)
+            if name not in info["altered_tables"]:
+                info["altered_tables"].append(name)
+        return
+    if words[0] != "CREATE":
+        return
+
+    i = 1
+    while i < len(words) and words[i] in MODIFIERS:
+        i += 1
+    if i >= len(words):
+        return
+    kind = words[i]
+    i += 1
+    while i < len(words) and words[i] in ("IF", "NOT", "EXISTS", "CONCURRENTLY"):
+        i += 1
+    if i >= len(tokens) or tokens[i].kind != "ident":
+        return
+    name, i = _qualified(tokens, i)
+    line = tokens[0].line
+
+    if kind == "TABLE":
+        columns = []
+        if i < len(tokens) and tokens[i].text == "(":
+            end = matching(tokens, i, "(", ")")
+            for group in split_top_level(tokens[i + 1:end]):
+                if group[0].kind == "ident" and group[0].text.upper() not in CONSTRAINTS:
+                    columns.append(_name(group[0]))
+        info["tables"].append({"name": name, "columns": columns, "line": line})
+        info["exports"].append(name)
+    elif kind == "VIEW":
+        info["views"].append({"name": name, "line": line})
+        info["exports"].append(name)
+    elif kind == "INDEX":
+        table = None
+        if "ON" in words[i:]:
+            on = words.index("ON", i)
+            if on + 1 < len(tokens):
+                table, _ = _qualified(tokens, on + 1)
+        info["indexes"].append({"name": name, "table": table, "line": line})
+    elif kind in ("FUNCTION", "PROCEDURE"):
+        args = []
+        if i < len(tokens) and tokens[i].text == "(":
+            end = matching(tokens, i, "(", ")")
+            for group in split_top_level(tokens[i + 1:end]):
+                idents = [t for t in group if t.kind == "ident" and t.text.upper() not in ("IN", "OUT", "INOUT")]
+                if len(idents) > 1:
+                    args.append(_name(idents[0]))
+            i = end + 1
+        returns = None
+        if "RETURNS" in words[i:]:
+            at = words.index("RETURNS", i) + 1
+            stop = at
+            while stop < len(words) and words[stop] not in ("AS", "LANGUAGE", "BEGIN", "IS"):
+                stop += 1
+            returns = join(tokens[at:stop]) or None
+        info["functions"].append({"name": name, "args": args, "returns": returns, "line": line, "async": False})
+    elif kind == "TRIGGER":
+        info["triggers"].append({"name": name, "line": line})
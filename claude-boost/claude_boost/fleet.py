@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Fleet Initialization
+Initializes many repositories concurrently from a non-interactive config
+
+    claude-boost init --config boost.toml --repos list.txt --jobs 8
+
+Each repository gets its own project type detection, template install,
+initial PROJECT_INDEX.json and .gitignore entry in a bounded process pool.
+Progress goes to stderr and a JSON summary to stdout.
+"""
+import io
+import os
+import sys
+import json
+import glob
+import time
+from pathlib import Path
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+DEFAULT_CONFIG = {
+    "features": {},
+    "init": {
+        "generate_index": True,
+        "update_gitignore": True,
+    },
+}
+
+
+def load_config(path: Optional[str]) -> Dict[str, Any]:
+    """Load a boost.toml (or .json) config, filling in defaults"""
+    config = {"features": {}, "init": dict(DEFAULT_CONFIG["init"])}  # type: Dict[str, Any]
+    if not path:
+        return config
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    if path.endswith(".json"):
+        loaded = json.loads(raw.decode("utf-8"))
+    else:
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise RuntimeError("TOML configs need Python 3.11+ or `pip install tomli` (or use a .json config)")
+        loaded = tomllib.loads(raw.decode("utf-8"))
+
+    config["features"].update(loaded.get("features", {}))
+    config["init"].update(loaded.get("init", {}))
+    return config
+
+
+def read_repo_list(spec: str) -> List[Path]:
+    """Resolve --repos: a file listing repositories (paths or globs), or a glob"""
+    if os.path.isfile(spec):
+        base = os.path.dirname(os.path.abspath(spec))
+        with open(spec, "r") as f:
+            patterns = [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
+    else:
+        base = os.getcwd()
+        patterns = [spec]
+
+    repos = []
+    seen = set()
+    for pattern in patterns:
+        pattern = os.path.join(base, os.path.expanduser(pattern))
+        for match in sorted(glob.glob(pattern)):
+            path = os.path.abspath(match)
+            if os.path.isdir(path) and path not in seen:
+                seen.add(path)
+                repos.append(Path(path))
+    return repos
+
+
+def init_repository(repo: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Initialize one repository; runs inside a worker process"""
+    from claude_boost import cli
+    from claude_boost.installer import Installer
+
+    root = Path(repo)
+    started = time.monotonic()
+    result = {"repo": repo, "status": "ok"}  # type: Dict[str, Any]
+    log = io.StringIO()
+
+    try:
+        with redirect_stdout(log):
+            result["project_types"] = cli.detect_project_type(root)
+            features = cli.get_user_preferences(config)
+            result["features"] = features
+
+            report = Installer(root, features).install()
+            result["files_written"] = len(report["written"])
+            result["files_unchanged"] = len(report["unchanged"])
+
+            if config["init"].get("generate_index", True) and features.get("project_indexer", True):
+                result["index_generated"] = cli.generate_initial_index(root)
+            if config["init"].get("update_gitignore", True):
+                cli.create_gitignore_entry(root)
+                result["gitignore_updated"] = True
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    warnings = [line.strip() for line in log.getvalue().splitlines() if "⚠️" in line]
+    if warnings:
+        result["warnings"] = warnings
+    result["duration_seconds"] = round(time.monotonic() - started, 3)
+    return result
+
+
+def run_fleet_init(repos: List[Path], config: Dict[str, Any], jobs: Optional[int] = None) -> Dict[str, Any]:
+    """Initialize repositories in a bounded process pool"""
+    started = time.monotonic()
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(repos) or 1))
+    results = []
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(init_repository, str(repo), config): repo for repo in repos}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"repo": str(futures[future]), "status": "error", "error": str(e)}
+            icon = "✅" if result["status"] == "ok" else "❌"
+            print(f"  {icon} {result['repo']}", file=sys.stderr)
+            results.append(result)
+
+    results.sort(key=lambda r: r["repo"])
+    failed = sum(1 for r in results if r["status"] != "ok")
+    return {
+        "repositories": len(results),
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "jobs": workers,
+        "duration_seconds": round(time.monotonic() - started, 3),
+        "results": results,
+    }
+
+
+def main(config_path: Optional[str], repos_spec: str, jobs: Optional[int]) -> int:
+    """Fleet init entry point; returns the process exit code"""
+    from claude_boost import cli
+    from claude_boost.installer import TEMPLATE_DIR
+
+    try:
+        config = load_config(config_path)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"❌ Could not load config {config_path}: {e}", file=sys.stderr)
+        return 1
+
+    if not TEMPLATE_DIR.exists():
+        print(f"❌ Template directory not found: {TEMPLATE_DIR}", file=sys.stderr)
+        return 1
+
+    # Claude Code is checked once for the whole fleet
+    with redirect_stdout(sys.stderr):
+        if not cli.check_claude_code():
+            return 1
+
+    repos = read_repo_list(repos_spec)
+    print(f"\n📦 Initializing {len(repos)} repositories...", file=sys.stderr)
+    summary = run_fleet_init(repos, config, jobs)
+    print(f"\n{summary['succeeded']}/{summary['repositories']} repositories initialized "
+          f"in {summary['duration_seconds']:.1f}s", file=sys.stderr)
+
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["failed"] else 0
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost hook client
+Forwards a hook event to the running hook host, or runs the hook in-process
+
+Installed next to the hooks in .claude/hooks and used as the hook command:
+
+    python "$CLAUDE_PROJECT_DIR/.claude/hooks/hostc.py" project-indexer.py
+
+This file must only depend on the standard library: it is copied into
+projects and runs without the claude_boost package on the path.
+"""
+import os
+import sys
+import json
+import socket
+import array
+
+DEFAULT_SOCKET = os.path.join(os.path.expanduser("~"), ".claude-boost", "hostd.sock")
+
+
+def socket_path() -> str:
+    """Return the hook host socket path"""
+    return os.environ.get("CLAUDE_BOOST_HOSTD_SOCKET", DEFAULT_SOCKET)
+
+
+def resolve_script(name: str) -> str:
+    """Resolve a hook name relative to the directory of this shim"""
+    if os.path.isabs(name):
+        return name
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+
+
+def connect():
+    """Connect to the hook host, returning None when it is not running"""
+    if not hasattr(socket, "AF_UNIX") or not hasattr(socket.socket, "sendmsg"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path())
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def run_remote(sock, script: str, args) -> int:
+    """Hand our stdio to the host and wait for the hook's exit code"""
+    header = {
+        "op": "run",
+        "script": script,
+        "argv": args,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+    }
+    payload = json.dumps(header).encode("utf-8") + b"\n"
+    fds = array.array("i", [0, 1, 2])
+    sock.sendmsg([payload], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, fds)])
+
+    reply = b""
+    while not reply.endswith(b"\n"):
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        reply += chunk
+    sock.close()
+
+    if not reply:
+        print("Hook host closed the connection before the hook finished", file=sys.stderr)
+        return 1
+    return int(json.loads(reply.decode("utf-8")).get("code", 1))
+
+
+def run_in_process(script: str, args) -> int:
+    """Fallback: execute the hook in this interpreter"""
+    import runpy
+
+    sys.argv = [script] + list(args)
+    sys.path.insert(0, os.path.dirname(script))
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    return 0
+
+
+def main():
+    """Hook client entry point"""
+    if len(sys.argv) < 2:
+        print("Usage: hostc.py <hook-script> [args...]", file=sys.stderr)
+        sys.exit(1)
+
+    script = resolve_script(sys.argv[1])
+    args = sys.argv[2:]
+
+    sock = None if os.environ.get("CLAUDE_BOOST_NO_HOSTD") else connect()
+    if sock is None:
+        sys.exit(run_in_process(script, args))
+    sys.exit(run_remote(sock, script, args))
+
+
+if __name__ == "__main__":
+    main()
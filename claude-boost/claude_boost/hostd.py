@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Hook Host
+Persistent process that preloads hook scripts and serves hook events over a Unix socket
+
+Every hook configured as `python .claude/hooks/<hook>.py` pays for a full
+interpreter start plus its imports on each tool call. The host keeps the hook
+scripts compiled and their imports loaded, and forks a child per event. The
+client shim (hostc.py) passes its stdin/stdout/stderr file descriptors over
+the socket, so the forked child talks to Claude Code directly and only the
+exit code travels back.
+"""
+import os
+import sys
+import json
+import socket
+import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Keep in sync with hostc.py, which cannot import this module
+STATE_DIR = Path.home() / ".claude-boost"
+DEFAULT_SOCKET = STATE_DIR / "hostd.sock"
+LOG_FILE = STATE_DIR / "hostd.log"
+
+# Files in .claude/hooks that are not hooks themselves
+NON_HOOK_SCRIPTS = {"hostc.py"}
+
+
+def socket_path() -> Path:
+    """Return the hook host socket path"""
+    return Path(os.environ.get("CLAUDE_BOOST_HOSTD_SOCKET", str(DEFAULT_SOCKET)))
+
+
+def is_supported() -> bool:
+    """The host needs Unix sockets, fd passing and fork"""
+    return (
+        hasattr(socket, "AF_UNIX")
+        and hasattr(socket.socket, "sendmsg")
+        and hasattr(os, "fork")
+    )
+
+
+def request(message: Dict, timeout: float = 2.0) -> Optional[Dict]:
+    """Send a control message to the host, returning None if it is not running"""
+    if not is_supported():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(socket_path()))
+        sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        reply = b""
+        while not reply.endswith(b"\n"):
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            reply += chunk
+        return json.loads(reply.decode("utf-8")) if reply else None
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+
+
+class HookHost:
+    """Preloads hook scripts and runs them in forked children on request"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.listener = None  # type: Optional[socket.socket]
+        self.scripts = {}  # type: Dict[str, Tuple[int, int, object]]
+        self.events_served = 0
+
+    def preload(self, hooks_dir: Path) -> List[str]:
+        """Compile every hook script in a directory and import its dependencies"""
+        loaded = []
+        if not hooks_dir.is_dir():
+            return loaded
+        for script in sorted(hooks_dir.glob("*.py")):
+            if script.name in NON_HOOK_SCRIPTS:
+                continue
+            try:
+                self.load(str(script.resolve()))
+                loaded.append(script.name)
+            except (OSError, SyntaxError) as e:
+                print(f"⚠️ Could not preload {script}: {e}", file=sys.stderr)
+        return loaded
+
+    def load(self, script: str):
+        """Return the compiled code for a script, recompiling when it changes"""
+        st = os.stat(script)
+        cached = self.scripts.get(script)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        with open(script, "rb") as f:
+            source = f.read()
+        code = compile(source, script, "exec")
+        self._import_dependencies(source, script)
+        self.scripts[script] = (st.st_mtime_ns, st.st_size, code)
+        return code
+
+    def _import_dependencies(self, source: bytes, script: str):
+        """Import the modules a hook imports so forked children inherit them"""
+        import ast
+        import importlib
+
+        try:
+            tree = ast.parse(source, script)
+        except SyntaxError:
+            return
+        modules = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                modules.add(node.module)
+        for module in sorted(modules):
+            try:
+                importlib.import_module(module)
+            except Exception:
+                # The hook will report its own import errors when it runs
+                continue
+
+    def bind(self):
+        """Create the listening socket, replacing a stale one"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.chmod(self.path.parent, 0o700)
+        except OSError:
+            pass
+
+        if self.path.exists():
+            if request({"op": "ping"}) is not None:
+                raise RuntimeError(f"Hook host already running on {self.path}")
+            self.path.unlink()
+
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(str(self.path))
+        os.chmod(self.path, 0o600)
+        self.listener.listen(64)
+
+    def close(self):
+        """Stop listening and remove the socket file"""
+        if self.listener is not None:
+            self.listener.close()
+            self.listener = None
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+    def serve_forever(self):
+        """Accept hook events until stopped"""
+        import signal
+
+        # Let the kernel reap finished children
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+        try:
+            while True:
+                conn, _ = self.listener.accept()
+                try:
+                    if not self.handle(conn):
+                        break
+                except Exception as e:
+                    print(f"⚠️ Hook host error: {e}", file=sys.stderr)
+                finally:
+                    conn.close()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def handle(self, conn: socket.socket) -> bool:
+        """Handle one connection; returns False when asked to stop"""
+        header, fds = self._receive_header(conn)
+        op = header.get("op")
+
+        if op == "ping":
+            self._reply(conn, {
+                "ok": True,
+                "pid": os.getpid(),
+                "scripts": sorted(self.scripts),
+                "events_served": self.events_served,
+            })
+            return True
+        if op == "stop":
+            self._reply(conn, {"ok": True})
+            return False
+        if op != "run" or len(fds) != 3:
+            self._close_fds(fds)
+            self._reply(conn, {"code": 1, "error": f"Invalid request: {op}"})
+            return True
+
+        try:
+            code = self.load(header["script"])
+        except (OSError, SyntaxError) as e:
+            os.write(fds[2], f"Hook host could not load {header['script']}: {e}\n".encode())
+            self._close_fds(fds)
+            self._reply(conn, {"code": 1})
+            return True
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                self.listener.close()
+                exit_code = self._run_child(code, header, fds)
+            finally:
+                try:
+                    self._reply(conn, {"code": exit_code})
+                finally:
+                    os._exit(0)
+
+        self.events_served += 1
+        self._close_fds(fds)
+        return True
+
+    def _run_child(self, code, header: Dict, fds: List[int]) -> int:
+        """Run a hook inside the forked child with the client's stdio"""
+        import builtins
+        import signal
+
+        # Hooks that use subprocess need normal child reaping
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+        self._close_fds(fds)
+
+        os.chdir(header.get("cwd") or "/")
+        os.environ.clear()
+        os.environ.update(header.get("env") or {})
+
+        script = header["script"]
+        sys.argv = [script] + list(header.get("argv") or [])
+        sys.path[0] = os.path.dirname(script)
+
+        exit_code = 0
+        try:
+            exec(code, {"__name__": "__main__", "__file__": script, "__builtins__": builtins})
+        except SystemExit as e:
+            if e.code is None:
+                exit_code = 0
+            elif isinstance(e.code, int):
+                exit_code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except BaseException:
+            import traceback
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        return exit_code
+
+    def _receive_header(self, conn: socket.socket) -> Tuple[Dict, List[int]]:
+        """Read the JSON header line and any file descriptors sent with it"""
+        fds = array.array("i")
+        data = b""
+        while not data.endswith(b"\n"):
+            msg, ancdata, _, _ = conn.recvmsg(65536, socket.CMSG_SPACE(3 * fds.itemsize))
+            if not msg:
+                break
+            data += msg
+            for level, kind, payload in ancdata:
+                if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+                    usable = len(payload) - (len(payload) % fds.itemsize)
+                    fds.frombytes(payload[:usable])
+        try:
+            header = json.loads(data.decode("utf-8")) if data else {}
+        except ValueError:
+            header = {}
+        return header, list(fds)
+
+    @staticmethod
+    def _reply(conn: socket.socket, message: Dict):
+        conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+    @staticmethod
+    def _close_fds(fds: List[int]):
+        for fd in fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+def run(hooks_dir: Path):
+    """Run the hook host in the foreground"""
+    host = HookHost(socket_path())
+    loaded = host.preload(hooks_dir)
+    host.bind()
+    print(f"✅ Hook host listening on {host.path} (pid {os.getpid()})")
+    if loaded:
+        print(f"  Preloaded hooks: {', '.join(loaded)}")
+    sys.stdout.flush()
+    host.serve_forever()
+
+
+def start(hooks_dir: Path, timeout: float = 5.0) -> bool:
+    """Start the hook host as a detached background process"""
+    import time
+    import subprocess
+
+    if request({"op": "ping"}) is not None:
+        print(f"✅ Hook host already running on {socket_path()}")
+        return True
+
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    env = dict(os.environ)
+    package_parent = str(Path(__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_parent, env.get("PYTHONPATH")]))
+
+    with open(LOG_FILE, "a") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "claude_boost.hostd", "run", "--hooks-dir", str(hooks_dir)],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=log,
+            env=env, start_new_session=True,
+        )
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if request({"op": "ping"}) is not None:
+            print(f"✅ Hook host started on {socket_path()}")
+            return True
+        time.sleep(0.05)
+
+    print(f"❌ Hook host did not start, see {LOG_FILE}")
+    return False
+
+
+def stop() -> bool:
+    """Ask a running hook host to shut down"""
+    if request({"op": "stop"}) is None:
+        print("Hook host is not running")
+        return False
+    print("✅ Hook host stopped")
+    return True
+
+
+def status() -> bool:
+    """Print hook host status"""
+    info = request({"op": "ping"})
+    if info is None:
+        print("Hook host is not running (hooks run in-process)")
+        return False
+    print(f"✅ Hook host running (pid {info['pid']}) on {socket_path()}")
+    print(f"  Events served: {info['events_served']}")
+    for script in info["scripts"]:
+        print(f"  Loaded: {script}")
+    return True
+
+
+def main(argv: Optional[List[str]] = None):
+    """Hook host entry point: hostd [run|start|stop|status]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="claude-boost hostd",
+        description="Serve hook events from a persistent Python process",
+    )
+    parser.add_argument("action", nargs="?", default="run",
+                        choices=["run", "start", "stop", "status"])
+    parser.add_argument("--hooks-dir", default=os.path.join(".claude", "hooks"),
+                        help="Hook scripts to preload (default: .claude/hooks)")
+    args = parser.parse_args(argv)
+
+    if not is_supported():
+        print("❌ The hook host requires Unix domain sockets; hooks will run in-process")
+        sys.exit(1)
+
+    hooks_dir = Path(args.hooks_dir).resolve()
+    if args.action == "run":
+        try:
+            run(hooks_dir)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+    elif args.action == "start":
+        sys.exit(0 if start(hooks_dir) else 1)
+    elif args.action == "stop":
+        sys.exit(0 if stop() else 1)
+    else:
+        sys.exit(0 if status() else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Claude Code Boost Import Graph
+Resolves the import strings of PROJECT_INDEX.json records to indexed files
+
+Extractors record imports as written (`from .models import User`,
+`./api/client`, `github.com/acme/app/store`, `crate::db::pool`). This
+module maps them back to files of the same index:
+
+- Python: dotted modules, matched against every dotted suffix of the
+  indexed .py paths so `src/` layouts resolve; relative imports from the
+  importing file's package
+- JavaScript/TypeScript: relative specifiers with the usual extension
+  and index-file fallbacks; bare package names are external and ignored
+- Go: the import path's trailing directories, matched against indexed
+  package directories
+- Rust: `crate::`/`super::`/`self::` paths to `name.rs` or `name/mod.rs`
+
+Imports that resolve to nothing (the standard library, third-party
+packages) are dropped.
+"""
+import posixpath
+from typing import Any, Dict, List, Optional, Set
+
+JS_EXTENSIONS = [".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs"]
+
+
+class ImportResolver:
+    """Lookup tables over the indexed paths, built once per index"""
+
+    def __init__(self, paths):
+        self.paths = set(paths)
+        self.python = {}  # type: Dict[str, List[str]]
+        self.directories = {}  # type: Dict[str, List[str]]
+        for path in sorted(self.paths):
+            stem, ext = posixpath.splitext(path)
+            if ext == ".py":
+                parts = stem.split("/")
+                if parts[-1] == "__init__":
+                    parts = parts[:-1]
+                for start in range(len(parts)):
+                    self.python.setdefault(".".join(parts[start:]), []).append(path)
+            elif ext == ".go":
+                parts = posixpath.dirname(path).split("/")
+                for start in range(len(parts)):
+                    self.directories.setdefault("/".join(parts[start:]), []).append(path)
+
+    def _python_module(self, module: str) -> Optional[str]:
+        candidates = self.python.get(module)
+        if not candidates:
+            return None
+        # Shortest path wins: the module nearest the root, not a vendored copy
+        return min(candidates, key=len)
+
+    def resolve_python(self, importer: str, statement: str) -> List[str]:
+        if statement.startswith("import "):
+            found = []
+            for name in statement[len("import "):].split(","):
+                module = name.strip().split(" as ")[0].strip()
+                # `import a.b.c` also loads a and a.b; the deepest match is the dependency
+                while module:
+                    target = self._python_module(module)
+                    if target:
+                        found.append(target)
+                        break
+                    module = module.rpartition(".")[0]
+            return found
+
+        if not statement.startswith("from "):
+            return []
+        module, _, names = statement[len("from "):].partition(" import ")
+        level = len(module) - len(module.lstrip("."))
+        module = module.lstrip(".")
+        if level:
+            package = posixpath.dirname(importer)
+            for _ in range(level - 1):
+                package = posixpath.dirname(package)
+            base = "/".join(part for part in (package, module.replace(".", "/")) if part)
+            # Relative imports are resolved by path, not by suffix
+            candidates = [f"{base}.py", f"{base}/__init__.py"]
+            found = [path for path in candidates if path in self.paths][:1]
+            for name in names.split(","):
+                name = name.strip().split(" as ")[0].strip()
+                submodule = f"{base}/{name}.py" if base else f"{name}.py"
+                if submodule in self.paths:
+                    found.append(submodule)
+            return found
+
+        found = []
+        for name in names.split(","):
+            # `from package import module` imports a module, not just a name
+            target = self._python_module(f"{module}.{name.strip().split(' as ')[0].strip()}")
+            if target:
+                found.append(target)
+        target = self._python_module(module)
+        if target and not found:
+            found.append(target)
+        return found
+
+    def resolve_javascript(self, importer: str, specifier: str) -> List[str]:
+        if not specifier.startswith("."):
+            return []
+        base = posixpath.normpath(posixpath.join(posixpath.dirname(importer), specifier))
+        candidates = [base] + [base + ext for ext in JS_EXTENSIONS] + [f"{base}/index{ext}" for ext in JS_EXTENSIONS]
+        for candidate in candidates:
+            if candidate in self.paths:
+                return [candidate]
+        return []
+
+    def resolve_go(self, specifier: str) -> List[str]:
+        parts = specifier.split("/")
+        # The longest trailing run of the import path that names an indexed directory
+        for start in range(len(parts)):
+            files = self.directories.get("/".join(parts[start:]))
+            if files:
+                return files
+        return []
+
+    def resolve_rust(self, importer: str, statement: str) -> List[str]:
+        parts = [part.strip() for part in statement.split("{")[0].split("::") if part.strip()]
+        if not parts or parts[0] not in ("crate", "super", "self"):
+            return []
+        if parts[0] == "crate":
+            # The crate root is the src/ directory holding the importer
+            marker = importer.rfind("src/")
+            base = importer[:marker + 3] if marker >= 0 else ""
+        else:
+            base = posixpath.dirname(importer)
+            if parts[0] == "super":
+                base = posixpath.dirname(base)
+        modules = parts[1:]
+        # Try the longest module path first; trailing parts may be items, not modules
+        for end in range(len(modules), 0, -1):
+            stem = "/".join(part for part in [base] + modules[:end] if part)
+            for candidate in (f"{stem}.rs", f"{stem}/mod.rs"):
+                if candidate in self.paths:
+                    return [candidate]
+        return []
+
+    def resolve(self, importer: str, statement: str) -> List[str]:
+        """Indexed files one import of `importer` refers to"""
+        ext = posixpath.splitext(importer)[1]
+        if ext == ".py":
+            found = self.resolve_python(importer, statement)
+        elif ext in JS_EXTENSIONS:
+            found = self.resolve_javascript(importer, statement)
+        elif ext == ".go":
+            found = self.resolve_go(statement)
+        elif ext == ".rs":
+            found = self.resolve_rust(importer, statement)
+        else:
+            found = []
+        return [path for path in found if path != importer]
+
+
+def import_graph(files: Dict[str, Any]) -> Dict[str, Set[str]]:
+    """path → indexed files it imports"""
+    resolver = ImportResolver(files)
+    graph = {}  # type: Dict[str, Set[str]]
+    for path, record in files.items():
+        targets = set()  # type: Set[str]
+        if isinstance(record, dict):
+            for statement in record.get("imports") or []:
+                targets.update(resolver.resolve(path, str(statement)))
+        graph[path] = targets
+    return graph
+
+
+def reverse_graph(graph: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+    """path → indexed files importing it"""
+    importers = {path: set() for path in graph}  # type: Dict[str, Set[str]]
+    for path, targets in graph.items():
+        for target in targets:
+            importers.setdefault(target, set()).add(path)
+    return importers
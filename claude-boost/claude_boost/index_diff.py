@@ -0,0 +1,179 @@
+"""
+Claude Code Boost Index Diff
+Structural diff of two PROJECT_INDEX.json snapshots
+
+    claude-boost index diff old/PROJECT_INDEX.json PROJECT_INDEX.json
+
+Files whose record hash matches are skipped without looking at their
+symbols (indexes written by `claude-boost index` store the hash; older
+snapshots get it computed once). Removed and added files are paired up as
+renames when their symbol sets are similar enough, so a moved module shows
+up as a rename plus its real changes rather than as everything removed
+and re-added.
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from claude_boost.symbols import record_hash, symbol_map
+
+RENAME_THRESHOLD = 0.5
+
+
+def load_index(path: Path) -> Dict[str, Any]:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _hash(record: Dict[str, Any]) -> str:
+    return record.get("hash") or record_hash(record)
+
+
+def similarity(a: Dict[str, str], b: Dict[str, str]) -> float:
+    """Jaccard similarity of two symbol maps (by name and signature)"""
+    left = set(a.items())
+    right = set(b.items())
+    if not left and not right:
+        return 1.0
+    return len(left & right) / len(left | right)
+
+
+def diff_symbols(path: str, old: Dict[str, str], new: Dict[str, str], result: Dict[str, Any]):
+    """Append symbol-level changes between two records of one file"""
+    for key in sorted(new.keys() - old.keys()):
+        kind, name = key.split(":", 1)
+        result["symbols"]["added"].append({"file": path, "kind": kind, "name": name, "signature": new[key]})
+    for key in sorted(old.keys() - new.keys()):
+        kind, name = key.split(":", 1)
+        result["symbols"]["removed"].append({"file": path, "kind": kind, "name": name, "signature": old[key]})
+    for key in sorted(old.keys() & new.keys()):
+        if old[key] != new[key]:
+            kind, name = key.split(":", 1)
+            result["symbols"]["changed"].append({"file": path, "kind": kind, "name": name,
+                                                 "old": old[key], "new": new[key]})
+
+
+def match_renames(removed: Dict[str, Dict[str, Any]], added: Dict[str, Dict[str, Any]],
+                  threshold: float) -> List[Tuple[str, str, float]]:
+    """Pair removed and added files: identical hashes first, then by similarity"""
+    pairs = []  # type: List[Tuple[str, str, float]]
+    by_hash = {}  # type: Dict[str, List[str]]
+    for path, record in added.items():
+        by_hash.setdefault(_hash(record), []).append(path)
+
+    unmatched_removed = []
+    for path, record in removed.items():
+        candidates = by_hash.get(_hash(record))
+        if candidates and symbol_map(record):
+            pairs.append((path, candidates.pop(0), 1.0))
+        else:
+            unmatched_removed.append(path)
+
+    paired_new = {new for _, new, _ in pairs}
+    unmatched_added = [path for path in added if path not in paired_new]
+    if not unmatched_removed or not unmatched_added:
+        return pairs
+
+    old_maps = {path: symbol_map(removed[path]) for path in unmatched_removed}
+    new_maps = {path: symbol_map(added[path]) for path in unmatched_added}
+    scored = []
+    for old_path, old_map in old_maps.items():
+        for new_path, new_map in new_maps.items():
+            if not old_map or not new_map:
+                continue
+            score = similarity(old_map, new_map)
+            if score >= threshold:
+                # Same file name breaks ties between equally similar candidates
+                same_name = Path(old_path).name == Path(new_path).name
+                scored.append((score, same_name, old_path, new_path))
+
+    taken_old, taken_new = set(), set()
+    for score, _, old_path, new_path in sorted(scored, reverse=True):
+        if old_path not in taken_old and new_path not in taken_new:
+            taken_old.add(old_path)
+            taken_new.add(new_path)
+            pairs.append((old_path, new_path, round(score, 3)))
+    return pairs
+
+
+def diff_indexes(old: Dict[str, Any], new: Dict[str, Any],
+                 rename_threshold: float = RENAME_THRESHOLD) -> Dict[str, Any]:
+    """Files added/removed/modified/renamed and symbols added/removed/changed"""
+    old_files = old.get("files") or {}
+    new_files = new.get("files") or {}
+    result = {
+        "files": {"added": [], "removed": [], "modified": [], "renamed": [], "unchanged": 0},
+        "symbols": {"added": [], "removed": [], "changed": []},
+    }  # type: Dict[str, Any]
+
+    for path in old_files.keys() & new_files.keys():
+        if _hash(old_files[path]) == _hash(new_files[path]):
+            result["files"]["unchanged"] += 1
+            continue
+        result["files"]["modified"].append(path)
+        diff_symbols(path, symbol_map(old_files[path]), symbol_map(new_files[path]), result)
+
+    removed = {path: old_files[path] for path in old_files.keys() - new_files.keys()}
+    added = {path: new_files[path] for path in new_files.keys() - old_files.keys()}
+    for old_path, new_path, score in match_renames(removed, added, rename_threshold):
+        result["files"]["renamed"].append({"from": old_path, "to": new_path, "similarity": score})
+        if score < 1.0:
+            diff_symbols(new_path, symbol_map(removed.pop(old_path)), symbol_map(added.pop(new_path)), result)
+        else:
+            removed.pop(old_path)
+            added.pop(new_path)
+
+    for path in sorted(added):
+        result["files"]["added"].append(path)
+        diff_symbols(path, {}, symbol_map(added[path]), result)
+    for path in sorted(removed):
+        result["files"]["removed"].append(path)
+        diff_symbols(path, symbol_map(removed[path]), {}, result)
+
+    result["files"]["modified"].sort()
+    result["files"]["renamed"].sort(key=lambda r: r["to"])
+    return result
+
+
+def diff_files(old_path: Path, new_path: Path, rename_threshold: float = RENAME_THRESHOLD) -> Dict[str, Any]:
+    """Library entry point: diff two index files on disk"""
+    return diff_indexes(load_index(old_path), load_index(new_path), rename_threshold)
+
+
+def print_diff(result: Dict[str, Any], include_imports: bool = False):
+    files = result["files"]
+    print(f"📊 {len(files['modified'])} modified, {len(files['added'])} added, {len(files['removed'])} removed, "
+          f"{len(files['renamed'])} renamed, {files['unchanged']} unchanged files")
+    for rename in files["renamed"]:
+        print(f"  ➜ {rename['from']} → {rename['to']} ({rename['similarity']:.0%} similar)")
+
+    def visible(symbol: Dict[str, Any]) -> bool:
+        return include_imports or symbol["kind"] != "import"
+
+    for symbol in filter(visible, result["symbols"]["added"]):
+        print(f"  + {symbol['file']}: {symbol['kind']} {symbol['signature']}")
+    for symbol in filter(visible, result["symbols"]["removed"]):
+        print(f"  - {symbol['file']}: {symbol['kind']} {symbol['signature']}")
+    for symbol in filter(visible, result["symbols"]["changed"]):
+        print(f"  ~ {symbol['file']}: {symbol['kind']} {symbol['old']} → {symbol['new']}")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point for `claude-boost index diff`"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="claude-boost index diff",
+                                     description="Symbols added, removed or changed between two index snapshots")
+    parser.add_argument("old", help="Older PROJECT_INDEX.json")
+    parser.add_argument("new", help="Newer PROJECT_INDEX.json")
+    parser.add_argument("--rename-threshold", type=float, default=RENAME_THRESHOLD,
+                        help="Minimum symbol similarity to treat a removed+added file as a rename")
+    parser.add_argument("--imports", action="store_true", help="Also list import changes")
+    parser.add_argument("--json", action="store_true", help="Print the diff as JSON")
+    args = parser.parse_args(argv)
+
+    result = diff_files(Path(args.old), Path(args.new), args.rename_threshold)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_diff(result, args.imports)
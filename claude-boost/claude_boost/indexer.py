@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Project Indexer
+Generates PROJECT_INDEX.json using the extractor registry
+
+Files are dispatched to extractors by extension through
+claude_boost.extractors, which imports each extractor the first time a
+file needs it. Entries of unchanged files (same size and mtime) are reused
+from the previous index. Other files are stat'ed once from the directory
+scan and read once as bytes (memory-mapped when large); the `digest` of
+those bytes is compared with the previous entry before anything is
+decoded or parsed, and Python source goes to ast.parse undecoded.
+
+Every entry carries a `hash` of its symbols so snapshot diffs can skip
+unchanged files without comparing them. A memory-mappable
+PROJECT_INDEX.bin is written next to the JSON for programs that query
+the index, and PROJECT_INDEX.search.db holds the BM25 term index behind
+`claude-boost search`. PROJECT_INDEX.graph.json holds the call graph and
+per-symbol centrality (see claude_boost.callgraph), which search uses to
+rank widely used APIs first. With --deps the index also references the
+shared dependency cache (see claude_boost.deps); later runs without the
+flag, such as the hook updates, keep those references. --exclude leaves
+directories out entirely; workspaces.py passes the nested workspaces of
+a monorepo so each one is read only by its own index.
+
+The summary records, per extractor, how many files it handled and the
+time it took, so the language eating the indexing budget is visible.
+With --profile it also gets a `profile` section with wall and CPU time
+per phase, throughput and the slowest files (see claude_boost.profiling).
+"""
+import os
+import sys
+import json
+import time
+import mmap
+import fnmatch
+import hashlib
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+# Allow `python indexer.py` to import sibling modules
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_boost import extractors
+from claude_boost.binindex import BINARY_NAME, write_binary
+from claude_boost.callgraph import GRAPH_NAME, symbol_centrality, update_call_graph
+from claude_boost.profiling import DEFAULT_TOP, PER_FILE_PHASES, IndexProfile, print_profile, write_results
+from claude_boost.search import SEARCH_NAME, update_search_index
+from claude_boost.symbols import record_hash
+
+INDEX_NAME = "PROJECT_INDEX.json"
+IGNORE_PATTERNS = {
+    "node_modules", ".git", "__pycache__", ".pytest_cache", ".mypy_cache", ".tox",
+    "dist", "build", ".env", "venv", ".venv", "target", INDEX_NAME, BINARY_NAME, SEARCH_NAME,
+    GRAPH_NAME,
+}
+# Files at least this large are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD = 1 << 20
+
+
+def load_ignore_patterns(root: Path) -> Set[str]:
+    """Default ignores plus the simple name/glob entries of .gitignore"""
+    patterns = set(IGNORE_PATTERNS)
+    try:
+        with open(root / ".gitignore", "r") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith(("#", "!")):
+                    patterns.add(line.strip("/"))
+    except OSError:
+        pass
+    return patterns
+
+
+def is_ignored(name: str, rel_path: str, patterns: Set[str]) -> bool:
+    return any(fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(rel_path, pattern) for pattern in patterns)
+
+
+def load_previous(root: Path) -> Dict[str, Any]:
+    """The existing index, whose file entries are reused when a file is unchanged"""
+    try:
+        with open(root / INDEX_NAME, "r") as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return previous if isinstance(previous, dict) else {}
+
+
+def walk_tree(root: Path, patterns: Set[str],
+              excluded: Set[str] = frozenset()) -> Iterator[Tuple[str, List[os.DirEntry]]]:
+    """(relative dir, file entries) per directory, depth-first in sorted order
+
+    Like os.walk, but the scandir entries are kept so their stat is reused
+    instead of looked up again by path. Symlinked directories are not
+    followed, nor are the directories in `excluded` (paths relative to
+    the root).
+    """
+    stack = [(str(root), "")]
+    while stack:
+        path, rel_dir = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirs = []
+        files = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if not is_dir:
+                files.append(entry)
+            elif (not entry.is_symlink() and rel_dir + entry.name not in excluded
+                  and not is_ignored(entry.name, rel_dir + entry.name, patterns)):
+                subdirs.append((entry.path, f"{rel_dir}{entry.name}/"))
+        yield rel_dir, files
+        stack.extend(reversed(subdirs))
+
+
+def read_source(path: str, size: int) -> Union[bytes, mmap.mmap]:
+    """A file's bytes from one open and one read, or a read-only map of large files"""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if size >= MMAP_THRESHOLD:
+            # The map holds its own handle; pages are read as they are touched
+            return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        data = os.read(fd, size)
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def content_digest(data: Any) -> str:
+    """Digest of a file's raw bytes, compared before anything is decoded or parsed"""
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _unprofiled(name: str):
+    return nullcontext()
+
+
+def generate_project_index(root_dir: str = ".", use_cache: bool = True,
+                           dependencies: bool = False, profile: Optional[IndexProfile] = None,
+                           exclude: Sequence[str] = ()) -> Dict[str, Any]:
+    """Generate the project index for a directory, leaving out the `exclude` directories"""
+    started = time.perf_counter()
+    phase = profile.phase if profile else _unprofiled
+    root = Path(root_dir).resolve()
+    patterns = load_ignore_patterns(root)
+    previous_index = load_previous(root) if use_cache or not dependencies else {}
+    previous = (previous_index.get("files") or {}) if use_cache else {}
+
+    files = {}  # type: Dict[str, Any]
+    languages = {}  # type: Dict[str, int]
+    accounting = {}  # type: Dict[str, Dict[str, Any]]
+    directories = 0
+    total_files = 0
+    cached_files = 0
+
+    loop_started = (time.perf_counter(), time.process_time())
+    excluded = {Path(path).as_posix().strip("/") for path in exclude}
+    for rel_dir, entries in walk_tree(root, patterns, excluded):
+        if rel_dir:
+            directories += 1
+
+        for entry in entries:
+            name = entry.name
+            rel_path = rel_dir + name
+            if is_ignored(name, rel_path, patterns):
+                continue
+            total_files += 1
+            ext = os.path.splitext(name)[1].lower()
+            if ext:
+                languages[ext] = languages.get(ext, 0) + 1
+
+            extractor_name = extractors.extractor_name(ext)
+            if extractor_name is None:
+                continue
+            try:
+                # Free on Windows, where scandir already has it; one stat elsewhere
+                with phase("stat"):
+                    st = entry.stat()
+            except OSError:
+                continue
+
+            stats = accounting.setdefault(extractor_name, {"files": 0, "cached": 0, "errors": 0,
+                                                           "bytes": 0, "seconds": 0.0})
+            record = previous.get(rel_path)
+            if record and record.get("size") == st.st_size and record.get("modified") == st.st_mtime:
+                record.setdefault("hash", record_hash(record))
+                files[rel_path] = record
+                stats["cached"] += 1
+                cached_files += 1
+                continue
+
+            extract_started = time.perf_counter()
+            info = None
+            try:
+                with phase("read"):
+                    data = read_source(entry.path, st.st_size)
+                try:
+                    with phase("digest"):
+                        digest = content_digest(data)
+                    if record and record.get("digest") == digest:
+                        # Touched but not changed (checkout, formatter no-op): keep the record
+                        files[rel_path] = dict(record, modified=st.st_mtime)
+                        stats["cached"] += 1
+                        cached_files += 1
+                        if profile:
+                            profile.file(rel_path, time.perf_counter() - extract_started, st.st_size,
+                                         extractor_name)
+                        continue
+                    source = data
+                    if not extractors.accepts_bytes(ext):
+                        with phase("decode"):
+                            source = str(data, "utf-8")
+                    with phase("extract"):
+                        info = extractors.get_extractor(ext)(source)
+                    info["digest"] = digest
+                finally:
+                    if isinstance(data, mmap.mmap):
+                        data.close()
+            except Exception as e:
+                info = {"error": str(e)}
+                stats["errors"] += 1
+            stats["seconds"] += time.perf_counter() - extract_started
+            stats["files"] += 1
+            stats["bytes"] += st.st_size
+
+            info["path"] = rel_path
+            info["size"] = st.st_size
+            info["modified"] = st.st_mtime
+            with phase("hash"):
+                info["hash"] = record_hash(info)
+            files[rel_path] = info
+            if profile:
+                profile.file(rel_path, time.perf_counter() - extract_started, st.st_size, extractor_name)
+
+    if profile:
+        # The walk is the file loop minus the per-file phases inside it
+        wall = time.perf_counter() - loop_started[0]
+        cpu = time.process_time() - loop_started[1]
+        for name in ("stat",) + PER_FILE_PHASES:
+            totals = profile.phases.get(name, [0.0, 0.0])
+            wall, cpu = wall - totals[0], cpu - totals[1]
+        profile.add_phase("walk", max(wall, 0.0), max(cpu, 0.0), directories + 1)
+
+    for stats in accounting.values():
+        stats["seconds"] = round(stats["seconds"], 4)
+
+    index = {
+        "project_root": str(root),
+        "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "files": files,
+        "summary": {
+            "total_files": total_files,
+            "analyzed_files": len(files),
+            "languages": languages,
+            "directories": directories,
+            "total_functions": sum(len(info.get("functions", [])) for info in files.values()),
+            "total_classes": sum(len(info.get("classes", [])) for info in files.values()),
+            "cached_files": cached_files,
+            "extractors": dict(sorted(accounting.items(), key=lambda item: item[1]["seconds"], reverse=True)),
+            "generation_time_seconds": round(time.perf_counter() - started, 2),
+        },
+    }  # type: Dict[str, Any]
+
+    if dependencies:
+        from claude_boost.deps import index_dependencies
+        with phase("deps"):
+            result = index_dependencies(root)
+        # References only; the symbols live in the shared cache
+        index["dependencies"] = result.pop("packages")
+        index["summary"]["dependencies"] = result
+        index["summary"]["generation_time_seconds"] = round(time.perf_counter() - started, 2)
+    elif previous_index.get("dependencies") is not None:
+        # Opted in by an earlier --deps run; refreshed by the next one
+        index["dependencies"] = previous_index["dependencies"]
+        index["summary"]["dependencies"] = (previous_index.get("summary") or {}).get("dependencies")
+    if profile:
+        # Phases so far; write_index adds its own to the same profile
+        index["summary"]["profile"] = profile.summary()
+    return index
+
+
+def write_index(index: Dict[str, Any], root: Path, binary: bool = True, search: bool = True,
+                graph: bool = True, profile: Optional[IndexProfile] = None):
+    """Write PROJECT_INDEX.json atomically, then its binary, graph and search companions"""
+    phase = profile.phase if profile else _unprofiled
+    path = root / INDEX_NAME
+    tmp_path = path.with_name(f".{INDEX_NAME}.{os.getpid()}.tmp")
+    with phase("json"):
+        with open(tmp_path, "w") as f:
+            json.dump(index, f, indent=2, default=str)
+        os.replace(tmp_path, path)
+    if binary:
+        # Written second so its mtime marks it as current for open_index
+        with phase("binary"):
+            write_binary(index, root)
+    centrality = None
+    if graph:
+        with phase("graph"):
+            centrality = symbol_centrality(update_call_graph(index, root))
+    if search:
+        with phase("search"):
+            update_search_index(index, root, centrality)
+
+
+def print_summary(summary: Dict[str, Any]):
+    print(f"✅ Generated {INDEX_NAME} ({summary['analyzed_files']} files analyzed, "
+          f"{summary['cached_files']} unchanged) in {summary['generation_time_seconds']:.2f}s")
+    for name, stats in summary["extractors"].items():
+        errors = f", {stats['errors']} errors" if stats["errors"] else ""
+        print(f"  {name:<12} {stats['files']:>6} files {stats['cached']:>6} cached "
+              f"{stats['seconds']:>8.3f}s{errors}")
+    deps = summary.get("dependencies")
+    if deps:
+        print(f"  {'deps':<12} {deps['extracted']:>6} pkgs  {deps['cached']:>6} cached "
+              f"{deps['seconds']:>8.3f}s")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point for `claude-boost index [build|diff|stats|find|verify]`"""
+    import argparse
+
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "diff":
+        from claude_boost.index_diff import main as diff_main
+        diff_main(argv[1:])
+        return
+    if argv and argv[0] == "stats":
+        from claude_boost.compact import main as stats_main
+        stats_main(argv[1:])
+        return
+    if argv and argv[0] in ("find", "verify"):
+        from claude_boost.binindex import main as binary_main
+        binary_main(argv)
+        return
+
+    parser = argparse.ArgumentParser(prog="claude-boost index", description=f"Generate {INDEX_NAME}")
+    parser.add_argument("action", nargs="?", default="build", choices=["build", "diff", "stats", "find", "verify"])
+    parser.add_argument("--root", default=".", help="Project root (default: current directory)")
+    parser.add_argument("--no-cache", action="store_true", help="Re-extract every file")
+    parser.add_argument("--deps", action="store_true", help="Reference installed dependencies' APIs (cached per version)")
+    parser.add_argument("--exclude", action="append", default=[], metavar="DIR",
+                        help="Leave out a directory relative to the root (repeatable)")
+    parser.add_argument("--no-binary", action="store_true", help=f"Do not write {BINARY_NAME}")
+    parser.add_argument("--no-search", action="store_true", help=f"Do not update {SEARCH_NAME}")
+    parser.add_argument("--no-graph", action="store_true", help=f"Do not update {GRAPH_NAME}")
+    parser.add_argument("--profile", action="store_true", help="Report wall/CPU time per phase and the slowest files")
+    parser.add_argument("--profile-top", type=int, default=DEFAULT_TOP, metavar="N",
+                        help=f"Slowest files to report (default: {DEFAULT_TOP})")
+    parser.add_argument("--profile-pstats", metavar="FILE", help="Also run under cProfile and write pstats to FILE")
+    parser.add_argument("--profile-results", metavar="DIR",
+                        help="Write the profile as a benchmark results file in DIR (e.g. benchmarks/results)")
+    args = parser.parse_args(argv)
+
+    root = Path(args.root).resolve()
+    profile = None
+    if args.profile or args.profile_pstats or args.profile_results:
+        profile = IndexProfile(args.profile_top, args.profile_pstats)
+        profile.start()
+    try:
+        index = generate_project_index(str(root), use_cache=not args.no_cache, dependencies=args.deps,
+                                       profile=profile, exclude=args.exclude)
+        write_index(index, root, binary=not args.no_binary, search=not args.no_search, graph=not args.no_graph,
+                    profile=profile)
+    except Exception as e:
+        print(f"❌ Error generating project index: {e}", file=sys.stderr)
+        sys.exit(1)
+    print_summary(index["summary"])
+    if profile:
+        profile.stop()
+        index["summary"]["profile"] = profile.summary()
+        print_profile(index["summary"]["profile"])
+        if args.profile_results:
+            path = write_results(index["summary"]["profile"], Path(args.profile_results), root)
+            print(f"📈 Wrote {path}; `python benchmarks/benchmark_runner.py ingest` adds it to the history")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Installer Engine
+Installs template files into projects, writing only what changed
+
+Every installed file is recorded in .claude/.boost-manifest.json with the
+content hash of the template it came from. Re-running init compares against
+the manifest and skips identical files; upgrade replaces files the user has
+not modified and leaves a .boost-new copy next to the ones they have.
+All writes go through a temporary file and an atomic rename.
+"""
+import os
+import sys
+import json
+import glob
+import hashlib
+import difflib
+import tempfile
+from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from claude_boost import __version__
+
+TEMPLATE_DIR = Path(__file__).parent / "templates" / ".claude"
+PACKAGE_DIR = Path(__file__).parent
+MANIFEST_NAME = ".boost-manifest.json"
+CONFLICT_SUFFIX = ".boost-new"
+
+# Hook runtime shipped with the package rather than as templates
+RUNTIME_SCRIPTS = ["hostc.py", "dispatch.py", "workspaces.py", "duplicates.py"]
+
+
+@lru_cache(maxsize=None)
+def file_digest(path: Path) -> str:
+    """SHA-256 of a template file, computed once per process"""
+    return hash_bytes(path.read_bytes())
+
+
+def hash_bytes(data: bytes) -> str:
+    """SHA-256 hex digest of a buffer"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def template_plan(features: Dict[str, bool]) -> List[Tuple[Path, str, int]]:
+    """List (source, destination relative to .claude, mode) for the selected features"""
+    plan = [(TEMPLATE_DIR / "CLAUDE.md", "CLAUDE.md", 0o644)]
+
+    if features.get("smart_agents", True):
+        for agent_file in sorted((TEMPLATE_DIR / "agents").glob("*.md")):
+            plan.append((agent_file, f"agents/{agent_file.name}", 0o644))
+        for command_file in sorted((TEMPLATE_DIR / "commands").glob("*.md")):
+            plan.append((command_file, f"commands/{command_file.name}", 0o644))
+
+    if features.get("project_indexer", True):
+        for hook_file in sorted((TEMPLATE_DIR / "hooks").glob("*.py")):
+            plan.append((hook_file, f"hooks/{hook_file.name}", 0o755))
+        for runtime_script in RUNTIME_SCRIPTS:
+            plan.append((PACKAGE_DIR / runtime_script, f"hooks/{runtime_script}", 0o755))
+
+    return plan
+
+
+def atomic_write(dest: Path, data: bytes, mode: int):
+    """Write a file via a temporary sibling and rename it into place"""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(dest.parent), prefix=f".{dest.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, dest)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class Installer:
+    """Installs or upgrades the templates of one project"""
+
+    def __init__(self, project_root: Path, features: Optional[Dict[str, bool]] = None):
+        self.project_root = Path(project_root)
+        self.claude_dir = self.project_root / ".claude"
+        self.manifest_path = self.claude_dir / MANIFEST_NAME
+        self.features = features or {}
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> Dict:
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+            if isinstance(manifest.get("files"), dict):
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {"version": None, "files": {}}
+
+    def _save_manifest(self):
+        self.manifest["version"] = __version__
+        data = json.dumps(self.manifest, indent=2, sort_keys=True).encode("utf-8")
+        atomic_write(self.manifest_path, data, 0o644)
+
+    def installed_digest(self, rel_path: str) -> Optional[str]:
+        """Current digest of an installed file, trusting the manifest when stat matches"""
+        dest = self.claude_dir / rel_path
+        try:
+            st = dest.stat()
+        except OSError:
+            return None
+        entry = self.manifest["files"].get(rel_path)
+        if entry and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+            return entry["sha256"]
+        return hash_bytes(dest.read_bytes())
+
+    def _record(self, rel_path: str, digest: str):
+        st = (self.claude_dir / rel_path).stat()
+        self.manifest["files"][rel_path] = {
+            "sha256": digest,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+        }
+
+    def install(self) -> Dict[str, List[str]]:
+        """Write every planned file whose content differs from the template"""
+        report = {"written": [], "unchanged": []}  # type: Dict[str, List[str]]
+        for source, rel_path, mode in template_plan(self.features):
+            digest = file_digest(source)
+            if self.installed_digest(rel_path) == digest:
+                report["unchanged"].append(rel_path)
+            else:
+                atomic_write(self.claude_dir / rel_path, source.read_bytes(), mode)
+                report["written"].append(rel_path)
+            self._record(rel_path, digest)
+
+        if report["written"] or not self.manifest_path.exists():
+            self._save_manifest()
+        return report
+
+    def upgrade(self, dry_run: bool = False, force: bool = False) -> Dict[str, List[str]]:
+        """Bring installed files up to date without clobbering local edits"""
+        report = {"updated": [], "unchanged": [], "conflicts": [], "diffs": []}  # type: Dict[str, List[str]]
+        for source, rel_path, mode in template_plan(self.installed_features()):
+            digest = file_digest(source)
+            current = self.installed_digest(rel_path)
+            if current == digest:
+                report["unchanged"].append(rel_path)
+                continue
+
+            recorded = self.manifest["files"].get(rel_path, {}).get("sha256")
+            locally_modified = current is not None and current != recorded
+            dest = self.claude_dir / rel_path
+            report["diffs"].append(self._diff(dest, source, rel_path))
+
+            if locally_modified and not force:
+                report["conflicts"].append(rel_path)
+                if not dry_run:
+                    atomic_write(dest.with_name(dest.name + CONFLICT_SUFFIX), source.read_bytes(), mode)
+                continue
+
+            report["updated"].append(rel_path)
+            if not dry_run:
+                atomic_write(dest, source.read_bytes(), mode)
+                self._record(rel_path, digest)
+
+        if report["updated"] and not dry_run:
+            self._save_manifest()
+        return report
+
+    def installed_features(self) -> Dict[str, bool]:
+        """Infer the selected features from what is already installed"""
+        if self.features:
+            return self.features
+        files = self.manifest["files"]
+        return {
+            "smart_agents": any(p.startswith(("agents/", "commands/")) for p in files)
+                            or (self.claude_dir / "agents").is_dir(),
+            "project_indexer": any(p.startswith("hooks/") for p in files)
+                               or (self.claude_dir / "hooks").is_dir(),
+        }
+
+    @staticmethod
+    def _diff(dest: Path, source: Path, rel_path: str) -> str:
+        try:
+            old = dest.read_text(encoding="utf-8").splitlines(keepends=True)
+        except (OSError, UnicodeDecodeError):
+            old = []
+        new = source.read_text(encoding="utf-8").splitlines(keepends=True)
+        return "".join(difflib.unified_diff(old, new, f"a/.claude/{rel_path}", f"b/.claude/{rel_path}"))
+
+
+def expand_repos(pattern: str) -> List[Path]:
+    """Resolve a --repos glob to project directories"""
+    return [Path(p) for p in sorted(glob.glob(os.path.expanduser(pattern))) if os.path.isdir(p)]
+
+
+def run_batch(repos: List[Path], action, jobs: Optional[int] = None) -> Dict[str, Dict]:
+    """Apply an action to many repositories on a thread pool"""
+    results = {}  # type: Dict[str, Dict]
+    workers = jobs or min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(action, repo): repo for repo in repos}
+        for future, repo in futures.items():
+            try:
+                results[str(repo)] = future.result()
+            except Exception as e:
+                results[str(repo)] = {"error": str(e)}
+    return results
+
+
+def print_batch_summary(results: Dict[str, Dict], keys: List[str]):
+    """Print one line per repository and a total"""
+    failed = 0
+    for repo, report in results.items():
+        if "error" in report:
+            failed += 1
+            print(f"  ❌ {repo}: {report['error']}")
+        else:
+            counts = ", ".join(f"{len(report[key])} {key}" for key in keys)
+            print(f"  ✅ {repo}: {counts}")
+    print(f"\n{len(results) - failed}/{len(results)} repositories succeeded")
+
+
+def upgrade_main(argv: Optional[List[str]] = None):
+    """Entry point for `claude-boost upgrade`"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="claude-boost upgrade",
+        description="Update installed templates, keeping local modifications",
+    )
+    parser.add_argument("--repos", help="Glob of repositories to upgrade (default: current directory)")
+    parser.add_argument("--dry-run", action="store_true", help="Show the diffs without writing")
+    parser.add_argument("--force", action="store_true", help="Overwrite locally modified files")
+    parser.add_argument("--jobs", type=int, help="Parallel workers for --repos")
+    args = parser.parse_args(argv)
+
+    if not TEMPLATE_DIR.exists():
+        print(f"❌ Template directory not found: {TEMPLATE_DIR}")
+        sys.exit(1)
+
+    def upgrade_repo(repo: Path) -> Dict[str, List[str]]:
+        if not (repo / ".claude").is_dir():
+            raise RuntimeError("Claude Code Boost is not installed here")
+        return Installer(repo).upgrade(dry_run=args.dry_run, force=args.force)
+
+    if args.repos:
+        repos = expand_repos(args.repos)
+        print(f"⬆️ Upgrading {len(repos)} repositories...")
+        results = run_batch(repos, upgrade_repo, args.jobs)
+        print_batch_summary(results, ["updated", "unchanged", "conflicts"])
+        sys.exit(1 if any("error" in r for r in results.values()) else 0)
+
+    try:
+        report = upgrade_repo(Path("."))
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if args.dry_run:
+        for diff in report["diffs"]:
+            print(diff)
+    for rel_path in report["updated"]:
+        print(f"  {'~' if args.dry_run else '✅'} .claude/{rel_path}")
+    for rel_path in report["conflicts"]:
+        if args.dry_run:
+            print(f"  ⚠️ .claude/{rel_path} has local changes and would not be replaced")
+        else:
+            print(f"  ⚠️ .claude/{rel_path} has local changes; new version saved as {rel_path}{CONFLICT_SUFFIX}")
+    if not report["updated"] and not report["conflicts"]:
+        print("✅ Everything is up to date")
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Long-Term Memory
+Compacts session records into a bounded, deduplicated store of facts
+
+    claude-boost memory compact
+    claude-boost memory show --files src/auth.py --budget 800
+    claude-boost memory add "Use the pool from db/pool.py, never raw connects" --files db/pool.py
+
+Session records are whatever the session hooks and commands leave in
+.claude/state: last_session.json and any records archived under
+.claude/state/sessions/ (JSON, JSONL, Markdown or plain text). Each one
+is split into facts: string fields, list items and bullet lines, minus
+ids, timestamps and other bookkeeping. A fact remembers the indexed
+files it mentions.
+
+Near-identical facts are merged by SimHash: the shingles are the words
+and word pairs of a fact after the search tokenizer's stemming and
+stopword removal, and two facts whose 64-bit fingerprints differ in at
+most MAX_DISTANCE bits are one fact, seen twice (unrelated texts differ
+in about 32). The latest wording is kept. Facts whose files have all
+left PROJECT_INDEX.json are dropped, and beyond MAX_FACTS the least
+relevant go. Relevance is how often a fact recurred, halved every
+HALF_LIFE_DAYS since it was last seen.
+
+`recall` (and `memory show`) returns facts most relevant first, boosted
+by overlap with given files or query words, cut to a token budget, so
+what a SessionStart hook loads stays small however long the project
+runs. Records already compacted are remembered by digest and skipped.
+"""
+import os
+import re
+import sys
+import json
+import math
+import time
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+# Allow `python memory.py` to import sibling modules
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_boost.context import count_tokens
+from claude_boost.search import terms
+
+STATE_DIR = Path(".claude") / "state"
+MEMORY_FILE = STATE_DIR / "long-term-memory.json"
+SESSION_RECORDS = [STATE_DIR / "last_session.json"]
+SESSIONS_DIR = STATE_DIR / "sessions"
+INDEX_NAME = "PROJECT_INDEX.json"
+
+MAX_FACTS = 500
+DEFAULT_BUDGET = 1000
+HALF_LIFE_DAYS = 30.0
+# SimHash: 64-bit fingerprints, near-duplicates within this many bits
+BITS = 64
+MAX_DISTANCE = 8
+MIN_FACT_CHARS = 12
+
+# Record fields that are bookkeeping, not knowledge
+SKIP_KEYS = {
+    "session_id", "id", "timestamp", "time", "date", "saved_at", "started_at", "ended_at", "created_at",
+    "updated_at", "transcript_path", "cwd", "hook_event_name", "version", "source", "reason", "model",
+    "permission_mode",
+}
+TIME_KEYS = ("ended_at", "saved_at", "timestamp", "updated_at", "created_at")
+BULLET = re.compile(r"^\s*(?:[-*+•]|\d+[.)]|\[[ xX]\])\s+")
+PATH_MENTION = re.compile(r"[\w.\-/]+\.[A-Za-z]{1,5}\b")
+WORDS = re.compile(r"\w+")
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of a text's stemmed words and word pairs"""
+    words = terms(text) or WORDS.findall(text.lower())
+    shingles = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    weights = [0] * BITS
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit in range(BITS) if weights[bit] > 0)
+
+
+def distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def _lines(text: str) -> Iterator[str]:
+    """Bullets and paragraphs of a prose field"""
+    paragraph = []  # type: List[str]
+    for line in text.splitlines() + [""]:
+        if BULLET.match(line) or not line.strip() or line.lstrip().startswith("#"):
+            if paragraph:
+                yield " ".join(paragraph)
+                paragraph = []
+            if BULLET.match(line):
+                paragraph = [BULLET.sub("", line).strip()]
+        else:
+            paragraph.append(line.strip())
+
+
+def record_facts(record: Any) -> Iterator[str]:
+    """Fact texts of a session record (parsed JSON or text)"""
+    if isinstance(record, str):
+        for line in _lines(record):
+            if len(line) >= MIN_FACT_CHARS:
+                yield line
+    elif isinstance(record, dict):
+        text = record.get("text") or record.get("note") or record.get("summary")
+        if isinstance(text, str) and set(record) <= {"text", "note", "summary", "files"} | SKIP_KEYS:
+            yield from record_facts(text)
+            return
+        for key, value in record.items():
+            if key not in SKIP_KEYS:
+                yield from record_facts(value)
+    elif isinstance(record, list):
+        for item in record:
+            yield from record_facts(item)
+
+
+def record_time(record: Any, fallback: float) -> float:
+    if isinstance(record, dict):
+        for key in TIME_KEYS:
+            value = record.get(key)
+            if isinstance(value, (int, float)):
+                return float(value)
+            if isinstance(value, str):
+                try:
+                    return time.mktime(time.strptime(value[:19].replace("T", " "), "%Y-%m-%d %H:%M:%S"))
+                except ValueError:
+                    continue
+    return fallback
+
+
+def load_record(path: Path) -> List[Any]:
+    """Parsed records of one file: a JSON document, JSON lines, or text"""
+    text = path.read_text(encoding="utf-8", errors="replace")
+    if path.suffix == ".json":
+        return [json.loads(text)]
+    if path.suffix == ".jsonl":
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    return [text]
+
+
+def indexed_paths(root: Path) -> Optional[Set[str]]:
+    """Paths of PROJECT_INDEX.json (None when there is no index to age facts against)"""
+    try:
+        with open(root / INDEX_NAME, "r") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    paths = set(index.get("files") or {})
+    for workspace in index.get("workspaces") or []:
+        try:
+            with open(root / workspace["index"], "r") as f:
+                shard = json.load(f)
+        except (OSError, ValueError):
+            continue
+        prefix = workspace["path"].rstrip("/") + "/"
+        paths.update(prefix + path for path in shard.get("files") or {})
+    return paths
+
+
+def by_basename(paths: Optional[Set[str]]) -> Dict[str, List[str]]:
+    names = {}  # type: Dict[str, List[str]]
+    for path in paths or ():
+        names.setdefault(path.rpartition("/")[2], []).append(path)
+    return names
+
+
+def mentioned_files(text: str, names: Dict[str, List[str]]) -> List[str]:
+    """Indexed files a fact names, by path or unique suffix (`names` from by_basename)"""
+    found = set()
+    for mention in PATH_MENTION.findall(text):
+        mention = mention[2:] if mention.startswith("./") else mention
+        matches = [path for path in names.get(mention.rpartition("/")[2], ())
+                   if path == mention or path.endswith("/" + mention)]
+        if len(matches) == 1:
+            found.add(matches[0])
+    return sorted(found)
+
+
+def relevance(fact: Dict[str, Any], now: float) -> float:
+    age_days = max(now - fact["last_seen"], 0.0) / 86400
+    return (1 + math.log(fact["count"])) * 0.5 ** (age_days / HALF_LIFE_DAYS)
+
+
+class MemoryStore:
+    """Facts with their SimHash, files, recurrence count and first/last sighting"""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.path = root / MEMORY_FILE
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        self.facts = data.get("facts") or []  # type: List[Dict[str, Any]]
+        # Digests of records already compacted, so re-reading them does not recount
+        self.sources = data.get("sources") or {}  # type: Dict[str, str]
+
+    def find(self, fingerprint: int) -> Optional[Dict[str, Any]]:
+        """The stored fact nearest a fingerprint, if within MAX_DISTANCE bits"""
+        # A scan is cheap at MAX_FACTS; bands narrow enough for 8 bits would not be
+        best = min(self.facts, key=lambda fact: distance(int(fact["simhash"], 16), fingerprint), default=None)
+        if best is not None and distance(int(best["simhash"], 16), fingerprint) <= MAX_DISTANCE:
+            return best
+        return None
+
+    def add(self, text: str, seen: float, files: List[str] = (), source: Optional[str] = None) -> bool:
+        """Add a fact or merge it into its near-duplicate; True when it is new"""
+        text = " ".join(text.split())
+        fingerprint = simhash(text)
+        fact = self.find(fingerprint)
+        if fact is not None:
+            fact["count"] += 1
+            if seen >= fact["last_seen"]:
+                # The latest wording wins; facts get refined over time
+                fact["text"], fact["simhash"], fact["last_seen"] = text, f"{fingerprint:016x}", seen
+            fact["first_seen"] = min(fact["first_seen"], seen)
+            fact["files"] = sorted(set(fact["files"]) | set(files))
+            return False
+        fact = {"text": text, "simhash": f"{fingerprint:016x}", "files": sorted(set(files)), "count": 1,
+                "first_seen": seen, "last_seen": seen, "source": source}
+        self.facts.append(fact)
+        return True
+
+    def age_out(self, paths: Optional[Set[str]]) -> int:
+        """Drop facts whose files have all left the index; forget the missing ones of the rest"""
+        if paths is None:
+            return 0
+        kept = []
+        for fact in self.facts:
+            if fact["files"]:
+                present = [path for path in fact["files"] if path in paths]
+                if not present:
+                    continue
+                fact["files"] = present
+            kept.append(fact)
+        dropped = len(self.facts) - len(kept)
+        self.facts = kept
+        return dropped
+
+    def bound(self, limit: int = MAX_FACTS, now: Optional[float] = None) -> int:
+        """Keep the `limit` most relevant facts"""
+        now = time.time() if now is None else now
+        if len(self.facts) <= limit:
+            return 0
+        dropped = len(self.facts) - limit
+        self.facts = sorted(self.facts, key=lambda fact: relevance(fact, now), reverse=True)[:limit]
+        return dropped
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"facts": self.facts, "sources": self.sources}, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+
+def session_records(root: Path) -> List[Path]:
+    """Records the session hooks and commands leave behind"""
+    records = [root / path for path in SESSION_RECORDS if (root / path).is_file()]
+    if (root / SESSIONS_DIR).is_dir():
+        records += sorted(path for path in (root / SESSIONS_DIR).iterdir()
+                          if path.suffix in (".json", ".jsonl", ".md", ".txt"))
+    return records
+
+
+def compact(root: Path, records: Optional[List[Path]] = None, limit: int = MAX_FACTS,
+            prune: bool = False) -> Dict[str, Any]:
+    """Merge session records into the store, then age it out and bound it"""
+    started = time.perf_counter()
+    store = MemoryStore(root)
+    paths = indexed_paths(root)
+    names = by_basename(paths)
+    records = session_records(root) if records is None else records
+    read = added = merged = 0
+    for path in records:
+        try:
+            digest = hashlib.blake2b(path.read_bytes(), digest_size=8).hexdigest()
+            key = os.path.relpath(path, root)
+            if store.sources.get(key) == digest:
+                continue
+            parsed = load_record(path)
+        except (OSError, ValueError) as e:
+            print(f"  ⚠️ Skipping {path}: {e}", file=sys.stderr)
+            continue
+        read += 1
+        fallback = path.stat().st_mtime
+        for record in parsed:
+            seen = record_time(record, fallback)
+            for text in record_facts(record):
+                if store.add(text, seen, mentioned_files(text, names), key):
+                    added += 1
+                else:
+                    merged += 1
+        store.sources[key] = digest
+        # Archived records are folded in; the live last_session.json stays
+        if prune and path.parent == root / SESSIONS_DIR:
+            path.unlink()
+            store.sources.pop(key)
+
+    aged = store.age_out(paths)
+    evicted = store.bound(limit)
+    store.save()
+    return {"records": read, "added": added, "merged": merged, "aged_out": aged, "evicted": evicted,
+            "facts": len(store.facts), "seconds": round(time.perf_counter() - started, 3)}
+
+
+def recall(root: Path, query: Optional[str] = None, files: List[str] = (), limit: Optional[int] = None,
+           budget: Optional[int] = DEFAULT_BUDGET) -> List[Dict[str, Any]]:
+    """Facts most relevant first, boosted by shared files and query words, within a token budget"""
+    store = MemoryStore(root)
+    now = time.time()
+    wanted_files = set(files)
+    wanted_terms = set(terms(query or ""))
+
+    def score(fact: Dict[str, Any]) -> float:
+        value = relevance(fact, now)
+        if wanted_files and wanted_files & set(fact["files"]):
+            value *= 2
+        if wanted_terms:
+            value *= 1 + len(wanted_terms & set(terms(fact["text"])))
+        return value
+
+    ranked = sorted(store.facts, key=score, reverse=True)
+    chosen = []
+    used = 0
+    for fact in ranked:
+        if limit is not None and len(chosen) >= limit:
+            break
+        cost = count_tokens(fact["text"]) + 2
+        if budget is not None and used + cost > budget:
+            continue
+        chosen.append(dict(fact, relevance=round(score(fact), 4)))
+        used += cost
+    return chosen
+
+
+def format_facts(facts: List[Dict[str, Any]]) -> str:
+    """Markdown bullets, e.g. for a SessionStart additionalContext"""
+    return "\n".join(f"- {fact['text']}" for fact in facts)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point for `claude-boost memory`"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="claude-boost memory",
+                                     description="Long-term memory compacted from session records")
+    parser.add_argument("action", nargs="?", default="show", choices=["compact", "show", "add", "forget"])
+    parser.add_argument("text", nargs="*", help="compact: record files (default: session state); "
+                                                "add: the fact; forget: words of the facts to drop")
+    parser.add_argument("--files", nargs="+", default=[], metavar="PATH",
+                        help="show: boost facts about these files; add: files the fact is about")
+    parser.add_argument("--query", help="show: boost facts sharing these words")
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET, help=f"show: token budget (default: {DEFAULT_BUDGET})")
+    parser.add_argument("--limit", type=int, default=MAX_FACTS, help=f"compact: facts kept (default: {MAX_FACTS})")
+    parser.add_argument("--prune", action="store_true", help="compact: delete archived session records once merged")
+    parser.add_argument("--root", default=".", help="Project root (default: current directory)")
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args(argv)
+
+    root = Path(args.root)
+    if args.action == "compact":
+        records = [Path(path) for path in args.text] or None
+        result = compact(root, records, args.limit, args.prune)
+        if args.json:
+            print(json.dumps(result, indent=2))
+            return
+        print(f"🧠 {result['facts']} facts: {result['added']} new, {result['merged']} merged from "
+              f"{result['records']} records, {result['aged_out']} aged out, {result['evicted']} evicted "
+              f"in {result['seconds']:.2f}s")
+        return
+
+    if args.action == "add":
+        if not args.text:
+            parser.error("add needs the fact's text")
+        store = MemoryStore(root)
+        new = store.add(" ".join(args.text), time.time(), args.files, "manual")
+        store.save()
+        print("🧠 Added" if new else "🧠 Merged into an existing fact")
+        return
+
+    if args.action == "forget":
+        if not args.text:
+            parser.error("forget needs words of the facts to drop")
+        store = MemoryStore(root)
+        needle = " ".join(args.text).lower()
+        before = len(store.facts)
+        store.facts = [fact for fact in store.facts if needle not in fact["text"].lower()]
+        store.save()
+        print(f"🧹 Forgot {before - len(store.facts)} fact(s)")
+        return
+
+    facts = recall(root, args.query, args.files, budget=args.budget)
+    if args.json:
+        print(json.dumps(facts, indent=2))
+    elif facts:
+        print(format_facts(facts))
+
+
+if __name__ == "__main__":
+    main()
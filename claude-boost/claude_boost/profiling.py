@@ -0,0 +1,157 @@
+"""
+Claude Code Boost Indexer Profiling
+Per-phase wall and CPU time of an index build
+
+`claude-boost index --profile` threads an IndexProfile through
+generate_project_index and write_index. Each phase (walk, stat, read,
+digest, decode, extract, hash, deps, then json, binary, graph and
+search) accumulates wall and CPU time; the walk is what remains of the
+file loop once the per-file phases are taken out. Files are ranked by
+the time from reading to hashing their record, to find the handful of
+generated or vendored files that dominate a build. With a pstats path
+the whole build also runs under cProfile.
+
+The profile lands in summary["profile"] and can be written as a
+benchmark results file (timings per phase, throughput as results) that
+benchmarks/benchmark_history.py ingests like any other run.
+"""
+import os
+import json
+import time
+import heapq
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+DEFAULT_TOP = 10
+# Phases spent on the files themselves, the basis of the throughput figures
+PER_FILE_PHASES = ("read", "digest", "decode", "extract", "hash")
+# Benchmark results files the history store picks up
+RESULTS_PREFIX = "benchmark_results_"
+
+
+class IndexProfile:
+    """Phase timings, bytes read and the slowest files of one index build"""
+
+    def __init__(self, top: int = DEFAULT_TOP, pstats_path: Optional[str] = None):
+        self.top = top
+        self.pstats_path = pstats_path
+        # name → [wall, cpu, calls]
+        self.phases = {}
+        self.bytes_read = 0
+        self.files_read = 0
+        # Min-heap of (seconds, path, size, extractor)
+        self._slowest = []
+        # (perf_counter, process_time) pairs
+        self._started = None
+        self._finished = None
+        self._profiler = None
+
+    def start(self):
+        self._started = (time.perf_counter(), time.process_time())
+        if self.pstats_path:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def stop(self):
+        self._finished = (time.perf_counter(), time.process_time())
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler.dump_stats(self.pstats_path)
+            self._profiler = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            totals = self.phases.setdefault(name, [0.0, 0.0, 0])
+            totals[0] += time.perf_counter() - wall
+            totals[1] += time.process_time() - cpu
+            totals[2] += 1
+
+    def add_phase(self, name: str, wall: float, cpu: float, calls: int = 1):
+        totals = self.phases.setdefault(name, [0.0, 0.0, 0])
+        totals[0] += wall
+        totals[1] += cpu
+        totals[2] += calls
+
+    def file(self, path: str, seconds: float, size: int, extractor: str):
+        """Count one file read and keep it if it is among the slowest"""
+        self.bytes_read += size
+        self.files_read += 1
+        item = (seconds, path, size, extractor)
+        if len(self._slowest) < self.top:
+            heapq.heappush(self._slowest, item)
+        elif item > self._slowest[0]:
+            heapq.heapreplace(self._slowest, item)
+
+    def summary(self) -> Dict[str, Any]:
+        now = (time.perf_counter(), time.process_time())
+        started = self._started or now
+        finished = self._finished or now
+        wall, cpu = finished[0] - started[0], finished[1] - started[1]
+        per_file = sum(self.phases.get(name, [0.0])[0] for name in PER_FILE_PHASES) or wall
+        return {
+            "wall_seconds": round(wall, 4),
+            "cpu_seconds": round(cpu, 4),
+            "phases": {name: {"wall_seconds": round(totals[0], 4), "cpu_seconds": round(totals[1], 4),
+                              "calls": totals[2]}
+                       for name, totals in sorted(self.phases.items(), key=lambda item: item[1][0], reverse=True)},
+            "files_read": self.files_read,
+            "bytes_read": self.bytes_read,
+            "files_per_second": round(self.files_read / per_file, 1) if per_file else 0.0,
+            "mb_per_second": round(self.bytes_read / per_file / 1e6, 2) if per_file else 0.0,
+            "slowest_files": [{"path": path, "seconds": round(seconds, 4), "bytes": size, "extractor": extractor}
+                              for seconds, path, size, extractor in sorted(self._slowest, reverse=True)],
+            "pstats": self.pstats_path,
+        }
+
+
+def print_profile(profile: Dict[str, Any], pstats_lines: int = 15):
+    print(f"⏱️  Profile: {profile['wall_seconds']:.3f}s wall, {profile['cpu_seconds']:.3f}s CPU, "
+          f"{profile['files_read']} files read ({profile['bytes_read'] / 1e6:.1f} MB), "
+          f"{profile['files_per_second']:,.0f} files/s, {profile['mb_per_second']:.1f} MB/s")
+    for name, phase in profile["phases"].items():
+        share = 100 * phase["wall_seconds"] / profile["wall_seconds"] if profile["wall_seconds"] else 0.0
+        print(f"  {name:<10} {phase['wall_seconds']:>8.3f}s wall {phase['cpu_seconds']:>8.3f}s CPU "
+              f"{share:>5.1f}%  ×{phase['calls']}")
+    if profile["slowest_files"]:
+        print("  Slowest files:")
+        for item in profile["slowest_files"]:
+            print(f"    {item['seconds'] * 1e3:>8.1f}ms {item['bytes']:>9,} B  {item['extractor']:<10} {item['path']}")
+    if profile.get("pstats"):
+        import pstats
+        print(f"  cProfile written to {profile['pstats']}; top functions by cumulative time:")
+        pstats.Stats(profile["pstats"]).sort_stats("cumulative").print_stats(pstats_lines)
+
+
+def write_results(profile: Dict[str, Any], results_dir: Path, root: Path) -> Path:
+    """Write the profile as a benchmark results file for the history store"""
+    session = f"index_profile_{time.strftime('%Y%m%d_%H%M%S')}"
+    results = {
+        "test_session_id": session,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        # One sample per phase; repeated builds become repeated runs
+        "timings": {f"index_{name}": {"values": [phase["wall_seconds"]]}
+                    for name, phase in profile["phases"].items()},
+        "results": {"index_profile": {
+            "project_root": str(root),
+            "wall_seconds": profile["wall_seconds"],
+            "cpu_seconds": profile["cpu_seconds"],
+            "files_read": profile["files_read"],
+            "bytes_read": profile["bytes_read"],
+            "files_per_second": profile["files_per_second"],
+            "mb_per_second": profile["mb_per_second"],
+        }},
+    }
+    results["timings"]["index_total"] = {"values": [profile["wall_seconds"]]}
+    results_dir.mkdir(parents=True, exist_ok=True)
+    path = results_dir / f"{RESULTS_PREFIX}{session}.json"
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(results, f, indent=2)
+    os.replace(tmp_path, path)
+    return path
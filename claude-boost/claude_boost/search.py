@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Symbol Search
+BM25-ranked search over the symbols of PROJECT_INDEX.json
+
+    claude-boost search "validate admin credentials"
+
+Every function, class, method and schema object is one document. Its
+terms are the split identifier (`validateAdminUser` → validate, admin,
+user), the owning class, argument names, the file name and the first
+line of its docstring, all lowercased and lightly stemmed so "validates"
+finds `validate`.
+
+The inverted index lives in PROJECT_INDEX.search.db, a SQLite database
+next to the JSON. It is updated file by file: a file whose hash, size
+and mtime are unchanged keeps its postings, so re-indexing after an edit
+rewrites only that file's rows. A query reads the postings of its own
+terms only, so answering it does not depend on the size of the project.
+
+When the call graph is built (see claude_boost.callgraph), each symbol's
+centrality is stored alongside and boosts the BM25 score of widely used
+APIs, so among similar matches the one the project relies on comes first.
+Each document also keeps the name key and shape that the duplicate guard
+(claude_boost.duplicates) looks new definitions up by.
+"""
+import re
+import sys
+import math
+import time
+import heapq
+import sqlite3
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Allow `python search.py` to import sibling modules
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_boost.duplicates import name_key, shape
+from claude_boost.symbols import iter_symbols
+
+SEARCH_NAME = "PROJECT_INDEX.search.db"
+SCHEMA_VERSION = "3"
+# Symbol kinds that become documents (imports, constants and exports do not)
+DOCUMENT_KINDS = {"function", "class", "method", "interface", "type", "table", "view", "trigger"}
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+# Score multiplier per e-fold of above-average centrality, and how many
+# BM25 candidates are re-ranked with it
+CENTRALITY_WEIGHT = 0.1
+RERANK_POOL = 50
+
+STOPWORDS = {
+    "a", "an", "the", "of", "to", "for", "and", "or", "in", "on", "is", "are", "be", "by", "with",
+    "from", "that", "this", "it", "as", "at", "there", "already", "something", "anything", "any",
+    "which", "what", "does", "do", "we", "have", "has", "self", "cls", "args", "kwargs",
+}
+WORD = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, key TEXT);
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY, path TEXT, kind TEXT, name TEXT, signature TEXT,
+    line INTEGER, doc TEXT, length INTEGER, key TEXT, shape TEXT
+);
+-- Document length is repeated in each posting so scoring never joins docs
+CREATE TABLE IF NOT EXISTS postings (term TEXT, doc_id INTEGER, tf INTEGER, length INTEGER);
+-- Symbols above the call graph's floor; the rest count as 0
+CREATE TABLE IF NOT EXISTS centrality (path TEXT, name TEXT, score REAL, PRIMARY KEY (path, name));
+CREATE INDEX IF NOT EXISTS docs_path ON docs (path);
+-- Name and shape keys the duplicate guard looks new definitions up by
+CREATE INDEX IF NOT EXISTS docs_name ON docs (name);
+CREATE INDEX IF NOT EXISTS docs_key ON docs (key);
+CREATE INDEX IF NOT EXISTS docs_shape ON docs (shape);
+CREATE INDEX IF NOT EXISTS postings_term ON postings (term, doc_id, tf, length);
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id);
+"""
+
+
+def stem(word: str) -> str:
+    """Strip plural, -ing/-ed and trailing e so word forms share a term"""
+    if word.endswith("sses"):
+        word = word[:-2]
+    elif word.endswith("ies") and len(word) > 4:
+        word = word[:-3] + "y"
+    elif word.endswith("s") and not word.endswith("ss") and len(word) > 3:
+        word = word[:-1]
+    if word.endswith("ing") and len(word) > 5:
+        word = word[:-3]
+    elif word.endswith("ed") and len(word) > 4:
+        word = word[:-2]
+    if word.endswith("e") and len(word) > 4:
+        word = word[:-1]
+    return word
+
+
+def terms(text: str) -> List[str]:
+    """Split identifiers and prose into stemmed, lowercased terms"""
+    return [stem(word) for word in (match.lower() for match in WORD.findall(text or ""))
+            if word not in STOPWORDS and len(word) > 1]
+
+
+def documents(path: str, record: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Searchable documents of one file record"""
+    docs = {}  # type: Dict[str, str]
+    for item in record.get("functions") or []:
+        if isinstance(item, dict) and item.get("doc"):
+            docs[item["name"]] = item["doc"]
+    for item in record.get("classes") or []:
+        if not isinstance(item, dict):
+            continue
+        if item.get("doc"):
+            docs[item["name"]] = item["doc"]
+        for method in item.get("methods") or []:
+            if isinstance(method, dict) and method.get("doc"):
+                docs[f"{item['name']}.{method['name']}"] = method["doc"]
+
+    file_terms = terms(Path(path).stem)
+    for symbol in iter_symbols(record):
+        if symbol.kind not in DOCUMENT_KINDS:
+            continue
+        doc = docs.get(symbol.name)
+        # The signature carries the name, owning class and argument names;
+        # adding the name again weights it over the rest
+        counts = Counter(terms(symbol.signature) + terms(symbol.name) + file_terms + terms(doc or ""))
+        yield {
+            "kind": symbol.kind,
+            "name": symbol.name,
+            "signature": symbol.signature,
+            "line": symbol.line,
+            "doc": doc,
+            "terms": counts,
+        }
+
+
+def file_key(record: Dict[str, Any]) -> str:
+    """Changes whenever the file does (the record hash ignores docstrings)"""
+    return f"{record.get('hash')}:{record.get('size')}:{record.get('modified')}"
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    db = sqlite3.connect(str(path))
+    db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+    row = db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+    if row is None or row[0] != SCHEMA_VERSION:
+        # Before the schema script, whose indexes may name columns an old docs table lacks
+        db.executescript("DROP TABLE IF EXISTS postings; DROP TABLE IF EXISTS docs; DROP TABLE IF EXISTS files;")
+        db.executescript(SCHEMA)
+        db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (SCHEMA_VERSION,))
+    db.executescript(SCHEMA)
+    return db
+
+
+def _remove_file(db: sqlite3.Connection, path: str):
+    db.execute("DELETE FROM postings WHERE doc_id IN (SELECT id FROM docs WHERE path = ?)", (path,))
+    db.execute("DELETE FROM docs WHERE path = ?", (path,))
+    db.execute("DELETE FROM files WHERE path = ?", (path,))
+
+
+def update_search_index(index: Dict[str, Any], root: Path,
+                        centrality: Optional[Dict[Tuple[str, str], float]] = None) -> Dict[str, Any]:
+    """Bring the search index in line with an index, re-tokenizing changed files only
+
+    `centrality` maps (path, symbol name) to call graph centrality; when
+    given it replaces the stored scores.
+    """
+    started = time.perf_counter()
+    files = index.get("files") or {}
+    db = connect(root / SEARCH_NAME)
+    try:
+        with db:
+            known = dict(db.execute("SELECT path, key FROM files"))
+            removed = [path for path in known if path not in files]
+            for path in removed:
+                _remove_file(db, path)
+
+            updated = 0
+            for path, record in files.items():
+                if not isinstance(record, dict) or record.get("error"):
+                    continue
+                key = file_key(record)
+                if known.get(path) == key:
+                    continue
+                if path in known:
+                    _remove_file(db, path)
+                for doc in documents(path, record):
+                    length = sum(doc["terms"].values())
+                    cursor = db.execute(
+                        "INSERT INTO docs (path, kind, name, signature, line, doc, length, key, shape) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (path, doc["kind"], doc["name"], doc["signature"], doc["line"], doc["doc"], length,
+                         name_key(doc["name"]), shape(doc["name"])))
+                    db.executemany("INSERT INTO postings VALUES (?, ?, ?, ?)",
+                                   [(term, cursor.lastrowid, tf, length) for term, tf in doc["terms"].items()])
+                db.execute("INSERT INTO files VALUES (?, ?)", (path, key))
+                updated += 1
+
+            if centrality is not None:
+                db.execute("DELETE FROM centrality")
+                db.executemany("INSERT INTO centrality VALUES (?, ?, ?)",
+                               [(path, name, score) for (path, name), score in centrality.items()])
+
+            # Corpus statistics for BM25, kept so queries never scan the docs table
+            count, total = db.execute("SELECT COUNT(*), COALESCE(SUM(length), 0) FROM docs").fetchone()
+            db.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                           [("documents", str(count)), ("total_length", str(total))])
+    finally:
+        db.close()
+    return {"updated": updated, "removed": len(removed), "documents": count,
+            "seconds": round(time.perf_counter() - started, 3)}
+
+
+def idf(count: int, df: int) -> float:
+    return math.log(1 + (count - df + 0.5) / (df + 0.5))
+
+
+def boost(centrality: float) -> float:
+    """BM25 multiplier for a symbol's centrality; average or less changes nothing"""
+    return 1 + CENTRALITY_WEIGHT * math.log(max(centrality, 1.0))
+
+
+def search(root: Path, query: str, limit: int = 10, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Top documents for a query by BM25, boosted by call graph centrality"""
+    path = root / SEARCH_NAME
+    if not path.exists():
+        raise FileNotFoundError(f"{path} not found; run `claude-boost index` first")
+    db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        meta = dict(db.execute("SELECT key, value FROM meta"))
+        count = int(meta.get("documents") or 0)
+        if not count:
+            return []
+        average_length = int(meta.get("total_length") or 0) / count
+
+        scores = {}  # type: Dict[int, float]
+        for term in set(terms(query)):
+            postings = db.execute(
+                "SELECT doc_id, tf, length FROM postings WHERE term = ?",
+                (term,)).fetchall()
+            if not postings:
+                continue
+            weight = idf(count, len(postings))
+            for doc_id, tf, length in postings:
+                norm = tf + K1 * (1 - B + B * length / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight * tf * (K1 + 1) / norm
+
+        # Databases written before the call graph have no centrality table
+        ranked_by_graph = db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'centrality'").fetchone()
+        pool = len(scores) if kind is not None else max(limit, RERANK_POOL)
+        candidates = []
+        for doc_id, score in heapq.nlargest(pool, scores.items(), key=lambda item: item[1]):
+            row = db.execute("SELECT kind, name, signature, path, line, doc FROM docs WHERE id = ?",
+                             (doc_id,)).fetchone()
+            if kind is not None and row[0] != kind:
+                continue
+            found = ranked_by_graph and db.execute(
+                "SELECT score FROM centrality WHERE path = ? AND name = ?", (row[3], row[1])).fetchone()
+            centrality = found[0] if found else 0.0
+            candidates.append((score * boost(centrality), centrality, row))
+            if kind is not None and len(candidates) >= max(limit, RERANK_POOL):
+                break
+
+        hits = []
+        for score, centrality, row in heapq.nlargest(limit, candidates, key=lambda item: item[0]):
+            hits.append({"score": round(score, 3), "kind": row[0], "name": row[1], "signature": row[2],
+                         "file": row[3], "line": row[4], "doc": row[5], "centrality": centrality})
+        return hits
+    finally:
+        db.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point for `claude-boost search`"""
+    import json
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="claude-boost search",
+                                     description="Find existing code by what it does (BM25 over symbols)")
+    parser.add_argument("query", nargs="+", help="Words or identifiers to look for")
+    parser.add_argument("-k", "--limit", type=int, default=10, help="Number of hits (default: 10)")
+    parser.add_argument("--kind", choices=sorted(DOCUMENT_KINDS), help="Only symbols of this kind")
+    parser.add_argument("--root", default=".", help="Project root (default: current directory)")
+    parser.add_argument("--json", action="store_true", help="Print hits as JSON")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        hits = search(Path(args.root), " ".join(args.query), args.limit, args.kind)
+    except FileNotFoundError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    if args.json:
+        print(json.dumps(hits, indent=2))
+        return
+    for hit in hits:
+        location = f"{hit['file']}:{hit['line']}" if hit["line"] is not None else hit["file"]
+        print(f"  {hit['score']:>6.2f}  {hit['kind']:<8} {hit['signature']}  ({location})")
+        if hit["doc"]:
+            print(f"          {hit['doc']}")
+    print(f"🔎 {len(hits)} hits in {(time.perf_counter() - started) * 1e3:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
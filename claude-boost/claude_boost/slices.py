@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Index Slices
+Per-task excerpts of PROJECT_INDEX.json sized to a token budget
+
+    claude-boost slice --diff --name code-reviewer
+    claude-boost slice --test tests/test_auth.py::test_login --name debugger
+    claude-boost slice --trace traceback.txt --budget 4000
+
+Seeds come from the working tree diff, failing tests, stack traces or
+plain paths. Starting from them, the import graph is walked in both
+directions (what a seed imports and what imports it), one ring at a
+time, and file records are added nearest-first while they fit in the
+token budget. A ring's dependencies go before its dependents; within
+each, files holding the most central APIs (by the call graph in
+PROJECT_INDEX.graph.json, when it exists) go first, then smaller records
+before larger ones, so a tight budget keeps the code most others rely on
+and then the most files.
+
+The slice is written to .claude/slices/<name>.json in the shape of the
+index (files plus a summary), so an agent prompt can reference
+`@.claude/slices/code-reviewer.json` instead of the whole index.
+"""
+import os
+import re
+import sys
+import json
+import time
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Allow `python slices.py` to import sibling modules
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_boost.callgraph import file_centrality, load_graph
+from claude_boost.context import count_tokens
+from claude_boost.imports import import_graph, reverse_graph
+
+INDEX_NAME = "PROJECT_INDEX.json"
+SLICES_DIR = Path(".claude") / "slices"
+DEFAULT_BUDGET = 8000
+
+# Python tracebacks, then `path:line` as printed by Node, Go, Rust and pytest
+TRACE_PATTERNS = [
+    re.compile(r'File "([^"]+)", line (\d+)'),
+    re.compile(r"([\w./\\-]+\.(?:py|js|jsx|ts|tsx|mjs|cjs|go|rs|sql)):(\d+)"),
+]
+
+
+def load_files(root: Path) -> Dict[str, Any]:
+    """File records of the index, including monorepo workspace shards"""
+    with open(root / INDEX_NAME, "r") as f:
+        index = json.load(f)
+    files = dict(index.get("files") or {})
+    for workspace in index.get("workspaces") or []:
+        try:
+            with open(root / workspace["index"], "r") as f:
+                shard = json.load(f)
+        except (OSError, ValueError):
+            continue
+        prefix = workspace["path"].rstrip("/") + "/"
+        for path, record in (shard.get("files") or {}).items():
+            files[prefix + path] = record
+    return files
+
+
+def match_path(candidate: str, files: Dict[str, Any], root: Path) -> Optional[str]:
+    """Indexed path for a path seen in a diff, test id or trace"""
+    candidate = candidate.replace("\\", "/")
+    if os.path.isabs(candidate):
+        try:
+            candidate = Path(candidate).resolve().relative_to(root.resolve()).as_posix()
+        except ValueError:
+            pass
+    candidate = candidate[2:] if candidate.startswith("./") else candidate
+    if candidate in files:
+        return candidate
+    # Traces from containers or other checkouts: longest indexed suffix
+    best = None
+    for path in files:
+        if candidate.endswith("/" + path) or path.endswith("/" + candidate):
+            if best is None or len(path) > len(best):
+                best = path
+    return best
+
+
+def diff_paths(root: Path, base: Optional[str] = None) -> List[str]:
+    """Files changed in the working tree (or since `base`), plus untracked files"""
+    commands = [["git", "diff", "--name-only", base or "HEAD"],
+                ["git", "ls-files", "--others", "--exclude-standard"]]
+    paths = []
+    for command in commands:
+        try:
+            result = subprocess.run(command, cwd=str(root), capture_output=True, text=True, timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if result.returncode == 0:
+            paths.extend(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return paths
+
+
+def trace_paths(text: str) -> List[str]:
+    """Paths of the frames in a stack trace, innermost last as printed"""
+    paths = []
+    for pattern in TRACE_PATTERNS:
+        for match in pattern.finditer(text):
+            if match.group(1) not in paths:
+                paths.append(match.group(1))
+    return paths
+
+
+def test_path(test_id: str) -> str:
+    """`tests/test_x.py::TestY::test_z` → tests/test_x.py"""
+    return test_id.split("::", 1)[0]
+
+
+def record_tokens(path: str, record: Any) -> int:
+    """Tokens a record costs in the slice, counted as it is written"""
+    return count_tokens(json.dumps({path: record}, indent=2, default=str))
+
+
+def build_slice(files: Dict[str, Any], seeds: List[str], budget: int = DEFAULT_BUDGET,
+                centrality: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """Nearest files around the seeds that fit in the budget
+
+    `centrality` (path → score, see callgraph.file_centrality) orders the
+    files of a ring before their size does.
+    """
+    centrality = centrality or {}
+    imports = import_graph(files)
+    importers = reverse_graph(imports)
+
+    selected = {}  # type: Dict[str, Any]
+    distances = {}  # type: Dict[str, int]
+    omitted = []  # type: List[str]
+    used = 0
+
+    def take(paths: List[str], distance: int):
+        nonlocal used
+        for path in paths:
+            tokens = record_tokens(path, files[path])
+            if used + tokens > budget:
+                omitted.append(path)
+                continue
+            selected[path] = files[path]
+            distances[path] = distance
+            used += tokens
+
+    ring = list(dict.fromkeys(seed for seed in seeds if seed in files))
+    seen = set(ring)
+    # Seeds go in in the given order; a seed that does not fit is still reported
+    take(ring, 0)
+    distance = 0
+    while ring and used < budget:
+        distance += 1
+        dependencies = sorted({t for path in ring for t in imports.get(path, ())} - seen)
+        seen.update(dependencies)
+        dependents = sorted({t for path in ring for t in importers.get(path, ())} - seen)
+        seen.update(dependents)
+        order = lambda path: (-centrality.get(path, 0.0), record_tokens(path, files[path]))
+        take(sorted(dependencies, key=order), distance)
+        take(sorted(dependents, key=order), distance)
+        ring = dependencies + dependents
+
+    return {
+        "files": selected,
+        "summary": {
+            "seeds": [seed for seed in seeds if seed in files],
+            "budget_tokens": budget,
+            "tokens": used,
+            "files": len(selected),
+            "omitted": len(omitted),
+            "max_distance": max(distances.values(), default=0),
+            "distances": distances,
+        },
+    }
+
+
+def write_slice(root: Path, name: str, sliced: Dict[str, Any]) -> Path:
+    path = root / SLICES_DIR / f"{name}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sliced = dict(sliced, task=name, generated_at=time.strftime("%Y-%m-%d %H:%M:%S"))
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(sliced, f, indent=2, default=str)
+    os.replace(tmp_path, path)
+    return path
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point for `claude-boost slice`"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="claude-boost slice",
+                                     description="Write the part of PROJECT_INDEX.json a task needs")
+    parser.add_argument("paths", nargs="*", help="Seed files")
+    parser.add_argument("--diff", nargs="?", const="HEAD", metavar="BASE",
+                        help="Seed with files changed since BASE (default: HEAD) and untracked files")
+    parser.add_argument("--test", action="append", default=[], metavar="TEST_ID",
+                        help="Seed with a failing test (path or pytest node id); repeatable")
+    parser.add_argument("--trace", metavar="FILE", help="Seed with the frames of a stack trace ('-' for stdin)")
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET, help=f"Token budget (default: {DEFAULT_BUDGET})")
+    parser.add_argument("--name", default="task", help="Slice name, e.g. the agent or task (default: task)")
+    parser.add_argument("--root", default=".", help="Project root (default: current directory)")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    root = Path(args.root)
+    try:
+        files = load_files(root)
+    except (OSError, ValueError) as e:
+        print(f"❌ Cannot read {INDEX_NAME}: {e}; run `claude-boost index` first", file=sys.stderr)
+        sys.exit(1)
+
+    candidates = list(args.paths) + [test_path(test_id) for test_id in args.test]
+    if args.diff:
+        candidates += diff_paths(root, args.diff)
+    if args.trace:
+        text = sys.stdin.read() if args.trace == "-" else Path(args.trace).read_text(encoding="utf-8", errors="replace")
+        # Innermost frames first: they are closest to the failure
+        candidates += list(reversed(trace_paths(text)))
+
+    seeds = list(dict.fromkeys(filter(None, (match_path(c, files, root) for c in candidates))))
+    if not seeds:
+        print("❌ No seed files found in the index", file=sys.stderr)
+        sys.exit(1)
+
+    sliced = build_slice(files, seeds, args.budget, file_centrality(load_graph(root)))
+    path = write_slice(root, args.name, sliced)
+    summary = sliced["summary"]
+    if args.json:
+        print(json.dumps(dict(summary, path=str(path)), indent=2))
+        return
+    print(f"✂️  {path}: {summary['files']} files, {summary['tokens']:,} of {summary['budget_tokens']:,} tokens "
+          f"({len(files)} files in the index, {summary['omitted']} over budget)")
+    print(f"   Reference it as @{SLICES_DIR.as_posix()}/{args.name}.json")
+
+
+if __name__ == "__main__":
+    main()
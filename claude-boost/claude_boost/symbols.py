@@ -0,0 +1,98 @@
+"""
+Claude Code Boost Symbol Model
+Flattens PROJECT_INDEX.json file records into (kind, name, signature) symbols
+
+Extractors emit different shapes (Python functions are dicts, JavaScript
+functions are bare names, SQL has tables with columns), so everything that
+compares or searches symbols goes through iter_symbols. record_hash
+digests a record's symbols without line numbers, sizes or mtimes, so two
+records hash equal exactly when their symbol surface is the same.
+"""
+import json
+import hashlib
+from typing import Any, Dict, Iterator, NamedTuple, Optional
+
+# Record fields holding plain name lists
+NAME_FIELDS = {
+    "constants": "constant",
+    "exports": "export",
+    "interfaces": "interface",
+    "types": "type",
+    "modules": "module",
+}
+# Record fields holding named schema objects
+OBJECT_FIELDS = {
+    "tables": "table",
+    "views": "view",
+    "indexes": "index",
+    "triggers": "trigger",
+}
+
+
+class Symbol(NamedTuple):
+    kind: str
+    name: str
+    signature: str
+    line: Optional[int]
+
+
+def function_signature(name: str, item: Dict[str, Any]) -> str:
+    signature = f"{'async ' if item.get('async') else ''}{name}({', '.join(item.get('args') or [])})"
+    if item.get("returns"):
+        signature += f" -> {item['returns']}"
+    return signature
+
+
+def iter_symbols(record: Dict[str, Any]) -> Iterator[Symbol]:
+    """Every symbol a file record declares"""
+    if not isinstance(record, dict):
+        return
+    for item in record.get("functions") or []:
+        if isinstance(item, dict):
+            yield Symbol("function", item["name"], function_signature(item["name"], item), item.get("line"))
+        else:
+            yield Symbol("function", str(item), f"{item}()", None)
+
+    for item in record.get("classes") or []:
+        if not isinstance(item, dict):
+            yield Symbol("class", str(item), str(item), None)
+            continue
+        bases = item.get("bases") or []
+        kind = item.get("kind", "class")
+        signature = item["name"] + (f"({', '.join(str(b) for b in bases)})" if bases else "")
+        if kind != "class":
+            signature = f"{kind} {signature}"
+        yield Symbol("class", item["name"], signature, item.get("line"))
+        for method in item.get("methods") or []:
+            if isinstance(method, dict):
+                qualified = f"{item['name']}.{method['name']}"
+                yield Symbol("method", qualified, function_signature(qualified, method), method.get("line"))
+            else:
+                yield Symbol("method", f"{item['name']}.{method}", f"{item['name']}.{method}()", None)
+
+    for field, kind in NAME_FIELDS.items():
+        for name in record.get(field) or []:
+            yield Symbol(kind, str(name), str(name), None)
+
+    for field, kind in OBJECT_FIELDS.items():
+        for item in record.get(field) or []:
+            signature = item["name"]
+            if item.get("columns") is not None:
+                signature += f"({', '.join(item['columns'])})"
+            elif item.get("table"):
+                signature += f" ON {item['table']}"
+            yield Symbol(kind, item["name"], signature, item.get("line"))
+
+    for name in record.get("imports") or []:
+        yield Symbol("import", str(name), str(name), None)
+
+
+def symbol_map(record: Dict[str, Any]) -> Dict[str, str]:
+    """`kind:name` → signature for a record (later duplicates win)"""
+    return {f"{symbol.kind}:{symbol.name}": symbol.signature for symbol in iter_symbols(record)}
+
+
+def record_hash(record: Dict[str, Any]) -> str:
+    """Digest of a record's symbol surface, independent of line numbers"""
+    canonical = json.dumps(sorted(symbol_map(record).items()), separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Validation Cache
+Reuses a validation verdict until one of its inputs changes
+
+    claude-boost validate --task auth-login --diff -- pytest -q tests/test_auth.py
+    claude-boost validate --task auth-login --slice code-reviewer -- npm test
+    claude-boost validate show --task auth-login -- pytest -q tests/test_auth.py
+
+A validation's inputs are its task, its test command and a file set: the
+given files, the files of a slice (.claude/slices/<name>.json), the
+working tree diff, or else every indexed file. Seeds from --diff and
+--files are widened to everything they import, transitively, through
+the import graph of PROJECT_INDEX.json, since a change to any of those
+can change the outcome.
+
+Each recorded verdict keeps the size, mtime and content digest of every
+input file. A lookup stats the files; only those whose stat changed are
+read and hashed, so a touched-but-identical file still hits. When every
+input matches, the previous verdict and its evidence (exit code, output
+tail, duration) come back without running anything, which makes the
+repeated "is it done?" checks late in a session free. Any changed,
+added or missing input reruns the command and replaces the entry.
+
+Entries live in .claude/state/validation-cache.json, newest first, and
+the oldest are dropped beyond MAX_ENTRIES.
+"""
+import os
+import sys
+import json
+import time
+import hashlib
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Allow `python validation.py` to import sibling modules
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_boost.imports import import_graph
+from claude_boost.indexer import content_digest, read_source
+from claude_boost.slices import SLICES_DIR, diff_paths, load_files, match_path, test_path
+
+CACHE_FILE = Path(".claude") / "state" / "validation-cache.json"
+MAX_ENTRIES = 200
+# Lines of command output kept as evidence
+EVIDENCE_LINES = 40
+DEFAULT_TIMEOUT = 1800
+
+
+def cache_key(task: str, command: str) -> str:
+    return hashlib.sha256(f"{task}\0{command}".encode("utf-8")).hexdigest()[:16]
+
+
+def dependency_closure(files: Dict[str, Any], seeds: List[str]) -> List[str]:
+    """Seeds plus every indexed file they import, transitively"""
+    imports = import_graph(files)
+    closure = set(seeds)
+    frontier = list(seeds)
+    while frontier:
+        path = frontier.pop()
+        for target in imports.get(path, ()):
+            if target not in closure:
+                closure.add(target)
+                frontier.append(target)
+    return sorted(closure)
+
+
+def fingerprint(root: Path, path: str, known: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Size, mtime and digest of one input; the digest is reused while the stat matches"""
+    try:
+        st = os.stat(root / path)
+    except OSError:
+        return None
+    if known and known.get("size") == st.st_size and known.get("mtime_ns") == st.st_mtime_ns:
+        return known
+    data = read_source(str(root / path), st.st_size)
+    try:
+        digest = content_digest(data)
+    finally:
+        if not isinstance(data, bytes):
+            data.close()
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "digest": digest}
+
+
+def changed_inputs(root: Path, entry: Dict[str, Any], paths: List[str]) -> Tuple[List[str], Dict[str, Any]]:
+    """Inputs that differ from a recorded entry, and the current fingerprints"""
+    recorded = entry.get("files") or {}
+    current = {}  # type: Dict[str, Any]
+    changed = sorted(set(recorded) - set(paths))
+    for path in paths:
+        before = recorded.get(path)
+        now = fingerprint(root, path, before)
+        if now is None and before is None:
+            # Missing then and now
+            continue
+        if now is not None:
+            current[path] = now
+        if before is None or now is None or now["digest"] != before.get("digest"):
+            changed.append(path)
+    return changed, current
+
+
+class ValidationCache:
+    """Recorded verdicts by task and command"""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.path = root / CACHE_FILE
+        try:
+            with open(self.path, "r") as f:
+                self.entries = json.load(f).get("entries") or {}
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}  # type: Dict[str, Dict[str, Any]]
+
+    def get(self, task: str, command: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(cache_key(task, command))
+
+    def put(self, entry: Dict[str, Any]):
+        key = cache_key(entry["task"], entry["command"])
+        self.entries.pop(key, None)
+        # Newest first; insertion order is the age order
+        self.entries = dict([(key, entry)] + list(self.entries.items())[:MAX_ENTRIES - 1])
+
+    def clear(self, task: Optional[str] = None) -> int:
+        keys = [key for key, entry in self.entries.items() if task is None or entry.get("task") == task]
+        for key in keys:
+            del self.entries[key]
+        return len(keys)
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"entries": self.entries}, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+
+def run_command(root: Path, command: str, timeout: int = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+    """Run the test command and keep its verdict and the tail of its output"""
+    started = time.perf_counter()
+    try:
+        result = subprocess.run(command, shell=True, cwd=str(root), capture_output=True, text=True,
+                                errors="replace", timeout=timeout)
+        code, output = result.returncode, (result.stdout or "") + (result.stderr or "")
+    except subprocess.TimeoutExpired:
+        code, output = None, f"Timed out after {timeout}s"
+    return {
+        "verdict": "passed" if code == 0 else "failed",
+        "exit_code": code,
+        "output": "\n".join(output.rstrip().splitlines()[-EVIDENCE_LINES:]),
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def validate(root: Path, task: str, command: str, paths: List[str], force: bool = False,
+             timeout: int = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+    """The cached verdict when every input matches, otherwise a fresh one"""
+    cache = ValidationCache(root)
+    entry = cache.get(task, command)
+    changed, current = changed_inputs(root, entry or {}, paths)
+    if entry and not changed and not force:
+        if any(current[path] is not entry["files"].get(path) for path in current):
+            # Touched files: remember their new stat so the next check skips hashing
+            entry["files"] = current
+            cache.save()
+        return dict(entry, cached=True, changed=[])
+
+    evidence = run_command(root, command, timeout)
+    entry = {
+        "task": task,
+        "command": command,
+        "recorded_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        # As they were when the command ran
+        "files": current,
+        **evidence,
+    }
+    cache.put(entry)
+    cache.save()
+    return dict(entry, cached=False, changed=changed)
+
+
+def input_paths(root: Path, files: Optional[List[str]], slice_name: Optional[str],
+                diff: Optional[str], tests: List[str]) -> List[str]:
+    """The file set of a validation, relative to the root"""
+    if slice_name:
+        with open(root / SLICES_DIR / f"{slice_name}.json", "r") as f:
+            return sorted(json.load(f).get("files") or {})
+    index_files = load_files(root)
+    candidates = list(files or []) + [test_path(test_id) for test_id in tests]
+    if diff:
+        candidates += diff_paths(root, diff)
+    if not candidates:
+        return sorted(index_files)
+    seeds = [path for path in (match_path(c, index_files, root) for c in candidates) if path]
+    # Inputs outside the index (configs, fixtures) are still inputs
+    extra = [c for c in candidates if match_path(c, index_files, root) is None and (root / c).is_file()]
+    return sorted(set(dependency_closure(index_files, seeds)) | set(extra))
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point for `claude-boost validate`"""
+    import argparse
+
+    argv = sys.argv[1:] if argv is None else list(argv)
+    command = []  # type: List[str]
+    if "--" in argv:
+        position = argv.index("--")
+        argv, command = argv[:position], argv[position + 1:]
+
+    parser = argparse.ArgumentParser(prog="claude-boost validate",
+                                     description="Run a validation command unless its inputs are unchanged",
+                                     epilog="The test command follows `--`.")
+    parser.add_argument("action", nargs="?", default="run", choices=["run", "show", "clear"])
+    parser.add_argument("--task", help="Task the validation belongs to (default: default)")
+    parser.add_argument("--files", nargs="+", metavar="PATH", help="Input files; their imports are added")
+    parser.add_argument("--test", action="append", default=[], metavar="TEST_ID",
+                        help="A test (path or pytest node id) whose file and imports are inputs; repeatable")
+    parser.add_argument("--slice", metavar="NAME", help="Use the files of .claude/slices/NAME.json as inputs")
+    parser.add_argument("--diff", nargs="?", const="HEAD", metavar="BASE",
+                        help="Use files changed since BASE (default: HEAD) and their imports as inputs")
+    parser.add_argument("--force", action="store_true", help="Run even when the inputs are unchanged")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT, help=f"Seconds (default: {DEFAULT_TIMEOUT})")
+    parser.add_argument("--root", default=".", help="Project root (default: current directory)")
+    parser.add_argument("--json", action="store_true", help="Print the verdict as JSON")
+    args = parser.parse_args(argv)
+
+    root = Path(args.root).resolve()
+    if args.action == "clear":
+        cache = ValidationCache(root)
+        removed = cache.clear(args.task)
+        cache.save()
+        print(f"🧹 Removed {removed} cached validation(s)")
+        return
+    if not command:
+        parser.error("the test command goes after `--`")
+    command_line = " ".join(command)
+    task = args.task or "default"
+
+    try:
+        paths = input_paths(root, args.files, args.slice, args.diff, args.test)
+    except (OSError, ValueError) as e:
+        print(f"❌ Cannot determine the inputs: {e}; run `claude-boost index` or name them with --files",
+              file=sys.stderr)
+        sys.exit(2)
+
+    if args.action == "show":
+        entry = ValidationCache(root).get(task, command_line)
+        changed = changed_inputs(root, entry, paths)[0] if entry else paths
+        result = dict(entry or {"task": task, "command": command_line, "verdict": None},
+                      cached=bool(entry), changed=changed)
+        stale = entry is None or bool(changed)
+    else:
+        result = validate(root, task, command_line, paths, args.force, args.timeout)
+        stale = False
+
+    if args.json:
+        print(json.dumps({key: value for key, value in result.items() if key != "files"}, indent=2))
+    else:
+        icon = "✅" if result["verdict"] == "passed" else "❌"
+        if stale:
+            print(f"⚠️  No current verdict for {task}: {len(result['changed'])} of {len(paths)} inputs changed")
+        elif result["cached"]:
+            print(f"{icon} {result['verdict']} (cached from {result['recorded_at']}, {len(paths)} inputs unchanged)")
+        else:
+            print(f"{icon} {result['verdict']} in {result['seconds']:.1f}s "
+                  f"(exit {result['exit_code']}, {len(paths)} inputs, {len(result['changed'])} changed)")
+            if result["verdict"] != "passed" and result["output"]:
+                print(result["output"])
+    sys.exit(2 if stale else 0 if result["verdict"] == "passed" else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,600 @@
+#!/usr/bin/env python3
+"""
+Claude Code Boost Workspace Profiler
+Finds every workspace of a (mono)repo and keeps one index per workspace
+
+A single directory walk finds the manifests that make a directory a
+workspace: package.json (npm, pnpm or yarn workspaces), pyproject.toml /
+setup.py / setup.cfg (Python packages), Cargo.toml (crates and Cargo
+workspaces) and go.mod (Go modules). The repository root is always a
+workspace and owns every file not inside a nested one.
+
+Each workspace gets its own PROJECT_INDEX.json, built concurrently by the
+project indexer with the workspace as its working directory. That is the
+package indexer (claude_boost/indexer.py, run by path) when claude-boost
+is importable, so the binary, search and call graph companions are
+refreshed with the JSON and nested workspaces are never read by their
+ancestors; otherwise the project-indexer.py hook, which writes the JSON
+only and whose output is pruned of nested workspaces. The root
+PROJECT_INDEX.json holds the root's own files plus a `workspaces` list
+referencing the shards. After an edit, `workspaces.py update` re-indexes
+only the workspace owning the edited file.
+
+Updates are coordinated so concurrent edits never run concurrent
+indexers. An update appends the edited paths to a pending queue file
+and then tries the update lock without waiting. If another updater holds
+the lock, the update exits at once. The lock holder drains the queue in
+batches, indexing each affected workspace once per batch with the same
+indexer as a build (so the companions follow every batch), and only
+releases the lock once the queue is empty.
+
+Installed next to the hooks in .claude/hooks; must only depend on the
+standard library (the package indexer is used only when installed).
+"""
+import os
+import re
+import sys
+import json
+import time
+import fnmatch
+import subprocess
+import importlib.util
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+INDEX_NAME = "PROJECT_INDEX.json"
+WORKSPACES_FILE = Path(".claude") / "workspaces.json"
+INDEXER_SCRIPT = Path(".claude") / "hooks" / "project-indexer.py"
+PENDING_FILE = Path(".claude") / "state" / "index-pending.txt"
+UPDATE_LOCK = Path(".claude") / "state" / "index-update.lock"
+
+MANIFESTS = {
+    "package.json": "node",
+    "pyproject.toml": "python",
+    "setup.py": "python",
+    "setup.cfg": "python",
+    "Cargo.toml": "cargo",
+    "go.mod": "go",
+}
+LANGUAGES = {
+    "npm": "JavaScript/Node.js",
+    "pnpm": "JavaScript/Node.js",
+    "yarn": "JavaScript/Node.js",
+    "python": "Python",
+    "cargo": "Rust",
+    "go": "Go",
+}
+SKIP_DIRS = {"node_modules", "__pycache__", "venv", "env", "target", "dist", "build", "vendor", "site-packages"}
+
+
+def project_root() -> Path:
+    """Project directory when running as a hook or from the CLI"""
+    project_dir = os.environ.get("CLAUDE_PROJECT_DIR")
+    if project_dir:
+        return Path(project_dir)
+    here = Path(__file__).resolve().parent
+    if here.name == "hooks" and here.parent.name == ".claude":
+        return here.parent.parent
+    return Path.cwd()
+
+
+def _read_text(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
+def _toml_value(text: str, table: str, key: str) -> Optional[str]:
+    """A string value from a TOML table, without a TOML parser"""
+    section = re.search(rf"^\[{re.escape(table)}\]\s*$(.*?)(?=^\[|\Z)", text, re.M | re.S)
+    if not section:
+        return None
+    match = re.search(rf"^{key}\s*=\s*[\"']([^\"']+)[\"']", section.group(1), re.M)
+    return match.group(1) if match else None
+
+
+def _toml_list(text: str, table: str, key: str) -> List[str]:
+    """A list of strings from a TOML table, without a TOML parser"""
+    section = re.search(rf"^\[{re.escape(table)}\]\s*$(.*?)(?=^\[|\Z)", text, re.M | re.S)
+    if not section:
+        return []
+    match = re.search(rf"^{key}\s*=\s*\[(.*?)\]", section.group(1), re.M | re.S)
+    return re.findall(r"[\"']([^\"']+)[\"']", match.group(1)) if match else []
+
+
+def node_manager(root: Path) -> str:
+    """npm, pnpm or yarn, from the lockfiles at the root"""
+    if (root / "pnpm-workspace.yaml").exists() or (root / "pnpm-lock.yaml").exists():
+        return "pnpm"
+    if (root / "yarn.lock").exists():
+        return "yarn"
+    return "npm"
+
+
+def declared_members(root: Path) -> Dict[str, List[str]]:
+    """Workspace member globs declared at the root, per tool"""
+    declared = {}  # type: Dict[str, List[str]]
+
+    try:
+        package = json.loads(_read_text(root / "package.json") or "{}")
+    except ValueError:
+        package = {}
+    members = package.get("workspaces") if isinstance(package, dict) else None
+    if isinstance(members, dict):
+        members = members.get("packages")
+    if isinstance(members, list):
+        declared[node_manager(root)] = [str(m) for m in members]
+
+    pnpm = _read_text(root / "pnpm-workspace.yaml")
+    if pnpm:
+        packages = re.search(r"^packages:\s*$(.*?)(?=^\S|\Z)", pnpm, re.M | re.S)
+        if packages:
+            globs = re.findall(r"^\s*-\s*[\"']?([^\"'#\n]+?)[\"']?\s*$", packages.group(1), re.M)
+            declared["pnpm"] = globs
+
+    cargo = _toml_list(_read_text(root / "Cargo.toml"), "workspace", "members")
+    if cargo:
+        declared["cargo"] = cargo
+
+    go_work = _read_text(root / "go.work")
+    if go_work:
+        uses = re.findall(r"^\s*use\s+(\S+)\s*$", go_work, re.M)
+        for block in re.findall(r"^\s*use\s*\((.*?)\)", go_work, re.M | re.S):
+            uses.extend(block.split())
+        declared["go"] = [use[2:] if use.startswith("./") else use for use in uses]
+
+    return declared
+
+
+def _matches_any(rel_path: str, globs: List[str]) -> bool:
+    included = False
+    for pattern in globs:
+        negated = pattern.startswith("!")
+        pattern = pattern.lstrip("!").rstrip("/")
+        if pattern.startswith("./"):
+            pattern = pattern[2:]
+        if fnmatch.fnmatch(rel_path, pattern) or fnmatch.fnmatch(rel_path, pattern.replace("/**", "/*")):
+            included = not negated
+    return included
+
+
+def workspace_name(directory: Path, kinds: List[str]) -> str:
+    """Package name from the workspace's manifest, else the directory name"""
+    if "node" in kinds:
+        try:
+            name = json.loads(_read_text(directory / "package.json") or "{}").get("name")
+            if name:
+                return name
+        except (ValueError, AttributeError):
+            pass
+    if "python" in kinds:
+        name = _toml_value(_read_text(directory / "pyproject.toml"), "project", "name")
+        if name:
+            return name
+    if "cargo" in kinds:
+        name = _toml_value(_read_text(directory / "Cargo.toml"), "package", "name")
+        if name:
+            return name
+    if "go" in kinds:
+        match = re.search(r"^module\s+(\S+)", _read_text(directory / "go.mod"), re.M)
+        if match:
+            return match.group(1)
+    return directory.resolve().name
+
+
+def discover(root: Path = Path(".")) -> Dict[str, Any]:
+    """Profile a repository: every workspace, found in one directory walk"""
+    root = root.resolve()
+    found = {}  # type: Dict[str, List[str]]
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith(".") and d not in SKIP_DIRS)
+        kinds = sorted({MANIFESTS[name] for name in filenames if name in MANIFESTS})
+        rel_path = Path(dirpath).relative_to(root).as_posix()
+        if kinds or rel_path == ".":
+            found[rel_path] = kinds
+    if (root / "requirements.txt").exists() and "python" not in found["."]:
+        found["."].append("python")
+
+    declared = declared_members(root)
+    manager = node_manager(root)
+    workspaces = []
+    for rel_path, kinds in sorted(found.items()):
+        directory = root / rel_path
+        labels = [manager if kind == "node" else kind for kind in kinds]
+        workspace = {
+            "path": rel_path,
+            "name": workspace_name(directory, kinds),
+            "kinds": labels,
+            "languages": sorted({LANGUAGES[label] for label in labels}),
+        }  # type: Dict[str, Any]
+        members_of = [tool for tool, globs in declared.items() if rel_path != "." and _matches_any(rel_path, globs)]
+        if members_of:
+            workspace["member_of"] = members_of
+        workspaces.append(workspace)
+
+    return {
+        "root": str(root),
+        "monorepo": len(workspaces) > 1,
+        "declared": declared,
+        "workspaces": workspaces,
+    }
+
+
+def owner(rel_file: str, workspace_paths: List[str]) -> str:
+    """The innermost workspace containing a file (paths relative to the root)"""
+    best = "."
+    for path in workspace_paths:
+        if path != "." and (rel_file == path or rel_file.startswith(path + "/")) and len(path) > len(best):
+            best = path
+    return best
+
+
+def nested_in(path: str, workspace_paths: List[str]) -> List[str]:
+    """Workspaces inside another one, relative to it"""
+    prefix = "" if path == "." else path + "/"
+    return [other[len(prefix):] for other in workspace_paths
+            if other != path and other.startswith(prefix) and other != "."]
+
+
+def prune(index: Dict[str, Any], excluded: List[str]) -> Dict[str, Any]:
+    """Drop files that belong to nested workspaces and fix up the summary"""
+    if not excluded:
+        return index
+    files = {path: info for path, info in (index.get("files") or {}).items()
+             if not any(path == ex or path.startswith(ex + "/") for ex in excluded)}
+    index["files"] = files
+    summary = index.setdefault("summary", {})
+    summary["analyzed_files"] = len(files)
+    summary["total_functions"] = sum(len(info.get("functions", [])) for info in files.values()
+                                     if isinstance(info, dict))
+    summary["total_classes"] = sum(len(info.get("classes", [])) for info in files.values()
+                                   if isinstance(info, dict))
+    return index
+
+
+def _write_json(path: Path, data: Dict[str, Any]):
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def package_indexer() -> Optional[Path]:
+    """indexer.py of the claude_boost package this process can import"""
+    try:
+        spec = importlib.util.find_spec("claude_boost.indexer")
+    except (ImportError, ValueError):
+        return None
+    return Path(spec.origin).resolve() if spec and spec.origin else None
+
+
+def has_package_indexer() -> bool:
+    return package_indexer() is not None
+
+
+def indexer_command(root: Path) -> List[str]:
+    """The package indexer when installed, else the project-indexer.py hook"""
+    script = package_indexer()
+    if script:
+        # By path rather than -m: the child may not see the sys.path or
+        # PYTHONPATH that made claude_boost importable here, and indexer.py
+        # puts its own package on sys.path
+        return [sys.executable, str(script)]
+    script = (root / INDEXER_SCRIPT).resolve()
+    if not script.exists():
+        raise FileNotFoundError(f"Project indexer not found: {script} (or `pip install claude-boost`)")
+    return [sys.executable, str(script)]
+
+
+def _write_index(directory: Path, index: Dict[str, Any]):
+    """Rewrite an index this module changed, with its companions when the package is installed"""
+    if has_package_indexer():
+        from claude_boost.indexer import write_index
+        write_index(index, directory)
+    else:
+        _write_json(directory / INDEX_NAME, index)
+
+
+def load_workspaces(root: Path) -> Dict[str, Any]:
+    """Workspace map saved by the last build, rediscovered when missing"""
+    try:
+        with open(root / WORKSPACES_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return save_workspaces(root, discover(root))
+
+
+def save_workspaces(root: Path, profile: Dict[str, Any]) -> Dict[str, Any]:
+    (root / WORKSPACES_FILE).parent.mkdir(parents=True, exist_ok=True)
+    _write_json(root / WORKSPACES_FILE, profile)
+    return profile
+
+
+def index_workspace(root: Path, path: str, workspace_paths: List[str],
+                    indexer: List[str], timeout: int = 300) -> Dict[str, Any]:
+    """Run the indexer inside one workspace, leaving out the workspaces nested in it"""
+    directory = root / path
+    started = time.monotonic()
+    excluded = nested_in(path, workspace_paths)
+    command = list(indexer)
+    if excluded and command[1:] == [str(package_indexer())]:
+        # Never read, so neither parsed twice by a build nor cached here
+        command += [arg for nested in excluded for arg in ("--exclude", nested)]
+        excluded = []
+    result = subprocess.run(command, cwd=str(directory),
+                            capture_output=True, text=True, timeout=timeout)
+    report = {"path": path, "ok": result.returncode == 0,
+              "seconds": round(time.monotonic() - started, 3)}  # type: Dict[str, Any]
+    if result.returncode != 0:
+        report["error"] = result.stderr.strip()[-500:]
+        return report
+
+    if excluded:
+        # The hook indexer read the nested workspaces too
+        index_path = directory / INDEX_NAME
+        try:
+            with open(index_path, "r") as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            report.update(ok=False, error=f"unreadable {INDEX_NAME}: {e}")
+            return report
+        _write_index(directory, prune(index, excluded))
+    return report
+
+
+def link_shards(root: Path, profile: Dict[str, Any]):
+    """Reference the workspace shards from the root index"""
+    index_path = root / INDEX_NAME
+    try:
+        with open(index_path, "r") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return
+    index["workspaces"] = [
+        {
+            "path": workspace["path"],
+            "name": workspace["name"],
+            "kinds": workspace["kinds"],
+            "index": f"{workspace['path']}/{INDEX_NAME}",
+        }
+        for workspace in profile["workspaces"] if workspace["path"] != "."
+    ]
+    index.setdefault("summary", {})["workspaces"] = len(profile["workspaces"])
+    # Through the companions too, so the binary index stays newer than the JSON
+    _write_index(root, index)
+
+
+def _lock(lock_file, blocking: bool = True) -> bool:
+    """Take an advisory lock; False when non-blocking and already held"""
+    try:
+        import fcntl
+    except ImportError:
+        # No advisory locks on this platform: every updater runs
+        return True
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(lock_file):
+    try:
+        import fcntl
+    except ImportError:
+        return
+    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def queue_changes(root: Path, rel_files: List[str]):
+    """Append changed paths to the pending queue"""
+    path = root / PENDING_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        _lock(f)
+        try:
+            f.write("".join(f"{rel_file}\n" for rel_file in rel_files))
+            f.flush()
+        finally:
+            _unlock(f)
+
+
+def take_pending(root: Path) -> List[str]:
+    """Read and empty the pending queue (paths deduplicated, in order)"""
+    try:
+        f = open(root / PENDING_FILE, "r+")
+    except OSError:
+        return []
+    with f:
+        _lock(f)
+        try:
+            lines = f.read().splitlines()
+            f.seek(0)
+            f.truncate()
+        finally:
+            _unlock(f)
+    return list(dict.fromkeys(line for line in lines if line))
+
+
+def has_pending(root: Path) -> bool:
+    try:
+        return (root / PENDING_FILE).stat().st_size > 0
+    except OSError:
+        return False
+
+
+def build(root: Path = Path("."), jobs: Optional[int] = None) -> Dict[str, Any]:
+    """Index every workspace concurrently and link the shards from the root index"""
+    root = root.resolve()
+    indexer = indexer_command(root)
+
+    (root / UPDATE_LOCK).parent.mkdir(parents=True, exist_ok=True)
+    with open(root / UPDATE_LOCK, "a") as lock_file:
+        # Wait for a running update; everything pending so far is rebuilt anyway
+        _lock(lock_file)
+        try:
+            take_pending(root)
+            profile = save_workspaces(root, discover(root))
+            paths = [workspace["path"] for workspace in profile["workspaces"]]
+            started = time.monotonic()
+            with ThreadPoolExecutor(max_workers=jobs or min(len(paths), (os.cpu_count() or 1) * 2)) as pool:
+                reports = list(pool.map(lambda path: index_workspace(root, path, paths, indexer), paths))
+            if profile["monorepo"]:
+                link_shards(root, profile)
+        finally:
+            _unlock(lock_file)
+    if has_pending(root):
+        # Edits that arrived during the build gave up on the lock
+        drain(root)
+    return {
+        "workspaces": reports,
+        "failed": sum(1 for report in reports if not report["ok"]),
+        "duration_seconds": round(time.monotonic() - started, 3),
+    }
+
+
+def changed_file(payload: Dict[str, Any], root: Path) -> str:
+    """Path of the file a tool edited, relative to the root ("." if unknown)"""
+    file_path = (payload.get("tool_input") or {}).get("file_path") or ""
+    try:
+        return Path(file_path).resolve().relative_to(root).as_posix() if file_path else "."
+    except ValueError:
+        return "."
+
+
+def update_batch(root: Path, rel_files: List[str]) -> List[Dict[str, Any]]:
+    """Re-index each workspace owning one of the files, once"""
+    try:
+        indexer = indexer_command(root)
+    except FileNotFoundError as e:
+        return [{"path": ".", "ok": False, "error": str(e), "seconds": 0.0}]
+    # A new or edited manifest can add or remove workspaces
+    if any(Path(rel_file).name in MANIFESTS for rel_file in rel_files):
+        profile = save_workspaces(root, discover(root))
+    else:
+        profile = load_workspaces(root)
+    paths = [workspace["path"] for workspace in profile["workspaces"]]
+
+    owners = list(dict.fromkeys(owner(rel_file, paths) for rel_file in rel_files))
+    reports = [index_workspace(root, path, paths, indexer) for path in owners]
+    if "." in owners and profile.get("monorepo"):
+        # The indexer rewrote the root index; restore the shard references
+        link_shards(root, profile)
+    return reports
+
+
+def drain(root: Path) -> Dict[str, Any]:
+    """Run update passes until the queue is empty, unless another updater holds the lock"""
+    result = {"ok": True, "deferred": False, "passes": 0, "files": 0,
+              "workspaces": []}  # type: Dict[str, Any]
+    (root / UPDATE_LOCK).parent.mkdir(parents=True, exist_ok=True)
+    with open(root / UPDATE_LOCK, "a") as lock_file:
+        while True:
+            if not _lock(lock_file, blocking=False):
+                # The lock holder drains what we queued before it releases
+                result["deferred"] = result["passes"] == 0
+                return result
+            try:
+                while True:
+                    batch = take_pending(root)
+                    if not batch:
+                        break
+                    reports = update_batch(root, batch)
+                    result["passes"] += 1
+                    result["files"] += len(batch)
+                    result["workspaces"].extend(reports)
+                    result["ok"] = result["ok"] and all(report["ok"] for report in reports)
+            finally:
+                _unlock(lock_file)
+            # Paths queued between the last batch and unlocking belong to
+            # an updater that saw the lock held and gave up
+            if not has_pending(root):
+                return result
+
+
+def parse_payloads(text: str) -> List[Dict[str, Any]]:
+    """One hook payload, or several concatenated ones from a coalesced job"""
+    decoder = json.JSONDecoder()
+    payloads = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        try:
+            payload, position = decoder.raw_decode(text, position)
+        except ValueError:
+            break
+        if isinstance(payload, dict):
+            payloads.append(payload)
+        while position < len(text) and text[position].isspace():
+            position += 1
+    return payloads
+
+
+def update(payloads: List[Dict[str, Any]], root: Optional[Path] = None) -> Dict[str, Any]:
+    """Queue the files the tools just edited and drain the queue if no update is running"""
+    root = (root or project_root()).resolve()
+    queue_changes(root, [changed_file(payload, root) for payload in payloads] or ["."])
+    return drain(root)
+
+
+def print_profile(profile: Dict[str, Any]):
+    kind = "Monorepo" if profile["monorepo"] else "Single project"
+    print(f"📦 {kind}: {len(profile['workspaces'])} workspace(s) in {profile['root']}")
+    for tool, globs in profile["declared"].items():
+        print(f"  {tool} workspaces: {', '.join(globs)}")
+    for workspace in profile["workspaces"]:
+        kinds = ", ".join(workspace["kinds"]) or "no manifest"
+        print(f"  {workspace['path']:<40} {workspace['name']} ({kinds})")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point: workspaces.py [list|build|update] (update reads hook payloads)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="claude-boost workspaces",
+        description="Detect workspaces and keep one PROJECT_INDEX.json per workspace",
+    )
+    parser.add_argument("action", nargs="?", default="list", choices=["list", "build", "update"])
+    parser.add_argument("--root", help="Project root (default: current directory)")
+    parser.add_argument("--jobs", type=int, help="Workspaces indexed in parallel")
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args(argv)
+    root = Path(args.root) if args.root else project_root()
+
+    if args.action == "update":
+        result = update(parse_payloads(sys.stdin.read()), root)
+        for report in result["workspaces"]:
+            if not report["ok"]:
+                print(f"{report['path']}: {report.get('error', 'indexer failed')}", file=sys.stderr)
+        sys.exit(0 if result["ok"] else 1)
+
+    if args.action == "build":
+        try:
+            result = build(root, args.jobs)
+        except FileNotFoundError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            sys.exit(1)
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            for report in result["workspaces"]:
+                icon = "✅" if report["ok"] else "❌"
+                print(f"  {icon} {report['path']} ({report['seconds']:.2f}s)")
+                if not report["ok"]:
+                    print(f"      {report.get('error', '')}")
+            print(f"Indexed {len(result['workspaces'])} workspace(s) in {result['duration_seconds']:.2f}s")
+        sys.exit(1 if result["failed"] else 0)
+
+    profile = discover(root)
+    if args.json:
+        print(json.dumps(profile, indent=2))
+    else:
+        print_profile(profile)
+
+
+if __name__ == "__main__":
+    main()
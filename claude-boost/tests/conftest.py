@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Run against the checkout, installed or not
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
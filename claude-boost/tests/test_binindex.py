@@ -0,0 +1,82 @@
+"""Binary index: what is written reads back the same, and damage is detected"""
+import json
+import os
+
+import pytest
+
+from claude_boost.binindex import BINARY_NAME, HEADER, JSON_NAME, BinaryIndex, BinaryIndexError, open_index, write_binary
+from claude_boost.compact import CompactIndex
+
+INDEX = {"files": {
+    "pkg/b.py": {
+        "functions": [{"name": "load", "args": ["path"], "returns": "dict", "line": 3}],
+        "classes": [{"name": "Store", "line": 10, "methods": [{"name": "load", "args": ["self"], "line": 12}]}],
+        "imports": ["os"], "hash": "bbbb", "size": 120, "modified": 2.5,
+    },
+    "a.py": {"functions": [{"name": "main", "args": [], "line": 1}], "imports": [], "hash": "aaaa",
+             "size": 10, "modified": 1.0},
+    "ünï/cödé.py": {"functions": [{"name": "grüß", "args": [], "line": 2}], "hash": "cccc",
+                    "size": 5, "modified": 3.0},
+}}
+
+
+@pytest.fixture
+def binary(tmp_path):
+    path = write_binary(INDEX, tmp_path)
+    with BinaryIndex(path) as index:
+        yield index
+
+
+def test_round_trip_matches_compact_index(binary):
+    compact = CompactIndex.from_index(INDEX)
+    assert sorted(binary.paths()) == sorted(compact.paths())
+    for path in INDEX["files"]:
+        # Symbol ids may differ; everything else must not
+        assert [symbol[1:] for symbol in binary.symbols_in(path)] == [symbol[1:] for symbol in compact.symbols_in(path)]
+        assert binary.file_hash_of(path) == INDEX["files"][path]["hash"]
+    assert binary.symbol_count == compact.symbol_count
+
+
+def test_find_by_bare_qualified_and_unicode_name(binary):
+    assert {(s.kind, s.file) for s in binary.find("load")} == {("function", "pkg/b.py"), ("method", "pkg/b.py")}
+    assert [s.signature for s in binary.find("Store.load")] == ["Store.load(self)"]
+    assert [s.line for s in binary.find("grüß")] == [2]
+    assert binary.find("load", kind="method")[0].name == "Store.load"
+    assert binary.find("missing") == [] and binary.file_id("missing.py") is None
+
+
+def test_checksum_detects_corruption(tmp_path):
+    path = write_binary(INDEX, tmp_path)
+    with BinaryIndex(path) as index:
+        assert index.verify()
+    data = bytearray(path.read_bytes())
+    data[HEADER.size + 3] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with BinaryIndex(path) as index:
+        assert not index.verify()
+
+
+def test_truncated_and_foreign_files_are_rejected(tmp_path):
+    path = write_binary(INDEX, tmp_path)
+    data = path.read_bytes()
+    path.write_bytes(data[:-1])
+    with pytest.raises(BinaryIndexError):
+        BinaryIndex(path)
+    path.write_bytes(b"NOTANIDX" + data[8:])
+    with pytest.raises(BinaryIndexError):
+        BinaryIndex(path)
+    path.write_bytes(b"")
+    with pytest.raises(BinaryIndexError):
+        BinaryIndex(path)
+
+
+def test_open_index_ignores_a_binary_older_than_the_json(tmp_path):
+    (tmp_path / JSON_NAME).write_text(json.dumps(INDEX))
+    write_binary(INDEX, tmp_path)
+    index = open_index(tmp_path)
+    assert index is not None
+    index.close()
+
+    st = os.stat(tmp_path / JSON_NAME)
+    os.utime(tmp_path / BINARY_NAME, (st.st_atime - 10, st.st_mtime - 10))
+    assert open_index(tmp_path) is None
@@ -0,0 +1,21 @@
+"""Claude Code detection probes"""
+import sys
+import time
+
+from claude_boost import cli
+
+
+def probe(code, **extra):
+    return dict({"cmd": [sys.executable, "-c", code], "marker": "@anthropic-ai/claude-code"}, **extra)
+
+
+def test_probe_with_more_output_than_a_pipe_holds():
+    # Like `npm list -g --depth=0` with many global packages
+    noisy = probe("print('left-pad@1.0.0\\n' * 100000); print('@anthropic-ai/claude-code@1.0.0')", via="npm")
+    started = time.monotonic()
+    assert cli._probe_claude_code([noisy]) == "via npm"
+    assert time.monotonic() - started < cli.PROBE_TIMEOUT_SECONDS
+
+
+def test_failed_probes_report_nothing():
+    assert cli._probe_claude_code([probe("import sys; sys.exit(1)"), probe("print('nothing here')")]) is None
@@ -0,0 +1,40 @@
+"""npx wrapper: probing for Python and caching the command that worked"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+NODE = shutil.which("node")
+CLI_JS = Path(__file__).resolve().parent.parent / "claude_boost" / "cli.js"
+
+pytestmark = pytest.mark.skipif(NODE is None or os.name == "nt", reason="needs node on a POSIX system")
+
+
+def run(tmp_path, cached=None):
+    """Run cli.js where only `python` exists, optionally with a cached command"""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "python").symlink_to(sys.executable)
+    cache = tmp_path / "home" / ".claude-boost" / "python.json"
+    cache.parent.mkdir(parents=True)
+    if cached:
+        cache.write_text(json.dumps({"command": cached}))
+    result = subprocess.run([NODE, str(CLI_JS)], capture_output=True, text=True, timeout=60,
+                            env=dict(os.environ, HOME=str(tmp_path / "home"), PATH=str(bin_dir)))
+    return result, json.loads(cache.read_text())["command"] if cache.exists() else None
+
+
+def test_missing_python3_falls_back_and_caches_python(tmp_path):
+    result, cached = run(tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert cached == "python"
+
+
+def test_stale_cached_command_is_dropped(tmp_path):
+    result, cached = run(tmp_path, cached="python3")
+    assert result.returncode == 0, result.stderr
+    assert cached == "python"
@@ -0,0 +1,51 @@
+"""Dependency index: declared packages only, cache-miss walks, kept across index updates"""
+import pytest
+
+from claude_boost import deps
+
+
+@pytest.fixture
+def project(tmp_path):
+    site = tmp_path / ".venv" / "lib" / "python3.11" / "site-packages"
+    for name in ("requests", "unrelated"):
+        dist_info = site / f"{name}-1.0.dist-info"
+        dist_info.mkdir(parents=True)
+        (dist_info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n\n")
+        (dist_info / "top_level.txt").write_text(f"{name}\n")
+        (site / name).mkdir()
+        (site / name / "__init__.py").write_text("def get(url):\n    pass\n")
+    (tmp_path / "requirements.txt").write_text("requests>=1\n")
+    return tmp_path
+
+
+def test_only_declared_packages_are_indexed(project, tmp_path):
+    result = deps.index_dependencies(project, cache_dir=tmp_path / "cache")
+    assert [ref["name"] for ref in result["packages"]] == ["requests"]
+    assert result["extracted"] == 1
+
+
+def test_cached_packages_are_not_walked(project, tmp_path, monkeypatch):
+    deps.index_dependencies(project, cache_dir=tmp_path / "cache")
+    walked = []
+    real = deps._python_modules
+    monkeypatch.setattr(deps, "_python_modules", lambda site, dist_info: walked.append(dist_info.name) or real(site, dist_info))
+
+    result = deps.index_dependencies(project, cache_dir=tmp_path / "cache")
+    assert result["cached"] == 1 and result["extracted"] == 0
+    assert walked == []
+
+
+def test_updates_keep_the_dependency_references(project, tmp_path, monkeypatch):
+    from claude_boost.indexer import generate_project_index, write_index
+
+    real = deps.index_dependencies
+    monkeypatch.setattr(deps, "index_dependencies", lambda root: real(root, cache_dir=tmp_path / "cache"))
+    (project / "app.py").write_text("import requests\n")
+    write_index(generate_project_index(str(project), dependencies=True), project, binary=False, search=False,
+                graph=False)
+
+    # What the PostToolUse update runs after an edit: no --deps
+    (project / "app.py").write_text("import requests\n\ndef fetch():\n    pass\n")
+    index = generate_project_index(str(project))
+    assert [ref["name"] for ref in index["dependencies"]] == ["requests"]
+    assert index["summary"]["dependencies"]["extracted"] == 1
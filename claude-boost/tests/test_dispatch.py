@@ -0,0 +1,39 @@
+"""Hook dispatcher: output merging and the hook command line"""
+import json
+import sys
+
+from claude_boost.dispatch import hook_command, merge_stdout
+
+
+def merged(*outputs):
+    return json.loads(merge_stdout([json.dumps(output).encode() for output in outputs]))
+
+
+def test_additional_contexts_are_combined():
+    result = merged({"hookSpecificOutput": {"hookEventName": "PreToolUse", "additionalContext": "a"}},
+                    {"hookSpecificOutput": {"additionalContext": "b"}, "systemMessage": "hi"})
+    assert result == {"hookSpecificOutput": {"hookEventName": "PreToolUse", "additionalContext": "a\nb"},
+                      "systemMessage": "hi"}
+
+
+def test_non_object_hook_output_does_not_break_the_merge():
+    result = merged({"hookSpecificOutput": None},
+                    {"hookSpecificOutput": {"additionalContext": "a"}},
+                    {"hookSpecificOutput": {"hookEventName": "SessionStart"}})
+    assert result["hookSpecificOutput"] == {"additionalContext": "a", "hookEventName": "SessionStart"}
+    assert merged({"hookSpecificOutput": {"additionalContext": "a"}},
+                  {"hookSpecificOutput": 3})["hookSpecificOutput"] == {"additionalContext": "a"}
+
+
+def test_plain_text_outputs_are_concatenated():
+    assert merge_stdout([b"one", b"", b"two"]) == "one\ntwo"
+
+
+def test_hooks_go_through_the_host_client_when_installed(tmp_path, monkeypatch):
+    hooks = tmp_path / ".claude" / "hooks"
+    hooks.mkdir(parents=True)
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+    hook = {"script": "duplicates.py", "args": ["--x"]}
+    assert hook_command(hook) == [sys.executable, str(hooks / "duplicates.py"), "--x"]
+    (hooks / "hostc.py").write_text("")
+    assert hook_command(hook) == [sys.executable, str(hooks / "hostc.py"), str(hooks / "duplicates.py"), "--x"]
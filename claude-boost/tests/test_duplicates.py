@@ -0,0 +1,97 @@
+"""Duplicate guard: new definitions are matched by name and shape within the budget"""
+import time
+
+import pytest
+
+from claude_boost.duplicates import BUDGET_MS, guard, name_key, new_definitions, shape
+from claude_boost.search import update_search_index
+
+INDEX = {"files": {
+    "src/config.py": {
+        "functions": [{"name": "load_config", "args": ["path"], "line": 4},
+                      {"name": "fetch_users", "args": ["db"], "line": 20}],
+        "classes": [{"name": "TokenCache", "line": 30, "methods": []}],
+        "hash": "c1", "size": 300, "modified": 1.0,
+    },
+}}
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    update_search_index(INDEX, tmp_path)
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def write(project, path, content):
+    return {"tool_name": "Write", "tool_input": {"file_path": str(project / path), "content": content}}
+
+
+def context(output):
+    return output["hookSpecificOutput"]["additionalContext"] if output else ""
+
+
+def test_keys():
+    assert name_key("loadConfig") == name_key("LoadConfig") == name_key("load_config") == "load_config"
+    assert shape("fetchUsers") == shape("get_user") == shape("user_get")
+    assert shape("parse") is None
+
+
+def test_only_added_definitions_are_checked():
+    edit = {"file_path": "a.py", "old_string": "def kept(a):\n    pass\n",
+            "new_string": "def kept(a):\n    pass\n\ndef added(b):\n    pass\n"}
+    assert [d.name for d in new_definitions("Edit", edit)] == ["added"]
+    assert new_definitions("Write", {"file_path": "notes.txt", "content": "def x(): pass"}) == []
+
+
+def test_tests_are_skipped_but_test_like_names_are_not():
+    content = ("def test_load():\n    pass\nclass TestLoad:\n    pass\n"
+               "def testimony():\n    pass\ndef tester_config():\n    pass\n")
+    names = [d.name for d in new_definitions("Write", {"file_path": "a.py", "content": content})]
+    assert names == ["testimony", "tester_config"]
+
+
+def test_same_name_in_another_style_is_reported(project):
+    output = guard(write(project, "web/app.js", "export function loadConfig(path) {}\n"), started=time.perf_counter())
+    assert "src/config.py:4" in context(output) and "same name, same arity" in context(output)
+    assert output["hookSpecificOutput"]["hookEventName"] == "PreToolUse"
+
+
+def test_synonym_shape_is_reported(project):
+    output = guard(write(project, "src/users.py", "def get_user(db):\n    pass\n"), started=time.perf_counter())
+    assert "fetch_users(db)" in context(output) and "same words" in context(output)
+
+
+def test_classes_match_classes(project):
+    output = guard(write(project, "src/cache.py", "class TokenCache:\n    pass\n"), started=time.perf_counter())
+    assert "TokenCache at src/config.py:30 (same name)" in context(output)
+
+
+def test_the_edited_file_and_unrelated_names_are_silent(project):
+    assert guard(write(project, "src/config.py", "def load_config(path):\n    pass\n"),
+                 started=time.perf_counter()) is None
+    assert guard(write(project, "src/other.py", "def render_invoice(order):\n    pass\n"),
+                 started=time.perf_counter()) is None
+
+
+def test_answers_within_the_budget(project):
+    started = time.perf_counter()
+    guard(write(project, "src/many.py", "".join(f"def get_user_{i}(a):\n    pass\n" for i in range(30))),
+          started=started)
+    assert (time.perf_counter() - started) * 1e3 < BUDGET_MS
+
+
+def test_tight_budget_degrades_to_name_matches(project):
+    payload = write(project, "src/users.py", "def load_config(p):\n    pass\ndef get_user(db):\n    pass\n")
+    # Budget left for the name lookups but under the reserve for shape lookups
+    output = guard(payload, budget_ms=4, started=time.perf_counter())
+    if output is not None:
+        assert "fetch_users" not in context(output)
+        assert "name matches only" in context(output)
+    # No budget at all: silent rather than late
+    assert guard(payload, budget_ms=0, started=time.perf_counter()) is None
+
+
+def test_no_search_database_is_silent(tmp_path, monkeypatch):
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+    assert guard(write(tmp_path, "a.py", "def load_config(path):\n    pass\n"), started=time.perf_counter()) is None
@@ -0,0 +1,89 @@
+"""Symbol search: BM25 ranking and file-by-file updates of the search database"""
+import sqlite3
+
+from claude_boost.search import SEARCH_NAME, search, terms, update_search_index
+
+
+def record(functions, size=100, modified=1.0):
+    return {"functions": functions, "classes": [], "imports": [], "hash": f"h{len(functions)}{size}",
+            "size": size, "modified": modified}
+
+
+def fn(name, args=(), doc=None, line=1):
+    return {"name": name, "args": list(args), "line": line, "doc": doc}
+
+
+INDEX = {"files": {
+    "auth/login.py": record([
+        fn("validate_admin_credentials", ["user", "password"], "Check an admin's password"),
+        fn("log_attempt", ["user"]),
+    ]),
+    "billing/invoice.py": record([
+        fn("render_invoice", ["order"], "Format an invoice as HTML"),
+        fn("validate_order", ["order"]),
+    ], size=200),
+}}
+
+
+def test_terms_split_identifiers_and_stem():
+    assert terms("validateAdminUsers") == terms("validate admin user")
+    assert terms("validates") == terms("validate")
+    assert "the" not in terms("the admin")
+
+
+def test_best_match_ranks_first(tmp_path):
+    update_search_index(INDEX, tmp_path)
+    hits = search(tmp_path, "validate admin credentials")
+    assert hits[0]["name"] == "validate_admin_credentials"
+    assert hits[0]["file"] == "auth/login.py"
+    assert [hit["score"] for hit in hits] == sorted((hit["score"] for hit in hits), reverse=True)
+
+
+def test_docstrings_are_searchable(tmp_path):
+    update_search_index(INDEX, tmp_path)
+    assert search(tmp_path, "html")[0]["name"] == "render_invoice"
+
+
+def test_rare_terms_outweigh_common_ones(tmp_path):
+    update_search_index(INDEX, tmp_path)
+    # "validate" is in two documents, "order" in two, "admin" in one
+    names = [hit["name"] for hit in search(tmp_path, "validate admin")]
+    assert names.index("validate_admin_credentials") < names.index("validate_order")
+
+
+def test_unchanged_files_are_not_rewritten(tmp_path):
+    update_search_index(INDEX, tmp_path)
+    second = update_search_index(INDEX, tmp_path)
+    assert second["updated"] == 0 and second["removed"] == 0
+
+
+def test_changed_and_removed_files_are_updated(tmp_path):
+    update_search_index(INDEX, tmp_path)
+    changed = {"files": {"auth/login.py": record([fn("reset_password", ["user"])], size=120, modified=2.0)}}
+    result = update_search_index(changed, tmp_path)
+    assert result == dict(result, updated=1, removed=1, documents=1)
+    assert search(tmp_path, "validate") == []
+    assert search(tmp_path, "reset password")[0]["name"] == "reset_password"
+
+
+def test_centrality_breaks_ties(tmp_path):
+    index = {"files": {
+        "a.py": record([fn("parse_config", ["path"])]),
+        "b.py": record([fn("parse_config", ["path"])]),
+    }}
+    update_search_index(index, tmp_path, {("b.py", "parse_config"): 20.0})
+    hits = search(tmp_path, "parse config")
+    assert [hit["file"] for hit in hits] == ["b.py", "a.py"]
+    assert hits[0]["centrality"] == 20.0
+
+
+def test_old_schema_is_rebuilt(tmp_path):
+    db = sqlite3.connect(str(tmp_path / SEARCH_NAME))
+    db.executescript("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);"
+                     "INSERT INTO meta VALUES ('version', '2');"
+                     "CREATE TABLE docs (id INTEGER PRIMARY KEY, path TEXT, kind TEXT, name TEXT);"
+                     "CREATE TABLE files (path TEXT PRIMARY KEY, key TEXT);")
+    db.commit()
+    db.close()
+    update_search_index(INDEX, tmp_path)
+    assert search(tmp_path, "invoice")[0]["name"] == "render_invoice"
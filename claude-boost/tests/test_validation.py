@@ -0,0 +1,82 @@
+"""Validation cache: verdicts are reused exactly while every input is unchanged"""
+import os
+import sys
+
+from claude_boost.validation import ValidationCache, changed_inputs, validate
+
+# Appends a line per run so tests can count how often the command ran
+COMMAND = f'"{sys.executable}" -c "open(\'runs.log\', \'a\').write(\'run\\\\n\')"'
+
+
+def runs(root):
+    try:
+        return len((root / "runs.log").read_text().splitlines())
+    except OSError:
+        return 0
+
+
+def project(tmp_path):
+    (tmp_path / "app.py").write_text("def f():\n    return 1\n")
+    (tmp_path / "util.py").write_text("X = 1\n")
+    return ["app.py", "util.py"]
+
+
+def test_unchanged_inputs_reuse_the_verdict(tmp_path):
+    paths = project(tmp_path)
+    first = validate(tmp_path, "task", COMMAND, paths)
+    second = validate(tmp_path, "task", COMMAND, paths)
+    assert first["verdict"] == "passed" and not first["cached"]
+    assert second["cached"] and second["verdict"] == "passed"
+    assert runs(tmp_path) == 1
+
+
+def test_touched_but_identical_file_still_hits(tmp_path):
+    paths = project(tmp_path)
+    validate(tmp_path, "task", COMMAND, paths)
+    st = os.stat(tmp_path / "app.py")
+    os.utime(tmp_path / "app.py", ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+    result = validate(tmp_path, "task", COMMAND, paths)
+    assert result["cached"] and result["changed"] == []
+    assert runs(tmp_path) == 1
+    # The new stat is remembered, so the next lookup does not hash again
+    entry = ValidationCache(tmp_path).get("task", COMMAND)
+    assert entry["files"]["app.py"]["mtime_ns"] == os.stat(tmp_path / "app.py").st_mtime_ns
+
+
+def test_changed_content_reruns(tmp_path):
+    paths = project(tmp_path)
+    validate(tmp_path, "task", COMMAND, paths)
+    (tmp_path / "util.py").write_text("X = 2\n")
+
+    result = validate(tmp_path, "task", COMMAND, paths)
+    assert not result["cached"] and result["changed"] == ["util.py"]
+    assert runs(tmp_path) == 2
+
+
+def test_missing_and_added_inputs_count_as_changed(tmp_path):
+    paths = project(tmp_path)
+    validate(tmp_path, "task", COMMAND, paths)
+    entry = ValidationCache(tmp_path).get("task", COMMAND)
+
+    (tmp_path / "util.py").unlink()
+    (tmp_path / "new.py").write_text("Y = 1\n")
+    changed, current = changed_inputs(tmp_path, entry, ["app.py", "util.py", "new.py"])
+    assert sorted(changed) == ["new.py", "util.py"]
+    assert set(current) == {"app.py", "new.py"}
+
+
+def test_verdicts_are_per_task_and_command(tmp_path):
+    paths = project(tmp_path)
+    validate(tmp_path, "one", COMMAND, paths)
+    assert not validate(tmp_path, "two", COMMAND, paths)["cached"]
+    assert runs(tmp_path) == 2
+
+
+def test_failed_verdict_keeps_evidence(tmp_path):
+    paths = project(tmp_path)
+    command = f'"{sys.executable}" -c "import sys; print(\'boom\'); sys.exit(3)"'
+    validate(tmp_path, "task", command, paths)
+    result = validate(tmp_path, "task", command, paths)
+    assert result["cached"] and result["verdict"] == "failed"
+    assert result["exit_code"] == 3 and "boom" in result["output"]
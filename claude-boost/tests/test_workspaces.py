@@ -0,0 +1,35 @@
+"""Workspace builds: one index per workspace, run the way the CLI runs them"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+CLI = Path(__file__).resolve().parent.parent / "claude_boost" / "cli.py"
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_build_from_cli_script_without_pythonpath(tmp_path):
+    write(tmp_path / "pyproject.toml", '[project]\nname = "root"\n')
+    write(tmp_path / "tools" / "release.py", "def release():\n    pass\n")
+    write(tmp_path / "packages" / "api" / "pyproject.toml", '[project]\nname = "api"\n')
+    write(tmp_path / "packages" / "api" / "api" / "server.py", "def serve():\n    pass\n")
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONPATH"}
+
+    # `python cli.py` (the npx route) makes claude_boost importable through sys.path only
+    result = subprocess.run([sys.executable, str(CLI), "workspaces", "build", "--root", str(tmp_path)],
+                            cwd=str(tmp_path), env=env, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    root_index = json.loads((tmp_path / "PROJECT_INDEX.json").read_text())
+    api_index = json.loads((tmp_path / "packages" / "api" / "PROJECT_INDEX.json").read_text())
+    assert list(root_index["files"]) == ["tools/release.py"]
+    assert list(api_index["files"]) == ["api/server.py"]
+    assert [shard["path"] for shard in root_index["workspaces"]] == ["packages/api"]
+    # Written by the package indexer, not only the JSON
+    assert (tmp_path / "PROJECT_INDEX.bin").exists()
+    assert (tmp_path / "packages" / "api" / "PROJECT_INDEX.search.db").exists()